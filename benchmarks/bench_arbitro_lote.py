@@ -0,0 +1,38 @@
+"""
+Arbitraje por lotes: un millón de dudas y calces hipotéticos con ArbitroRonda.dudar_lote/calzar_lote.
+
+Uso:
+    python -m benchmarks.bench_arbitro_lote
+"""
+import time
+
+import numpy as np
+
+from src.juego.arbitro_ronda import ArbitroRonda
+
+FILAS = 1_000_000
+
+
+def main():
+    rng = np.random.default_rng(0)
+    # Mesas de 4 jugadores con 5 dados: 20 caras por fila
+    caras = rng.integers(1, 7, size=(FILAS, 20))
+    histogramas = np.stack([(caras == cara).sum(axis=1) for cara in range(7)], axis=1)
+    apuestas = np.stack([rng.integers(1, 21, FILAS), rng.integers(1, 7, FILAS)], axis=1)
+    obligado = rng.random(FILAS) < 0.2
+    arbitro = ArbitroRonda()
+
+    inicio = time.perf_counter()
+    arbitro.dudar_lote(histogramas, apuestas, obligado, 1, 0)
+    dudas = time.perf_counter() - inicio
+
+    inicio = time.perf_counter()
+    arbitro.calzar_lote(histogramas, apuestas, obligado, 1)
+    calces = time.perf_counter() - inicio
+
+    print(f"dudar_lote:  {FILAS:,} filas en {dudas * 1000:7.1f} ms")
+    print(f"calzar_lote: {FILAS:,} filas en {calces * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Costo de codificar el conjunto de información en cada decisión y de usar las claves en un dict.
+
+Primero se juegan partidas con JugadorAleatorio codificando la vista en cada decisión;
+luego se llena un dict con `entradas` claves distintas de esas partidas (más claves
+sintéticas si faltan) y se mide memoria y tiempo de búsqueda.
+
+Uso:
+    python -m benchmarks.bench_conjunto_informacion [partidas] [entradas]
+"""
+import sys
+import time
+import tracemalloc
+
+from src.juego.conjunto_informacion import codificar_vista
+from src.juego.jugadores import JugadorAleatorio
+from src.juego.partida_headless import jugar_partida
+from src.servicios.generador_aleatorio import Generador_Aleatorio
+
+
+class Codificando(JugadorAleatorio):
+    """JugadorAleatorio que además codifica la vista antes de decidir."""
+
+    def __init__(self, semilla, tiempos: list, claves: set):
+        super().__init__(semilla)
+        self.tiempos = tiempos
+        self.claves = claves
+
+    def decidir(self, vista, idx_jugador):
+        inicio = time.perf_counter()
+        clave = codificar_vista(vista)
+        self.tiempos.append(time.perf_counter() - inicio)
+        self.claves.add(clave)
+        return super().decidir(vista, idx_jugador)
+
+
+def main():
+    partidas = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    entradas = int(sys.argv[2]) if len(sys.argv) > 2 else 2_000_000
+    tiempos, claves = [], set()
+    for semilla in range(partidas):
+        jugadores = [Codificando(f"{semilla}/{asiento}", tiempos, claves) for asiento in range(4)]
+        jugar_partida(jugadores, Generador_Aleatorio(semilla))
+    tiempos.sort()
+    print(
+        f"codificar: {sum(tiempos) / len(tiempos) * 1e6:.2f} µs promedio, "
+        f"{tiempos[int(len(tiempos) * 0.99)] * 1e6:.2f} µs p99, "
+        f"{len(tiempos):,} decisiones, {len(claves):,} claves distintas"
+    )
+
+    # Claves sintéticas con la misma distribución de bits altos: se desplazan las reales
+    base = sorted(claves)
+    tracemalloc.start()
+    tabla = {}
+    desplazamiento = 0
+    while len(tabla) < entradas:
+        for clave in base:
+            tabla[clave ^ desplazamiento << 40] = 0.5
+            if len(tabla) == entradas:
+                break
+        desplazamiento += 1
+    memoria = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    consultas = list(tabla)[::max(1, len(tabla) // 1_000_000)]
+    inicio = time.perf_counter()
+    for clave in consultas:
+        tabla[clave]
+    segundos = time.perf_counter() - inicio
+    print(
+        f"dict de {len(tabla):,} entradas: {memoria / len(tabla):.0f} bytes por entrada, "
+        f"{segundos / len(consultas) * 1e9:.0f} ns por búsqueda"
+    )
+
+
+if __name__ == "__main__":
+    main()
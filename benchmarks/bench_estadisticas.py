@@ -0,0 +1,45 @@
+"""
+Costo del análisis en flujo: partidas por segundo solo jugando, jugando y agregando, y
+eventos por segundo que consume EstadisticasReglas.
+
+Uso:
+    python -m benchmarks.bench_estadisticas [partidas]
+"""
+import sys
+import time
+import tracemalloc
+
+from src.juego.jugadores import JugadorAleatorio
+from src.servicios.estadisticas import EstadisticasReglas, eventos_simulados
+from src.servicios.liga import jugar_liga
+
+
+def main():
+    partidas = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    fabricas = [JugadorAleatorio] * 4
+
+    solo_juego = jugar_liga(fabricas, partidas, procesos=1)["partidas_por_segundo"]
+
+    inicio = time.perf_counter()
+    estadisticas = EstadisticasReglas().consumir(eventos_simulados(fabricas, partidas))
+    con_analisis = partidas / (time.perf_counter() - inicio)
+
+    # La memoria se mide aparte: tracemalloc hace todo mucho más lento
+    tracemalloc.start()
+    EstadisticasReglas().consumir(eventos_simulados(fabricas, partidas // 10))
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    eventos = list(eventos_simulados(fabricas, partidas // 3))
+    inicio = time.perf_counter()
+    EstadisticasReglas().consumir(eventos)
+    consumo = len(eventos) / (time.perf_counter() - inicio)
+
+    print(f"Solo jugando:      {solo_juego:>10,.0f} partidas/s")
+    print(f"Jugando y agregando:{con_analisis:>9,.0f} partidas/s  (pico de memoria {pico / 1024:,.0f} KiB con {partidas // 10:,} partidas)")
+    print(f"Consumo de eventos: {consumo:>9,.0f} eventos/s")
+    print(estadisticas.resumen())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Tiempo de importación de los módulos que carga un proceso de trabajo sin consola (`-X importtime`).
+
+Cada medición usa un intérprete nuevo; se informa la mediana y el script termina con
+código 1 si supera el presupuesto o si se cargan módulos que un proceso sin consola no
+debe necesitar.
+
+Uso:
+    python -m benchmarks.bench_importacion [presupuesto_ms]
+"""
+import statistics
+import subprocess
+import sys
+
+MODULOS = ("src.juego.partida_headless", "src.juego.jugadores", "src.servicios.torneo")
+PROHIBIDOS = ("src.juego.consola", "typing", "numpy", "concurrent.futures")
+PRESUPUESTO_MS = 35.0
+REPETICIONES = 7
+
+
+def medir() -> tuple:
+    """Devuelve (milisegundos de los módulos de MODULOS, módulos prohibidos que se cargaron)."""
+    salida = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {', '.join(MODULOS)}"],
+        capture_output=True, text=True, check=True,
+    ).stderr
+    microsegundos = 0
+    cargados = set()
+    for linea in salida.splitlines():
+        if not linea.startswith("import time:") or "|" not in linea:
+            continue
+        _, acumulado, nombre = linea.split("|")
+        cargados.add(nombre.strip())
+        # Solo las importaciones de primer nivel, para no contar dos veces las anidadas
+        if nombre.strip() in MODULOS and nombre.startswith(" ") and not nombre.startswith("  "):
+            microsegundos += int(acumulado)
+    return microsegundos / 1000, sorted(cargados.intersection(PROHIBIDOS))
+
+
+def main():
+    presupuesto = float(sys.argv[1]) if len(sys.argv) > 1 else PRESUPUESTO_MS
+    mediciones = [medir() for _ in range(REPETICIONES)]
+    mediana = statistics.median(ms for ms, _ in mediciones)
+    prohibidos = mediciones[0][1]
+    print(f"Importación de {', '.join(MODULOS)}: {mediana:.1f} ms (presupuesto {presupuesto:.1f} ms)")
+    if prohibidos:
+        print(f"Módulos que no deberían cargarse: {', '.join(prohibidos)}")
+    if mediana > presupuesto or prohibidos:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Copias de una partida por segundo: copy.deepcopy contra clonar() e instantanea()/restaurar().
+
+Uso:
+    python -m benchmarks.bench_instantanea
+"""
+import copy
+import timeit
+
+from src.juego.gestor_partida import GestorPartida
+from src.servicios.generador_aleatorio import Generador_Aleatorio
+
+JUGADORES = 6
+
+
+def partida_en_curso() -> GestorPartida:
+    partida = GestorPartida([f"j{i}" for i in range(JUGADORES)], Generador_Aleatorio(semilla=0))
+    partida.determinar_inicial()
+    partida.iniciar_ronda()
+    partida.apostar(0, (3, 4))
+    return partida
+
+
+def por_segundo(funcion, numero: int = 20_000) -> float:
+    return numero / min(timeit.repeat(funcion, number=numero, repeat=3))
+
+
+def main():
+    partida = partida_en_curso()
+    instantanea = partida.instantanea()
+    resultados = {
+        "copy.deepcopy": por_segundo(lambda: copy.deepcopy(partida), 2_000),
+        "clonar": por_segundo(partida.clonar),
+        "instantanea": por_segundo(partida.instantanea),
+        "restaurar": por_segundo(lambda: partida.restaurar(instantanea)),
+    }
+    base = resultados["copy.deepcopy"]
+    for nombre, velocidad in resultados.items():
+        print(f"{nombre:<14} {velocidad:>12,.0f} /s  (x{velocidad / base:.1f})")
+
+
+if __name__ == "__main__":
+    main()
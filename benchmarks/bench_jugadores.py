@@ -0,0 +1,71 @@
+"""
+Latencia de decisión de las estrategias de referencia jugando entre ellas.
+
+Se mide cada llamada a `decidir` (incluida la lectura de la VistaPartida); el script
+termina con código 1 si el promedio de alguna estrategia supera el presupuesto.
+
+Uso:
+    python -m benchmarks.bench_jugadores [partidas] [presupuesto_us]
+"""
+import sys
+import time
+
+from src.juego.jugadores import JugadorAleatorio, JugadorFarol, JugadorUmbral
+from src.juego.partida_headless import jugar_partida
+from src.servicios.generador_aleatorio import Generador_Aleatorio
+
+PRESUPUESTO_US = 100.0
+ESTRATEGIAS = (JugadorAleatorio, JugadorUmbral, JugadorFarol, JugadorUmbral)
+
+
+class Cronometrado:
+    """Envuelve una estrategia y anota la duración de cada decisión."""
+
+    def __init__(self, estrategia, tiempos: list):
+        self.estrategia = estrategia
+        self.tiempos = tiempos
+        for metodo in ("elegir_sentido", "elegir_modo_obligado", "observar"):
+            if hasattr(estrategia, metodo):
+                setattr(self, metodo, getattr(estrategia, metodo))
+
+    def decidir(self, vista, idx_jugador):
+        inicio = time.perf_counter()
+        accion = self.estrategia.decidir(vista, idx_jugador)
+        self.tiempos.append(time.perf_counter() - inicio)
+        return accion
+
+
+def main():
+    partidas = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    presupuesto = float(sys.argv[2]) if len(sys.argv) > 2 else PRESUPUESTO_US
+    tiempos = {clase.__name__: [] for clase in ESTRATEGIAS}
+    victorias = dict.fromkeys(tiempos, 0)
+    for semilla in range(partidas):
+        # Se rotan los asientos para que ninguna estrategia tenga siempre la misma posición
+        clases = ESTRATEGIAS[semilla % 4:] + ESTRATEGIAS[:semilla % 4]
+        jugadores = [
+            Cronometrado(clase(semilla=f"{semilla}/{asiento}"), tiempos[clase.__name__])
+            for asiento, clase in enumerate(clases)
+        ]
+        ganador = jugar_partida(jugadores, Generador_Aleatorio(semilla))["ganador"]
+        victorias[clases[ganador].__name__] += 1
+
+    excedidos = []
+    for nombre, muestras in tiempos.items():
+        muestras.sort()
+        promedio = sum(muestras) / len(muestras) * 1e6
+        p99 = muestras[int(len(muestras) * 0.99)] * 1e6
+        print(
+            f"{nombre:<18} {promedio:>7.1f} µs promedio  {p99:>7.1f} µs p99  "
+            f"{len(muestras):>9,} decisiones  {victorias[nombre] / partidas:>6.1%} de las victorias"
+        )
+        if promedio > presupuesto:
+            excedidos.append(nombre)
+    if excedidos:
+        print(f"Superan el presupuesto de {presupuesto:.0f} µs: {', '.join(excedidos)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
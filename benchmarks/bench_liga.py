@@ -0,0 +1,33 @@
+"""
+Partidas por segundo de la liga en memoria compartida frente al torneo que devuelve totales por lote.
+
+Uso:
+    python -m benchmarks.bench_liga [partidas]
+"""
+import os
+import sys
+import tempfile
+
+from src.juego.jugadores import JugadorAleatorio
+from src.servicios.liga import jugar_liga
+from src.servicios.torneo import jugar_torneo
+
+
+def main():
+    partidas = int(sys.argv[1]) if len(sys.argv) > 1 else 4000
+    fabricas = [JugadorAleatorio] * 4
+    procesos = 1
+    while procesos <= (os.cpu_count() or 1):
+        torneo = jugar_torneo(fabricas, partidas, procesos=procesos, tamano_lote=250)["partidas_por_segundo"]
+        liga = jugar_liga(fabricas, partidas, procesos=procesos)["partidas_por_segundo"]
+        with tempfile.TemporaryDirectory() as directorio:
+            con_control = jugar_liga(fabricas, partidas, procesos=procesos, punto_control=directorio, cada_partidas=500)
+        print(
+            f"{procesos:>3} procesos: torneo {torneo:>8,.0f}  liga {liga:>8,.0f}  "
+            f"liga con puntos de control {con_control['partidas_por_segundo']:>8,.0f} partidas/s"
+        )
+        procesos *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Memoria de 10^5 mesas de cachos: representación anterior (un objeto Dado con
+`valor` y `pinta` por dado) contra la actual (`__slots__` y un bytearray por cacho).
+
+Uso:
+    python -m benchmarks.bench_memoria_cacho
+"""
+import random
+import tracemalloc
+
+from src.juego.cacho import Cacho
+
+MESAS = 100_000
+JUGADORES = 4
+
+
+class DadoAnterior:
+    def __init__(self):
+        self.valor = None
+        self.pinta = None
+
+    def lanzar(self):
+        self.valor = random.randint(1, 6)
+        pintas = {1: "As", 2: "Tonto", 3: "Tren", 4: "Cuadra", 5: "Quina", 6: "Sexto"}
+        self.pinta = pintas[self.valor]
+
+
+class CachoAnterior:
+    def __init__(self):
+        self.dados = [DadoAnterior() for _ in range(5)]
+        self.visible = True
+        self.reserva = 0
+
+    def agitar(self):
+        for dado in self.dados:
+            dado.lanzar()
+
+
+def medir(fabrica) -> int:
+    tracemalloc.start()
+    mesas = []
+    for _ in range(MESAS):
+        cachos = [fabrica() for _ in range(JUGADORES)]
+        for cacho in cachos:
+            cacho.agitar()
+        mesas.append(cachos)
+    actual, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return actual
+
+
+def main():
+    anterior = medir(CachoAnterior)
+    compacto = medir(Cacho)
+    cachos = MESAS * JUGADORES
+    print(f"{MESAS:,} mesas x {JUGADORES} jugadores")
+    print(f"Anterior: {anterior / 2**20:8.1f} MiB ({anterior / cachos:6.0f} B/cacho)")
+    print(f"Compacto: {compacto / 2**20:8.1f} MiB ({compacto / cachos:6.0f} B/cacho)")
+    print(f"Reducción: {anterior / compacto:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Rondas por segundo: GestorPartida (un objeto por dado) contra MotorLote (arreglos NumPy).
+
+Cada ronda consiste en agitar todos los cachos, hacer una apuesta y resolver una duda.
+
+Uso:
+    python -m benchmarks.bench_motor_lote
+"""
+import random
+import time
+
+import numpy as np
+
+from src.juego.gestor_partida import GestorPartida
+from src.juego.motor_lote import MotorLote
+
+JUGADORES = 4
+
+
+def rondas_por_segundo_gestor(rondas: int) -> float:
+    nombres = [f"j{i}" for i in range(JUGADORES)]
+    partida = GestorPartida(nombres)
+    inicio = time.perf_counter()
+    for _ in range(rondas):
+        if partida.hay_ganador():
+            partida = GestorPartida(nombres)
+        partida.iniciar_ronda()
+        partida.apuesta_actual = (random.randint(1, partida.total_dados_en_mesa()), random.randint(2, 6))
+        partida.indice_ultimo_apostador = 0
+        partida.dudar(1)
+    return rondas / (time.perf_counter() - inicio)
+
+
+def rondas_por_segundo_lote(mesas: int, repeticiones: int) -> float:
+    motor = MotorLote(mesas, JUGADORES, semilla=0)
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        motor.reiniciar(motor.hay_ganador())
+        motor.agitar()
+        total = motor.total_dados()
+        apuestas = np.stack([motor.rng.integers(1, total + 1), motor.rng.integers(2, 7, mesas)], axis=1)
+        motor.dudar(apuestas, motor.obligados(), 1, 0)
+    return mesas * repeticiones / (time.perf_counter() - inicio)
+
+
+def iniciales_por_segundo_gestor(partidas: int) -> float:
+    nombres = [f"j{i}" for i in range(JUGADORES)]
+    partida = GestorPartida(nombres)
+    inicio = time.perf_counter()
+    for _ in range(partidas):
+        partida.determinar_inicial()
+    return partidas / (time.perf_counter() - inicio)
+
+
+def iniciales_por_segundo_lote(mesas: int, repeticiones: int) -> float:
+    motor = MotorLote(mesas, JUGADORES, semilla=0)
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        motor.determinar_iniciales()
+    return mesas * repeticiones / (time.perf_counter() - inicio)
+
+
+def main():
+    gestor = rondas_por_segundo_gestor(20_000)
+    lote = rondas_por_segundo_lote(100_000, 20)
+    print(f"GestorPartida: {gestor:>14,.0f} rondas/s")
+    print(f"MotorLote:     {lote:>14,.0f} rondas/s")
+    print(f"Aceleración:   {lote / gestor:>14,.1f}x")
+
+    gestor = iniciales_por_segundo_gestor(50_000)
+    lote = iniciales_por_segundo_lote(100_000, 20)
+    print(f"Quién inicia, GestorPartida: {gestor:>12,.0f} mesas/s")
+    print(f"Quién inicia, MotorLote:     {lote:>12,.0f} mesas/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Costo del registro binario: partidas por segundo sin registro y grabando cada evento.
+
+El costo por evento es fijo, así que su peso relativo depende de cuánto tardan las
+estrategias en decidir: se mide con JugadorAleatorio (casi no calcula, el peor caso) y
+con las estrategias de referencia. La fila "sin escritura" usa un registro que no hace
+nada y muestra el piso: lo que cuesta solo que GestorPartida entregue los eventos.
+
+El objetivo es que grabar cueste menos de PRESUPUESTO; hoy no se cumple (del orden de
+15 % con JugadorAleatorio y 10 % con las de referencia). Un registro que solo agrega
+8 bytes constantes por evento ya cuesta cerca de 5 % con JugadorAleatorio: con un
+método de Python por evento el objetivo no se alcanza sin cambiar el formato.
+
+Uso:
+    python -m benchmarks.bench_registro [partidas]
+"""
+import os
+import sys
+import tempfile
+import time
+
+from src.juego.jugadores import JugadorAleatorio, JugadorFarol, JugadorUmbral
+from src.juego.partida_headless import jugar_partida
+from src.servicios.generador_aleatorio import Generador_Aleatorio
+from src.servicios.registro_partida import RegistroBinario, leer_eventos
+
+PRESUPUESTO = 0.05
+
+MESAS = {
+    "aleatorias": (JugadorAleatorio,) * 4,
+    "de referencia": (JugadorAleatorio, JugadorUmbral, JugadorFarol, JugadorUmbral),
+}
+
+
+class RegistroVacio:
+    """Recibe los eventos sin escribirlos."""
+
+    def inicio(self, *datos):
+        pass
+
+    tiradas = inicial = sentido = ronda = obligado = apuesta = duda = calce = inicio
+
+
+def segundos_por_partida(clases: tuple, partidas: int, registro=None) -> float:
+    inicio = time.perf_counter()
+    for semilla in range(partidas):
+        jugadores = [clase(semilla=f"{semilla}/{asiento}") for asiento, clase in enumerate(clases)]
+        jugar_partida(jugadores, Generador_Aleatorio(semilla), registro)
+    return (time.perf_counter() - inicio) / partidas
+
+
+def main():
+    partidas = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "partidas.dudo")
+        for nombre, clases in MESAS.items():
+            # Se alternan las mediciones y se toma la mejor de cada una para reducir el ruido
+            mejores = {"sin registro": float("inf"), "sin escritura": float("inf"), "con registro": float("inf")}
+            for _ in range(5):
+                mejores["sin registro"] = min(mejores["sin registro"], segundos_por_partida(clases, partidas))
+                mejores["sin escritura"] = min(mejores["sin escritura"], segundos_por_partida(clases, partidas, RegistroVacio()))
+                with RegistroBinario(ruta) as registro:
+                    mejores["con registro"] = min(mejores["con registro"], segundos_por_partida(clases, partidas, registro))
+                os.remove(ruta)
+            base = mejores["sin registro"]
+            print(f"Estrategias {nombre}:")
+            for fila, segundos in mejores.items():
+                print(f"  {fila:<14} {1 / segundos:>8,.0f} partidas/s  (costo {segundos / base - 1:>6.1%}, {(segundos - base) * 1e6:6.1f} µs/partida)")
+            costo = mejores["con registro"] / base - 1
+            print(f"  presupuesto {PRESUPUESTO:.0%}: {'cumplido' if costo < PRESUPUESTO else 'NO cumplido'}")
+
+        with RegistroBinario(ruta) as registro:
+            segundos_por_partida(MESAS["aleatorias"], partidas, registro)
+        inicio = time.perf_counter()
+        eventos = sum(1 for _ in leer_eventos(ruta))
+        lectura = eventos / (time.perf_counter() - inicio)
+        tamano = os.path.getsize(ruta)
+
+    print(f"Registro:      {eventos:>10,} eventos, {tamano / partidas:,.0f} bytes/partida")
+    print(f"Lectura:       {lectura:>10,.0f} eventos/s")
+
+
+if __name__ == "__main__":
+    main()
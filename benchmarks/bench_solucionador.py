@@ -0,0 +1,32 @@
+"""
+Tiempos del solucionador de finales (CFR) para finales pequeños.
+
+Uso:
+    python -m benchmarks.bench_solucionador [iteraciones]
+"""
+import sys
+
+from src.juego.solucionador_final import SolucionadorFinal
+
+FINALES = (
+    ((1, 1), 4),
+    ((2, 1), 4),
+    ((2, 2), 3),
+    ((2, 2), 4),
+    ((1, 1, 1), 4),
+)
+
+
+def main():
+    iteraciones = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    print(f"{'dados':<10} {'apuestas':>8} {'nodos':>7} {'descart':>7} {'segundos':>9} {'ms/iter':>8}  valor")
+    for dados, max_apuestas in FINALES:
+        solucionador = SolucionadorFinal(dados, max_apuestas=max_apuestas)
+        segundos = solucionador.resolver(iteraciones)
+        valor = ", ".join(f"{v:+.3f}" for v in solucionador.valor())
+        print(f"{'v'.join(map(str, dados)):<10} {max_apuestas:>8} {len(solucionador.tabla):>7} {solucionador.descartados:>7} "
+              f"{segundos:>9.2f} {segundos / iteraciones * 1000:>8.1f}  {valor}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""
+Latencia de búsqueda y arranque de procesos con una tabla de estrategia mapeada en memoria.
+
+Construye una tabla de `entradas` claves al azar de 64 bits con dos columnas y compara:
+
+    - búsqueda en TablaEstrategia (claves presentes y ausentes) contra un dict en memoria;
+    - arranque de un proceso de trabajo que abre la tabla (mmap) contra uno que carga el
+      mismo dict desde un pickle, medido dentro de cada proceso.
+
+Uso:
+    python -m benchmarks.bench_tabla_estrategia [entradas] [procesos]
+"""
+import os
+import pickle
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from src.servicios.tabla_estrategia import TablaEstrategia, construir_tabla
+
+
+def _abrir_tabla(ruta: str, consultas: list) -> tuple:
+    inicio = time.perf_counter()
+    tabla = TablaEstrategia(ruta)
+    apertura = time.perf_counter() - inicio
+    for clave in consultas:
+        tabla.buscar(clave)
+    total = time.perf_counter() - inicio
+    tabla.cerrar()
+    return apertura, total
+
+
+def _cargar_dict(ruta: str, consultas: list) -> tuple:
+    inicio = time.perf_counter()
+    with open(ruta, "rb") as archivo:
+        tabla = pickle.load(archivo)
+    apertura = time.perf_counter() - inicio
+    for clave in consultas:
+        tabla.get(clave)
+    return apertura, time.perf_counter() - inicio
+
+
+def _medir_busquedas(buscar, claves: list) -> float:
+    inicio = time.perf_counter()
+    for clave in claves:
+        buscar(clave)
+    return (time.perf_counter() - inicio) / len(claves) * 1e9
+
+
+def main():
+    entradas = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000_000
+    procesos = int(sys.argv[2]) if len(sys.argv) > 2 else (os.cpu_count() or 1)
+    rng = random.Random(0)
+    valores = {rng.getrandbits(64): (rng.random(), rng.random()) for _ in range(entradas)}
+    presentes = rng.sample(list(valores), min(200_000, entradas))
+    ausentes = [rng.getrandbits(64) for _ in range(len(presentes))]
+
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta_tabla = os.path.join(directorio, "tabla.bin")
+        ruta_pickle = os.path.join(directorio, "tabla.pickle")
+        inicio = time.perf_counter()
+        construir_tabla(ruta_tabla, valores, columnas=2)
+        construccion = time.perf_counter() - inicio
+        with open(ruta_pickle, "wb") as archivo:
+            pickle.dump(valores, archivo, protocol=pickle.HIGHEST_PROTOCOL)
+        print(
+            f"tabla de {entradas:,} entradas: {os.path.getsize(ruta_tabla) / 2**20:.1f} MiB en disco, "
+            f"construida en {construccion:.2f} s (pickle del dict: {os.path.getsize(ruta_pickle) / 2**20:.1f} MiB)"
+        )
+
+        with TablaEstrategia(ruta_tabla) as tabla:
+            print(f"buscar presente: {_medir_busquedas(tabla.buscar, presentes):6.0f} ns  (dict {_medir_busquedas(valores.get, presentes):.0f} ns)")
+            print(f"buscar ausente:  {_medir_busquedas(tabla.buscar, ausentes):6.0f} ns  (dict {_medir_busquedas(valores.get, ausentes):.0f} ns)")
+
+        # Cada proceso abre la tabla y hace mil búsquedas, como una estrategia al empezar a jugar
+        consultas = presentes[:1000]
+        for nombre, funcion, ruta in (("mmap", _abrir_tabla, ruta_tabla), ("pickle", _cargar_dict, ruta_pickle)):
+            with ProcessPoolExecutor(max_workers=procesos) as pool:
+                tiempos = list(pool.map(funcion, [ruta] * procesos, [consultas] * procesos))
+            apertura = max(t[0] for t in tiempos) * 1e3
+            total = max(t[1] for t in tiempos) * 1e3
+            print(f"arranque {nombre:<6} en {procesos} procesos: abrir {apertura:9.2f} ms, abrir y 1000 búsquedas {total:9.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+"""
+Partidas por segundo del torneo según la cantidad de procesos.
+
+Uso:
+    python -m benchmarks.bench_torneo [partidas]
+"""
+import os
+import sys
+
+from src.juego.jugadores import JugadorAleatorio
+from src.servicios.torneo import jugar_torneo
+
+
+def main():
+    partidas = int(sys.argv[1]) if len(sys.argv) > 1 else 4000
+    base = None
+    procesos = 1
+    while procesos <= (os.cpu_count() or 1):
+        resultado = jugar_torneo([JugadorAleatorio] * 4, partidas, procesos=procesos, tamano_lote=250)
+        velocidad = resultado["partidas_por_segundo"]
+        base = base or velocidad
+        print(f"{procesos:>3} procesos: {velocidad:>10,.0f} partidas/s  (x{velocidad / base:.2f})")
+        procesos *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,35 @@
+"""
+Costo de un turno (siguiente_jugador + hay_ganador) en una mesa de 50 asientos a medida que se eliminan jugadores.
+
+Uso:
+    python -m benchmarks.bench_turnos
+"""
+import random
+import timeit
+
+from src.juego.gestor_partida import GestorPartida
+
+ASIENTOS = 50
+
+
+def main():
+    partida = GestorPartida([f"j{i}" for i in range(ASIENTOS)])
+    eliminados = iter(random.Random(0).sample(range(ASIENTOS), ASIENTOS))
+    for activos in (50, 25, 10, 2):
+        while len(partida.activos) > activos:
+            cacho = partida.cachos[next(eliminados)]
+            while cacho.cantidad_dados():
+                cacho.quitar_dado()
+        actual = partida.activos[0]
+
+        def turno():
+            nonlocal actual
+            actual = partida.siguiente_jugador(actual)
+            partida.hay_ganador()
+
+        segundos = min(timeit.repeat(turno, number=20_000, repeat=3)) / 20_000
+        print(f"{len(partida.activos):>3} activos: {segundos * 1e6:7.2f} us/turno")
+
+
+if __name__ == "__main__":
+    main()
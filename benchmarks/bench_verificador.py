@@ -0,0 +1,42 @@
+"""
+Velocidad del verificador de corpus: graba partidas en un corpus .gz y las rehace.
+
+Uso:
+    python -m benchmarks.bench_verificador [partidas]
+"""
+import os
+import sys
+import tempfile
+
+from src.juego.jugadores import JugadorAleatorio
+from src.juego.partida_headless import jugar_partida
+from src.servicios.generador_aleatorio import Generador_Aleatorio
+from src.servicios.registro_partida import RegistroBinario
+from src.servicios.verificador_corpus import verificar_corpus
+
+
+def main():
+    partidas = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "corpus.dudo.gz")
+        with RegistroBinario(ruta) as registro:
+            for semilla in range(partidas):
+                jugadores = [JugadorAleatorio(semilla=f"{semilla}/{asiento}") for asiento in range(4)]
+                jugar_partida(jugadores, Generador_Aleatorio(semilla), registro)
+        print(f"Corpus: {partidas:,} partidas, {os.path.getsize(ruta) / partidas:,.0f} bytes/partida comprimido")
+
+        procesos = 1
+        while procesos <= (os.cpu_count() or 1):
+            resultado = verificar_corpus(ruta, procesos=procesos)
+            assert not resultado["fallas"], resultado["fallas"][:5]
+            velocidad = resultado["partidas_por_segundo"]
+            print(
+                f"{procesos:>3} procesos: {velocidad:>10,.0f} partidas/s, "
+                f"{resultado['eventos'] / resultado['segundos']:>12,.0f} eventos/s  "
+                f"(1 millón de partidas en {1e6 / velocidad / 60:.1f} min)"
+            )
+            procesos *= 2
+
+
+if __name__ == "__main__":
+    main()
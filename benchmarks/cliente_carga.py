@@ -0,0 +1,91 @@
+"""
+Generador de carga local para el servidor de mesas (src/servicios/servidor.py).
+
+Crea mesas inactivas para medir memoria y luego juega partidas completas desde
+varias conexiones concurrentes para medir pedidos por segundo. Sin --puerto ni
+--unix levanta un servidor en el mismo proceso.
+
+Uso:
+    python -m benchmarks.cliente_carga --inactivas 10000 --conexiones 50 --partidas 20
+"""
+import argparse
+import asyncio
+import json
+import time
+
+from src.servicios.servidor import ServidorDudo
+
+
+class Cliente:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+        self.pedidos = 0
+
+    async def pedir(self, mensaje: dict) -> dict:
+        self.writer.write(json.dumps(mensaje).encode() + b"\n")
+        await self.writer.drain()
+        self.pedidos += 1
+        return json.loads(await self.reader.readline())
+
+
+async def _conectar(argumentos) -> Cliente:
+    if argumentos.unix:
+        return Cliente(*await asyncio.open_unix_connection(argumentos.unix))
+    return Cliente(*await asyncio.open_connection(argumentos.host, argumentos.puerto))
+
+
+async def jugar(cliente: Cliente, partidas: int) -> None:
+    # Estrategia mínima: abre con un Tonto y el siguiente duda
+    for _ in range(partidas):
+        mesa = await cliente.pedir({"accion": "crear_mesa", "jugadores": ["A", "B", "C"]})
+        turno = mesa["turno"]
+        while True:
+            respuesta = await cliente.pedir({"accion": "apostar", "mesa": mesa["mesa"], "jugador": turno, "apuesta": [1, 2]})
+            respuesta = await cliente.pedir({"accion": "dudar", "mesa": mesa["mesa"], "jugador": respuesta["turno"]})
+            if "ganador" in respuesta:
+                break
+            turno = respuesta["turno"]
+
+
+async def principal(argumentos) -> None:
+    servidor = None
+    if argumentos.puerto is None and argumentos.unix is None:
+        servidor = await ServidorDudo().iniciar(puerto=0)
+        argumentos.host, argumentos.puerto = servidor.sockets[0].getsockname()[:2]
+
+    cliente = await _conectar(argumentos)
+    inicio = time.perf_counter()
+    antes = await cliente.pedir({"accion": "info"})
+    for _ in range(argumentos.inactivas):
+        await cliente.pedir({"accion": "crear_mesa", "jugadores": ["A", "B", "C", "D"]})
+    despues = await cliente.pedir({"accion": "info"})
+    print(f"{argumentos.inactivas:,} mesas inactivas en {time.perf_counter() - inicio:.2f} s; "
+          f"memoria máxima del servidor {antes['memoria_max_kib'] / 1024:.1f} -> {despues['memoria_max_kib'] / 1024:.1f} MiB")
+
+    clientes = [await _conectar(argumentos) for _ in range(argumentos.conexiones)]
+    inicio = time.perf_counter()
+    await asyncio.gather(*(jugar(c, argumentos.partidas) for c in clientes))
+    segundos = time.perf_counter() - inicio
+    pedidos = sum(c.pedidos for c in clientes)
+    print(f"{argumentos.conexiones} conexiones x {argumentos.partidas} partidas: "
+          f"{pedidos:,} pedidos en {segundos:.2f} s ({pedidos / segundos:,.0f} pedidos/s)")
+
+    for c in [cliente, *clientes]:
+        c.writer.close()
+        await c.writer.wait_closed()
+    await asyncio.sleep(0.1)  # deja que el servidor vea el cierre de cada conexión
+    if servidor is not None:
+        servidor.close()
+        await servidor.wait_closed()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=None)
+    parser.add_argument("--unix", default=None)
+    parser.add_argument("--inactivas", type=int, default=10_000)
+    parser.add_argument("--conexiones", type=int, default=50)
+    parser.add_argument("--partidas", type=int, default=20)
+    asyncio.run(principal(parser.parse_args()))
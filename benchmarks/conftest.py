@@ -0,0 +1,43 @@
+"""
+Fixtures de la suite de rendimiento (pytest-benchmark).
+
+Las mesas se arman con semilla fija para que cada medición recorra siempre los mismos dados.
+"""
+import pytest
+
+from src.juego.gestor_partida import GestorPartida
+from src.servicios.generador_aleatorio import Generador_Aleatorio
+
+JUGADORES = (2, 6, 12)
+DADOS = (1, 3, 5)
+SEMILLA = 2024
+
+
+def crear_partida(jugadores: int, dados: int) -> GestorPartida:
+    """Partida con `jugadores` cachos de `dados` dados cada uno, ya agitados."""
+    partida = GestorPartida([f"j{i}" for i in range(jugadores)], Generador_Aleatorio(SEMILLA))
+    for cacho in partida.cachos:
+        for _ in range(5 - dados):
+            cacho.quitar_dado()
+    partida.iniciar_ronda()
+    return partida
+
+
+@pytest.fixture(params=JUGADORES, ids=lambda n: f"{n}j")
+def jugadores(request):
+    return request.param
+
+
+@pytest.fixture(params=DADOS, ids=lambda n: f"{n}d")
+def dados(request):
+    return request.param
+
+
+@pytest.fixture
+def generador():
+    return Generador_Aleatorio(SEMILLA)
+
+
+@pytest.fixture
+def partida(jugadores, dados):
+    return crear_partida(jugadores, dados)
@@ -0,0 +1,53 @@
+"""
+Suite de rendimiento de src/juego con referencia guardada en JSON.
+
+Uso:
+    python -m benchmarks.rendimiento guardar             # mide y guarda una nueva referencia
+    python -m benchmarks.rendimiento comparar [--umbral 25]
+
+`comparar` mide de nuevo y falla (código de salida distinto de 0) si el tiempo mínimo de
+alguna ruta crítica empeora más que el umbral, en porcentaje, respecto a la última
+referencia guardada. Las referencias quedan en benchmarks/referencia/<máquina>/.
+"""
+import argparse
+import os
+import sys
+
+import pytest
+from pytest_benchmark.session import PerformanceRegression
+
+DIRECTORIO = os.path.dirname(os.path.abspath(__file__))
+REFERENCIA = os.path.join(DIRECTORIO, "referencia")
+
+
+def argumentos_pytest(modo: str, umbral: float, extra=()) -> list:
+    argumentos = [
+        os.path.join(DIRECTORIO, "test_rendimiento_juego.py"),
+        "-q",
+        "-p", "no:cacheprovider",
+        "--benchmark-only",
+        f"--benchmark-storage=file://{REFERENCIA}",
+        "--benchmark-sort=fullname",
+        "--benchmark-columns=min,mean,stddev,rounds",
+    ]
+    if modo == "guardar":
+        argumentos.append("--benchmark-save=referencia")
+    else:
+        argumentos += ["--benchmark-compare", f"--benchmark-compare-fail=min:{umbral:g}%"]
+    return argumentos + list(extra)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description="Suite de rendimiento de src/juego")
+    parser.add_argument("modo", choices=("guardar", "comparar"))
+    parser.add_argument("--umbral", type=float, default=25.0, help="Empeoramiento máximo del tiempo mínimo, en %%")
+    argumentos, extra = parser.parse_known_args(argv)
+    try:
+        return pytest.main(argumentos_pytest(argumentos.modo, argumentos.umbral, extra))
+    except PerformanceRegression:
+        # pytest-benchmark ya listó las rutas que empeoraron
+        return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
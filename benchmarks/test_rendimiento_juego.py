@@ -0,0 +1,76 @@
+"""
+Rutas críticas de src/juego medidas con pytest-benchmark.
+
+No forman parte de `pytest` (testpaths = tests); se ejecutan y comparan con
+`python -m benchmarks.rendimiento` (ver ese módulo).
+"""
+from src.juego.arbitro_ronda import ArbitroRonda
+from src.juego.cacho import Cacho
+from src.juego.contador_pintas import ContadorPintas
+from src.juego.jugadores import JugadorAleatorio
+from src.juego.partida_headless import jugar_partida
+from src.juego.validador_apuesta import ValidadorApuesta
+
+# Apuestas sucesivas de una ronda típica, incluidas algunas inválidas
+APUESTAS = [(None, (2, 3)), ((2, 3), (3, 3)), ((3, 3), (2, 1)), ((2, 1), (5, 4)), ((5, 4), (4, 4)), ((5, 4), (6, 6))]
+
+
+def test_contar_pinta(benchmark, partida):
+    todos = [dado for cacho in partida.cachos for dado in cacho.get_dados()]
+    contador = ContadorPintas()
+    benchmark(contador.contar_pinta, todos, 4, False)
+
+
+def test_validar_apuesta(benchmark, dados):
+    validador = ValidadorApuesta()
+
+    def validar():
+        for actual, nueva in APUESTAS:
+            validador.validar_apuesta(actual, nueva, dados, False)
+
+    benchmark(validar)
+
+
+def test_dudar(benchmark, partida):
+    arbitro = ArbitroRonda()
+    instantanea = partida.instantanea()
+    apuesta = (partida.total_dados_en_mesa() // 3 + 1, 4)
+    # Dudar quita un dado: se restaura la mesa antes de cada medición
+    benchmark.pedantic(
+        arbitro.dudar,
+        args=(partida.cachos, apuesta, False, 1, 0, partida.mesa),
+        setup=lambda: partida.restaurar(instantanea),
+        rounds=20000,
+    )
+
+
+def test_calzar(benchmark, partida):
+    arbitro = ArbitroRonda()
+    instantanea = partida.instantanea()
+    apuesta = (partida.total_dados_en_mesa() // 3 + 1, 4)
+    benchmark.pedantic(
+        arbitro.calzar,
+        args=(partida.cachos, apuesta, False, 1, partida.mesa),
+        setup=lambda: partida.restaurar(instantanea),
+        rounds=20000,
+    )
+
+
+def test_validar_calzar(benchmark, partida):
+    benchmark(ArbitroRonda().validar_calzar, partida.cachos, 1, partida.mesa)
+
+
+def test_agitar(benchmark, dados, generador):
+    cacho = Cacho(generador)
+    for _ in range(5 - dados):
+        cacho.quitar_dado()
+    benchmark(cacho.agitar)
+
+
+def test_partida_completa(benchmark, jugadores, generador):
+    def jugar():
+        estrategias = [JugadorAleatorio(semilla=asiento) for asiento in range(jugadores)]
+        generador.sembrar(generador.semilla)
+        return jugar_partida(estrategias, generador)
+
+    benchmark(jugar)
@@ -0,0 +1,46 @@
+"""
+Lógica del juego del Dudo.
+
+Los nombres públicos se importan al usarlos por primera vez (PEP 562), así
+`import src.juego` no carga NumPy, la consola ni módulos que el proceso no use.
+"""
+
+_EXPORTADOS = {
+    "AnilloAsientos": "src.juego.anillo_asientos",
+    "ArbitroRonda": "src.juego.arbitro_ronda",
+    "Cacho": "src.juego.cacho",
+    "ContadorPintas": "src.juego.contador_pintas",
+    "Dado": "src.juego.dado",
+    "GestorPartida": "src.juego.gestor_partida",
+    "Jugador": "src.juego.jugadores",
+    "JugadorAleatorio": "src.juego.jugadores",
+    "JugadorFarol": "src.juego.jugadores",
+    "JugadorUmbral": "src.juego.jugadores",
+    "Mesa": "src.juego.mesa",
+    "ModeloRivales": "src.juego.modelo_rivales",
+    "MotorLote": "src.juego.motor_lote",
+    "ProbabilidadRonda": "src.juego.probabilidad_ronda",
+    "SolucionadorFinal": "src.juego.solucionador_final",
+    "ValidadorApuesta": "src.juego.validador_apuesta",
+    "codificar_informacion": "src.juego.conjunto_informacion",
+    "decodificar_informacion": "src.juego.conjunto_informacion",
+    "VistaPartida": "src.juego.vista_partida",
+    "jugar_partida": "src.juego.partida_headless",
+}
+
+__all__ = sorted(_EXPORTADOS)
+
+
+def __getattr__(nombre):
+    modulo = _EXPORTADOS.get(nombre)
+    if modulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nombre!r}")
+    import importlib
+
+    valor = getattr(importlib.import_module(modulo), nombre)
+    globals()[nombre] = valor
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
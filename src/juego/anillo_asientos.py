@@ -0,0 +1,104 @@
+class AnilloAsientos:
+    """
+    Orden circular de los asientos con dados, como lista doblemente enlazada sobre índices.
+
+    `siguiente` avanza hacia el asiento de índice mayor (sentido "derecha") y
+    `anterior` hacia el de índice menor. Los enlaces de todos los asientos, también
+    los eliminados, apuntan siempre al próximo asiento activo en cada sentido, así
+    que avanzar un turno es leer una posición de `enlaces(...)`. Los enlaces solo se
+    reescriben al quitar o insertar un asiento, y solo los del tramo de asientos
+    eliminados que rodea al que cambió.
+    """
+
+    __slots__ = ("_siguiente", "_anterior", "_presente", "_cantidad", "primero")
+
+    def __init__(self, asientos: int):
+        self._siguiente = list(range(1, asientos)) + [0]
+        self._anterior = [asientos - 1] + list(range(asientos - 1))
+        self._presente = bytearray(b"\x01") * asientos
+        self._cantidad = asientos
+        # Asiento activo de menor índice (None si no queda ninguno)
+        self.primero = 0 if asientos else None
+
+    def __len__(self) -> int:
+        return self._cantidad
+
+    def __contains__(self, asiento: int) -> bool:
+        return bool(self._presente[asiento])
+
+    def __iter__(self):
+        """Recorre los asientos activos en orden de índice."""
+        asiento = self.primero
+        for _ in range(self._cantidad):
+            yield asiento
+            asiento = self._siguiente[asiento]
+
+    def enlaces(self, derecha: bool = True) -> list:
+        """
+        Lista con el próximo asiento activo de cada asiento en un sentido (no se debe modificar).
+
+        Es la misma lista que usa el anillo, así que sigue al día después de quitar
+        o insertar asientos; solo deja de tener sentido si no queda ningún asiento.
+        """
+        return self._siguiente if derecha else self._anterior
+
+    def siguiente(self, asiento: int) -> int:
+        """Próximo asiento activo hacia la derecha; `asiento` puede estar eliminado."""
+        if not self._cantidad:
+            raise ValueError("No quedan asientos activos")
+        return self._siguiente[asiento]
+
+    def anterior(self, asiento: int) -> int:
+        """Próximo asiento activo hacia la izquierda; `asiento` puede estar eliminado."""
+        if not self._cantidad:
+            raise ValueError("No quedan asientos activos")
+        return self._anterior[asiento]
+
+    def quitar(self, asiento: int) -> None:
+        if not self._presente[asiento]:
+            return
+        self._presente[asiento] = 0
+        self._cantidad -= 1
+        if not self._cantidad:
+            self.primero = None
+            return
+        anterior, siguiente = self._anterior[asiento], self._siguiente[asiento]
+        self._siguiente[anterior] = siguiente
+        self._anterior[siguiente] = anterior
+        # Los asientos entre `anterior` y `siguiente` (todos eliminados ahora) apuntan a ellos
+        n = len(self._presente)
+        i = (anterior + 1) % n
+        while i != siguiente:
+            self._siguiente[i] = siguiente
+            self._anterior[i] = anterior
+            i = (i + 1) % n
+        if self.primero == asiento:
+            self.primero = siguiente
+
+    def insertar(self, asiento: int) -> None:
+        """Vuelve a poner un asiento eliminado entre sus vecinos activos (no ocurre durante una partida normal)."""
+        if self._presente[asiento]:
+            return
+        n = len(self._presente)
+        if self._cantidad == 0:
+            self._siguiente[:] = [asiento] * n
+            self._anterior[:] = [asiento] * n
+        else:
+            anterior, siguiente = self._anterior[asiento], self._siguiente[asiento]
+            i = (anterior + 1) % n
+            while i != siguiente:
+                if i != asiento:
+                    # Antes de `asiento` el próximo hacia la derecha pasa a ser él; después, hacia la izquierda
+                    if (i - anterior) % n < (asiento - anterior) % n:
+                        self._siguiente[i] = asiento
+                    else:
+                        self._anterior[i] = asiento
+                i = (i + 1) % n
+            self._siguiente[anterior] = asiento
+            self._anterior[siguiente] = asiento
+            self._siguiente[asiento] = siguiente
+            self._anterior[asiento] = anterior
+        self._presente[asiento] = 1
+        self._cantidad += 1
+        if self.primero is None or asiento < self.primero:
+            self.primero = asiento
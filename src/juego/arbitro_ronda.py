@@ -1,16 +1,21 @@
-from src.juego.cacho import Cacho
 from src.juego.contador_pintas import ContadorPintas
 
 
 class ArbitroRonda:
-    def dudar(self, cachos, apuesta_actual, obligado, indice_dudo, indice_apuesta):
-        contador_apariciones = 0
+    def _contar_apariciones(self, cachos, pinta, obligado, mesa):
         contador_pintas = ContadorPintas()
+        # Con la mesa el conteo es una consulta a su histograma; si no, se suma el histograma de cada cacho
+        if mesa is not None:
+            return contador_pintas.contar_en_histograma(mesa.histograma, pinta, obligado)
+        return sum(
+            contador_pintas.contar_en_histograma(cacho.get_histograma(), pinta, obligado)
+            for cacho in cachos
+        )
+
+    def dudar(self, cachos, apuesta_actual, obligado, indice_dudo, indice_apuesta, mesa=None):
         # apuesta_apariciones contiene el numero especulado que hizo de la cantidad de dados de la pinta: pinta_actual
         apuesta_apariciones, pinta_actual = apuesta_actual
-        for cacho in cachos:
-            dados = cacho.get_dados()
-            contador_apariciones += contador_pintas.contar_pinta(dados, pinta_actual, obligado)
+        contador_apariciones = self._contar_apariciones(cachos, pinta_actual, obligado, mesa)
         if apuesta_apariciones > contador_apariciones:
             #Quitar dado a quien efectuo la apuesta
             cachos[indice_apuesta].quitar_dado()
@@ -20,14 +25,10 @@ class ArbitroRonda:
             cachos[indice_dudo].quitar_dado()
             return False
 
-    def calzar(self, cachos, apuesta_actual, obligado, indice_calzo):
-        contador_pintas = ContadorPintas()
+    def calzar(self, cachos, apuesta_actual, obligado, indice_calzo, mesa=None):
         apuesta_apariciones, pinta_actual = apuesta_actual
         # cantidad de apariciones real de la pinta
-        contador_apariciones = sum(
-            contador_pintas.contar_pinta(cacho.get_dados(), pinta_actual, obligado)
-            for cacho in cachos
-        )
+        contador_apariciones = self._contar_apariciones(cachos, pinta_actual, obligado, mesa)
         if apuesta_apariciones == contador_apariciones:
             cachos[indice_calzo].añadir_dado()
             return True
@@ -35,15 +36,77 @@ class ArbitroRonda:
             cachos[indice_calzo].quitar_dado()
             return False
 
-    def validar_calzar(self, cachos, indice_calzo):
-        cantidad_dados=0
-        for cacho in cachos:
-            dados = cacho.get_dados()
-            cantidad_dados += len(dados)
+    def validar_calzar(self, cachos, indice_calzo, mesa=None):
+        # La mesa lleva el total de dados al día; sin ella se suman los cachos
+        if mesa is not None:
+            cantidad_dados = mesa.total_dados
+        else:
+            cantidad_dados = 0
+            for cacho in cachos:
+                cantidad_dados += cacho.cantidad_dados()
 
         if cantidad_dados >= len(cachos)*5/2:
             return True
-        elif len(cachos[indice_calzo].get_dados()) == 1:
+        elif cachos[indice_calzo].cantidad_dados() == 1:
             return True
         else:
-            return False
\ No newline at end of file
+            return False
+
+    # ---------------------------------------------------------------------
+    # Arbitraje por lotes (NumPy): muchas situaciones hipotéticas sin crear cachos
+    # ---------------------------------------------------------------------
+    def _contar_lote(self, histogramas, apuestas, obligado):
+        import numpy as np
+
+        histogramas = np.asarray(histogramas)
+        apuestas = np.asarray(apuestas)
+        if histogramas.ndim != 2 or histogramas.shape[1] != 7:
+            raise ValueError("histogramas debe tener forma (M, 7), con la columna k = dados que muestran k")
+        pintas = apuestas[:, 1]
+        filas = np.arange(len(histogramas))
+        apariciones = histogramas[filas, pintas].astype(np.int64)
+        # Mismas reglas que contar_en_histograma: los ases suman salvo en obligado o si se apuesta a ases
+        comodin = ~np.asarray(obligado, dtype=bool) & (pintas != 1)
+        apariciones += histogramas[:, 1] * comodin
+        return apuestas[:, 0], apariciones
+
+    def dudar_lote(self, histogramas, apuestas, obligado, indice_dudo, indice_apuesta):
+        """
+        Resuelve muchas dudas a la vez con las mismas reglas que `dudar`, sin modificar cachos.
+
+        Args:
+            - histogramas (np.ndarray): Arreglo (M, 7); histogramas[i, k] es la cantidad de dados que muestran k en la mesa i.
+            - apuestas (np.ndarray): Arreglo (M, 2) con (apariciones, pinta).
+            - obligado (bool | np.ndarray): Si la ronda es obligada, por fila o común a todas.
+            - indice_dudo (int | np.ndarray): Jugador que duda.
+            - indice_apuesta (int | np.ndarray): Jugador que hizo la apuesta.
+
+        Returns:
+            - tuple[np.ndarray, np.ndarray]: (resultado, perdedor). resultado es True donde la duda fue
+              correcta; perdedor es el índice del jugador que pierde un dado en cada fila.
+        """
+        import numpy as np
+
+        apuestas_apariciones, apariciones = self._contar_lote(histogramas, apuestas, obligado)
+        resultado = apuestas_apariciones > apariciones
+        return resultado, np.where(resultado, indice_apuesta, indice_dudo)
+
+    def calzar_lote(self, histogramas, apuestas, obligado, indice_calzo):
+        """
+        Resuelve muchos calces a la vez con las mismas reglas que `calzar`, sin modificar cachos.
+
+        Args:
+            - histogramas (np.ndarray): Arreglo (M, 7) de caras, como en `dudar_lote`.
+            - apuestas (np.ndarray): Arreglo (M, 2) con (apariciones, pinta).
+            - obligado (bool | np.ndarray): Si la ronda es obligada, por fila o común a todas.
+            - indice_calzo (int | np.ndarray): Jugador que calza.
+
+        Returns:
+            - tuple[np.ndarray, np.ndarray]: (resultado, perdedor). resultado es True donde el calce fue
+              exacto (quien calza gana un dado); perdedor es quien calzó donde falló y -1 donde acertó.
+        """
+        import numpy as np
+
+        apuestas_apariciones, apariciones = self._contar_lote(histogramas, apuestas, obligado)
+        resultado = apuestas_apariciones == apariciones
+        return resultado, np.where(resultado, -1, indice_calzo)
@@ -1,33 +1,92 @@
-from src.juego.dado import Dado
+from src.juego.dado import DadoVista, PINTAS
+from src.servicios.generador_aleatorio import generador_por_defecto
 
 class Cacho:
-    def __init__(self):
-        self.dados = [Dado() for i in range(5)]
+    # Los valores de los dados se guardan empaquetados, un byte por dado (0 = sin lanzar),
+    # junto a un histograma de caras que se mantiene al agitar, añadir y quitar dados
+    __slots__ = ("_valores", "_histograma", "_mesa", "_asiento", "visible", "_reserva", "generador")
+
+    def __init__(self, generador=None):
+        self.generador = generador if generador is not None else generador_por_defecto
+        self._valores = bytearray(5)
+        self._histograma = bytearray([5, 0, 0, 0, 0, 0, 0])
+        self._mesa = None
+        self._asiento = None
         self.visible = True
         #Dados reservados
-        self.reserva = 0
+        self._reserva = 0
 
 
     def agitar(self):
-        for dado in self.dados:
-            dado.lanzar()
+        #Se lanzan todos los dados con una sola llamada al generador
+        self._reemplazar_valores(bytes(self.generador.generar_muchos(len(self._valores))))
+
+    def restaurar(self, valores, reserva=0):
+        """Deja el cacho con los dados `valores` (un byte por dado, 0 = sin lanzar) y la reserva dada."""
+        self._reemplazar_valores(valores)
+        self.reserva = reserva
+
+    def _reemplazar_valores(self, valores):
+        anterior = len(self._valores)
+        self._valores[:] = valores
+        histograma = bytearray(7)
+        for valor in self._valores:
+            histograma[valor] += 1
+        if self._mesa is not None:
+            self._mesa._sumar_histograma(self._histograma, -1)
+            self._mesa._sumar_histograma(histograma)
+            if len(self._valores) != anterior:
+                self._mesa._cambiar_cantidad(self._asiento, anterior, len(self._valores))
+        self._histograma = histograma
+
+    @property
+    def reserva(self):
+        return self._reserva
+
+    @reserva.setter
+    def reserva(self, reserva):
+        if self._mesa is not None:
+            self._mesa._cambiar_reserva(reserva - self._reserva)
+        self._reserva = reserva
 
     def añadir_dado(self):
-        if len(self.dados) < 5:
-            self.dados.append(Dado())
+        valores = self._valores
+        if len(valores) < 5:
+            valores.append(0)
+            self._histograma[0] += 1
+            if self._mesa is not None:
+                # Un solo aviso a la mesa por dado: histograma, totales y anillo juntos
+                self._mesa._añadir_dado(self._asiento, len(valores))
         else:
             self.reserva += 1
 
     def quitar_dado(self):
-        if self.dados:
-            if self.reserva > 0:
+        valores = self._valores
+        if valores:
+            if self._reserva > 0:
                 self.reserva -= 1
             else:
-                self.dados.pop()
+                valor = valores.pop()
+                self._histograma[valor] -= 1
+                if self._mesa is not None:
+                    self._mesa._quitar_dado(self._asiento, valor, len(valores))
+
+    def _asignar(self, indice, valor):
+        anterior = self._valores[indice]
+        self._valores[indice] = valor
+        self._histograma[anterior] -= 1
+        self._histograma[valor] += 1
+        if self._mesa is not None:
+            self._mesa._mover_dado(anterior, valor)
+
+    def _unir_mesa(self, mesa, asiento):
+        self._mesa = mesa
+        self._asiento = asiento
+        mesa._sumar_histograma(self._histograma)
 
     def mostrar(self):
         if self.visible:
-            print(" - ".join([str(dado) for dado in self.dados]))
+            print(" - ".join([PINTAS[valor] or "No lanzado" for valor in self._valores]))
 
     def ocultar(self):
         self.visible = False
@@ -36,4 +95,14 @@ class Cacho:
         self.visible = True
 
     def get_dados(self):
-        return self.dados
\ No newline at end of file
+        return [DadoVista(self, i) for i in range(len(self._valores))]
+
+    def get_valores(self):
+        return bytes(self._valores)
+
+    def get_histograma(self):
+        """Cantidad de dados por cara (índice 0 = sin lanzar). No se debe modificar."""
+        return self._histograma
+
+    def cantidad_dados(self):
+        return len(self._valores)
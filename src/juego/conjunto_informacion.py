@@ -0,0 +1,121 @@
+"""
+Clave entera de 64 bits para lo que un jugador ve de la partida (su conjunto de información).
+
+La clave reúne los dados propios, los dados de cada rival, la apuesta vigente, si la
+ronda es obligada y la pinta fija. Dos situaciones que el jugador no puede distinguir
+tienen la misma clave:
+
+    - Los dados propios se codifican como multiconjunto (el orden en el cacho no importa):
+      su índice entre las 462 manos posibles de 0 a 5 dados.
+    - Los rivales se ordenan desde el jugador en el sentido de juego, no por su índice en
+      la mesa, así que la clave no depende de en qué asiento está sentado.
+
+Campos (del bit menos significativo al más significativo):
+
+    mano         9 bits   índice del multiconjunto de dados propios
+    apariciones  6 bits   de la apuesta vigente (0 si no hay), acotadas a dados en mesa + 1
+    pinta        3 bits   de la apuesta vigente (0 si no hay)
+    obligado     1 bit
+    pinta fija   3 bits   (0 si no hay)
+    rivales      3 bits por rival, en orden de juego
+
+Una apuesta con más apariciones que dados en mesa es imposible sin importar cuántas
+pida, así que todas esas se codifican como dados en mesa + 1: fuera de ese caso la
+clave no pierde información. Con hasta MAX_JUGADORES jugadores la clave cabe en 64 bits
+y es un int pequeño de Python, barato como clave de diccionario.
+"""
+from __future__ import annotations
+from itertools import combinations_with_replacement
+
+MAX_JUGADORES = 12  # 60 dados como máximo: las apariciones (hasta 61) caben en 6 bits
+
+_BITS_MANO = 9
+_DESPLAZAMIENTO_APARICIONES = 9
+_DESPLAZAMIENTO_PINTA = 15
+_DESPLAZAMIENTO_OBLIGADO = 18
+_DESPLAZAMIENTO_PINTA_FIJA = 19
+_DESPLAZAMIENTO_RIVALES = 22
+
+
+def _manos() -> list[tuple[int, ...]]:
+    # Histogramas de las caras 1 a 6 para 0 a 5 dados, en orden de cantidad y luego de caras
+    manos = []
+    for cantidad in range(6):
+        for caras in combinations_with_replacement(range(1, 7), cantidad):
+            histograma = [0] * 6
+            for cara in caras:
+                histograma[cara - 1] += 1
+            manos.append(tuple(histograma))
+    return manos
+
+
+MANOS = tuple(_manos())
+_INDICE_MANO = {mano: indice for indice, mano in enumerate(MANOS)}
+
+
+def indice_mano(histograma) -> int:
+    """
+    Índice del multiconjunto de dados entre las 462 manos posibles.
+
+    Args:
+        - histograma (Sequence[int]): Histograma de 7 celdas como el de Cacho.get_histograma()
+          (la celda 0, dados sin lanzar, se ignora).
+    """
+    return _INDICE_MANO[tuple(histograma[1:7])]
+
+
+def codificar_informacion(partida, asiento: int) -> int:
+    """
+    Clave del conjunto de información del jugador `asiento` en una GestorPartida.
+
+    Raises:
+        - ValueError: Si la partida tiene más de MAX_JUGADORES jugadores.
+    """
+    cachos = partida.cachos
+    jugadores = len(cachos)
+    if jugadores > MAX_JUGADORES:
+        raise ValueError(f"La clave de 64 bits admite hasta {MAX_JUGADORES} jugadores")
+
+    clave = _INDICE_MANO[tuple(cachos[asiento].get_histograma()[1:7])]
+    apuesta = partida.apuesta_actual
+    if apuesta is not None:
+        # GestorPartida no limita las apariciones; pasado el total de dados todas valen lo mismo
+        apariciones = min(int(apuesta[0]), partida.mesa.total_dados + 1)
+        clave |= apariciones << _DESPLAZAMIENTO_APARICIONES | int(apuesta[1]) << _DESPLAZAMIENTO_PINTA
+    if partida.obligado:
+        clave |= 1 << _DESPLAZAMIENTO_OBLIGADO
+    if partida.pinta_fija is not None:
+        clave |= partida.pinta_fija << _DESPLAZAMIENTO_PINTA_FIJA
+
+    paso = 1 if partida.sentido == "derecha" else -1
+    desplazamiento = _DESPLAZAMIENTO_RIVALES
+    for k in range(1, jugadores):
+        clave |= cachos[(asiento + k * paso) % jugadores].cantidad_dados() << desplazamiento
+        desplazamiento += 3
+    return clave
+
+
+def codificar_vista(vista) -> int:
+    """Clave del conjunto de información desde la VistaPartida de un jugador."""
+    return codificar_informacion(vista._partida, vista.asiento)
+
+
+def decodificar_informacion(clave: int, jugadores: int) -> dict:
+    """
+    Recupera los campos de una clave de `codificar_informacion`.
+
+    Returns:
+        - dict: histograma (caras 1 a 6), apuesta ((apariciones, pinta) o None; las
+          apariciones son dados en mesa + 1 si la apuesta los superaba), obligado,
+          pinta_fija (o None) y rivales (dados de cada rival en orden de juego).
+    """
+    apariciones = clave >> _DESPLAZAMIENTO_APARICIONES & 0x3F
+    pinta = clave >> _DESPLAZAMIENTO_PINTA & 0x7
+    pinta_fija = clave >> _DESPLAZAMIENTO_PINTA_FIJA & 0x7
+    return {
+        "histograma": MANOS[clave & (1 << _BITS_MANO) - 1],
+        "apuesta": (apariciones, pinta) if pinta else None,
+        "obligado": bool(clave >> _DESPLAZAMIENTO_OBLIGADO & 1),
+        "pinta_fija": pinta_fija or None,
+        "rivales": tuple(clave >> (_DESPLAZAMIENTO_RIVALES + 3 * k) & 0x7 for k in range(jugadores - 1)),
+    }
@@ -0,0 +1,89 @@
+"""
+Interfaz de consola del Dudo: animaciones de texto y el bucle interactivo con input().
+
+Uso:
+    python -m src.juego.consola
+"""
+import os
+import sys
+import time
+
+from src.juego.gestor_partida import GestorPartida
+
+
+# ==== Consola ====
+def limpiar():
+    os.system("cls" if os.name == "nt" else "clear")
+
+def animar_texto(texto: str, delay: float = 0.03):
+    for ch in texto:
+        sys.stdout.write(ch)
+        sys.stdout.flush()
+        time.sleep(delay)
+    print()
+
+def animar_dados():
+    cuadros = ["[ ⚀ ]", "[ ⚁ ]", "[ ⚂ ]", "[ ⚃ ]", "[ ⚄ ]", "[ ⚅ ]"]
+    for _ in range(6):
+        for c in cuadros:
+            sys.stdout.write(f"\rLanzando dados... {c}")
+            sys.stdout.flush()
+            time.sleep(0.08)
+    print("\r", end="")
+
+
+# ==== Main ====
+def main():
+    limpiar()
+    animar_texto("=== Bienvenido al juego del Dudo ===", 0.02)
+
+    n = int(input("¿Cuántos jugadores participarán? (mínimo 2): "))
+    nombres = []
+    for i in range(n):
+        nombre = input(f"Nombre del jugador {i + 1}: ").strip() or f"jugador{i+1}"
+        nombres.append(nombre)
+
+    partida = GestorPartida(nombres)
+    limpiar()
+    animar_texto("\n Determinando jugador inicial...", 0.03)
+    time.sleep(0.8)
+    inicial = partida.determinar_inicial()
+    animar_texto(f"Comienza: {nombres[inicial]}\n", 0.02)
+
+    sentido = input(f"{nombres[inicial]}, elige sentido (izquierda/derecha): ").strip().lower()
+    partida.definir_sentido(sentido)
+    jugador_actual = inicial
+
+    while not partida.hay_ganador():
+        partida.iniciar_ronda()
+        ronda_activa = True
+        while ronda_activa and not partida.hay_ganador():
+            nombre = nombres[jugador_actual]
+            print(f"\nTurno de {nombre}")
+            print("Opciones: [A]postar, [D]udar, [C]alzar")
+            opcion = input("Elige acción: ").strip().upper()
+
+            if opcion == "A":
+                apariciones = int(input("Número de apariciones: "))
+                pinta = int(input("Pinta (1-6): "))
+                animar_dados()
+                if partida.apostar(jugador_actual, (apariciones, pinta)):
+                    jugador_actual = partida.siguiente_jugador(jugador_actual)
+                else:
+                    print("⚠️ Apuesta inválida.")
+
+            elif opcion == "D":
+                partida.dudar(jugador_actual)
+                ronda_activa = False
+                jugador_actual = partida.quien_inicia_proxima()
+
+            elif opcion == "C":
+                partida.calzar(jugador_actual)
+                ronda_activa = False
+                jugador_actual = partida.quien_inicia_proxima()
+
+    animar_texto(f"\n🏆 ¡El ganador es {partida.ganador()}!", 0.02)
+
+
+if __name__ == "__main__":
+    main()
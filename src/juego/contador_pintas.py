@@ -23,4 +23,20 @@ class ContadorPintas:
             for dado in dados:
                 if dado.get_valor() == pinta or dado.get_valor() == 1:
                     contador = contador + 1
-        return contador
\ No newline at end of file
+        return contador
+
+    def contar_en_histograma(self, histograma, pinta, obligado):
+        """
+        Igual que contar_pinta, pero a partir de un histograma de caras en vez de la lista de dados
+
+        Args:
+            - histograma (Sequence[int]): histograma[k] es la cantidad de dados que muestran k (índices 1 a 6)
+            - pinta (int): Número de la pinta que se está apostando (un valor entre 1 y 6)
+            - obligado (bool): True si la ronda es obligada, en ese caso los ases NO son comodines
+
+        Returns:
+            - int: Suma de todas las apariciones de la pinta que se está apostando
+        """
+        if obligado or pinta == 1:
+            return histograma[pinta]
+        return histograma[pinta] + histograma[1]
@@ -1,23 +1,59 @@
-from src.servicios.generador_aleatorio import Generador_Aleatorio
+from src.servicios.generador_aleatorio import generador_por_defecto
+
+# Nombres de las pintas indexados por valor; el 0 representa un dado sin lanzar
+PINTAS = (None, "As", "Tonto", "Tren", "Cuadra", "Quina", "Sexto")
+
 
 class Dado:
-    def __init__(self):
-        self.valor = None
-        self.pinta = None
+    __slots__ = ("_valor", "generador")
+
+    def __init__(self, generador=None):
+        self._valor = 0
+        self.generador = generador if generador is not None else generador_por_defecto
 
     def lanzar(self):
-        self.valor = Generador_Aleatorio().generar()
-        self.pinta = self.denominar_pinta(self.valor)
+        self.asignar(self.generador.generar())
+
+    def asignar(self, valor):
+        self._valor = valor
 
     def denominar_pinta(self, valor):
-        pintas = {1: "As", 2: "Tonto", 3: "Tren", 4: "Cuadra", 5: "Quina", 6: "Sexto"}
-        return pintas[valor]
+        return PINTAS[valor]
 
     def get_pinta(self):
-        return self.pinta
+        return PINTAS[self.get_valor() or 0]
 
     def get_valor(self):
-        return self.valor
+        return self._valor or None
+
+    @property
+    def valor(self):
+        return self.get_valor()
+
+    @property
+    def pinta(self):
+        return self.get_pinta()
 
     def __str__(self):
-        return self.get_pinta() if self.pinta else "No lanzado"
\ No newline at end of file
+        return self.get_pinta() or "No lanzado"
+
+
+class DadoVista(Dado):
+    """
+    Dado que no guarda su valor: lee y escribe la posición `indice` del cacho al que pertenece.
+    Es lo que entrega Cacho.get_dados(), para que el cacho pueda guardar sus dados empaquetados.
+    """
+    __slots__ = ("_cacho", "_indice")
+
+    def __init__(self, cacho, indice):
+        self._cacho = cacho
+        self._indice = indice
+
+    def lanzar(self):
+        self.asignar(self._cacho.generador.generar())
+
+    def asignar(self, valor):
+        self._cacho._asignar(self._indice, valor)
+
+    def get_valor(self):
+        return self._cacho._valores[self._indice] or None
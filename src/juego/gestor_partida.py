@@ -1,15 +1,12 @@
 from __future__ import annotations
-from typing import List, Tuple, Optional
 
 from src.juego.cacho import Cacho
+from src.juego.mesa import Mesa
 from src.juego.arbitro_ronda import ArbitroRonda
 from src.juego.validador_apuesta import ValidadorApuesta
-from src.juego.dado import Dado
-import time
-import sys
-import os
+from src.servicios.generador_aleatorio import Generador_Aleatorio, generador_por_defecto
 
-Apuesta = Tuple[int, int]  # (apariciones, pinta)
+Apuesta = tuple[int, int]  # (apariciones, pinta)
 
 
 class GestorPartida:
@@ -24,57 +21,71 @@ class GestorPartida:
     - Decidir quién inicia la siguiente ronda según quien pierde/recoge dado.
     - Detectar fin de juego.
 
-    NOTA: Esta clase es lógica pura y no hace I/O.
+    NOTA: Esta clase es lógica pura y no hace I/O (la interfaz de consola está en src/juego/consola.py). Si recibe un `registro`
+    (ver src/servicios/registro_partida.py) le entrega cada evento y es el
+    registro quien lo escribe.
     """
 
-    def __init__(self, nombres_jugadores: List[str]):
+    def __init__(self, nombres_jugadores: list[str], generador: Generador_Aleatorio | None = None, registro=None):
         if len(nombres_jugadores) < 2:
             raise ValueError("Se requieren al menos 2 jugadores")
 
-        self.nombres: List[str] = list(nombres_jugadores)
-        self.cachos: List[Cacho] = [Cacho() for _ in self.nombres]
-        self.activos: List[int] = list(range(len(self.nombres)))  # índices de jugadores con al menos 1 dado
+        # Fuente de dados de la partida; con un generador sembrado la partida es reproducible
+        self.generador = generador if generador is not None else generador_por_defecto
 
-        self.sentido_horario: bool = True  # True: izquierda; False: derecha
-        self.sentido = "derecha"  # por defecto
+        self.nombres: list[str] = list(nombres_jugadores)
+        self.cachos: list[Cacho] = [Cacho(self.generador) for _ in self.nombres]
+        self.mesa = Mesa(self.cachos)  # histograma total de caras y anillo de asientos, los mantienen los cachos
 
-        self.apuesta_actual: Optional[Apuesta] = None
-        self.indice_ultimo_apostador: Optional[int] = None
+        self.sentido = "derecha"  # por defecto; también elige la tabla de turnos
+
+        self.apuesta_actual: Apuesta | None = None
+        self.indice_ultimo_apostador: int | None = None
 
         self.obligado: bool = False
-        self.modo_obligado: Optional[str] = None
-        self.pinta_fija: Optional[int] = None
+        self.modo_obligado: str | None = None
+        self.pinta_fija: int | None = None
 
         self.arbitro = ArbitroRonda()
         self.validador = ValidadorApuesta()
 
-        self.indice_inicial_proxima: Optional[int] = None
+        self.indice_inicial_proxima: int | None = None
+
+        self.registro = registro
+        if registro is not None:
+            registro.inicio(len(self.nombres))
 
     # ---------------------------------------------------------------------
     # Gestión de orden/turnos
     # ---------------------------------------------------------------------
-    def _siguiente_en_activos(self, idx_global: int) -> int:
-        if idx_global not in self.activos:
-            pos = 0 if self.sentido_horario else len(self.activos) - 1
-            return self.activos[pos]
-
-        pos = self.activos.index(idx_global)
-        if self.sentido_horario:
-            return self.activos[(pos + 1) % len(self.activos)]
-        else:
-            return self.activos[(pos - 1) % len(self.activos)]
+    @property
+    def activos(self) -> list[int]:
+        """Índices de los jugadores con al menos 1 dado, en orden."""
+        return list(self.mesa.asientos)
+
+    @property
+    def sentido(self) -> str:
+        """Sentido de juego, "derecha" (hacia índices mayores) o "izquierda"."""
+        return self._sentido
+
+    @sentido.setter
+    def sentido(self, sentido: str) -> None:
+        if sentido not in ("izquierda", "derecha"):
+            raise ValueError("Sentido inválido, debe ser 'izquierda' o 'derecha'")
+        self._sentido = sentido
+        # Próximo asiento activo de cada asiento en este sentido; el anillo la mantiene al eliminar jugadores
+        self._turnos = self.mesa.asientos.enlaces(sentido == "derecha")
 
     def siguiente_jugador(self, idx_actual: int) -> int:
-        n = len(self.cachos)
-        if self.sentido == "derecha":
-            return (idx_actual + 1) % n
-        else:
-            return (idx_actual - 1) % n
+        """Siguiente jugador con dados en el sentido de juego; `idx_actual` puede estar eliminado."""
+        # `_turnos` es la lista del anillo: primero se quitan los que se quedaron sin dados
+        self.mesa.aplicar_eliminaciones()
+        return self._turnos[idx_actual]
 
     def definir_sentido(self, sentido: str):
-        if sentido not in ("izquierda", "derecha"):
-            raise ValueError("Sentido inválido, debe ser 'izquierda' o 'derecha'")
         self.sentido = sentido
+        if self.registro is not None:
+            self.registro.sentido(sentido)
 
     # ---------------------------------------------------------------------
     # Rondas
@@ -82,180 +93,199 @@ class GestorPartida:
     def iniciar_ronda(self) -> None:
         for cacho in self.cachos:
             cacho.agitar()
-        self.obligado = any(len(c.get_dados()) == 1 for c in self.cachos)
+        self.obligado = self.mesa.obligado
+        if self.registro is not None:
+            self.registro.ronda(self.cachos, self.obligado)
         self.apuesta_actual = None
         self.indice_ultimo_apostador = None
         if not self.obligado:
             self.modo_obligado = None
             self.pinta_fija = None
 
-    def configurar_obligado(self, modo: Optional[str], pinta_fija: Optional[int]) -> None:
+    def configurar_obligado(self, modo: str | None, pinta_fija: int | None) -> None:
         if modo is not None and modo not in ("abierta", "cerrada"):
             raise ValueError("modo debe ser 'abierta', 'cerrada' o None")
         self.modo_obligado = modo
         self.pinta_fija = pinta_fija
+        if self.registro is not None:
+            self.registro.obligado(modo, pinta_fija)
 
     # ---------------------------------------------------------------------
     # Inicio de partida
     # ---------------------------------------------------------------------
     def determinar_inicial(self) -> int:
-        while True:
-            tiradas = [self._tirar_un_dado() for _ in self.activos]
+        # Todos tiran en una sola llamada al generador; en caso de empate vuelven a tirar solo los empatados
+        candidatos = self.activos
+        lanzadas = []
+        while len(candidatos) > 1:
+            tiradas = self._tirar_dados(len(candidatos))
+            lanzadas += tiradas
             maximo = max(tiradas)
-            indices_max = [self.activos[i] for i, v in enumerate(tiradas) if v == maximo]
-            if len(indices_max) == 1:
-                self.indice_inicial_proxima = indices_max[0]
-                return indices_max[0]
-            self.activos = indices_max
+            candidatos = [asiento for asiento, valor in zip(candidatos, tiradas) if valor == maximo]
+        inicial = candidatos[0]
+        self.indice_inicial_proxima = inicial
+        if self.registro is not None:
+            self.registro.tiradas(lanzadas)
+            self.registro.inicial(inicial)
+        return inicial
 
-    def _tirar_un_dado(self) -> int:
-        d = Dado()
-        d.lanzar()
-        return d.get_valor()
+    def _tirar_dados(self, cantidad: int) -> list[int]:
+        return self.generador.generar_muchos(cantidad)
 
     # ---------------------------------------------------------------------
     # Acciones
     # ---------------------------------------------------------------------
     def apostar(self, idx_jugador: int, apuesta: Apuesta) -> bool:
-        cantidad_dados = len(self.cachos[idx_jugador].get_dados())
-        if self.obligado and self.pinta_fija is not None:
-            apar_nueva, pinta_nueva = apuesta
-            if pinta_nueva != self.pinta_fija:
-                return False
-        if self.validador.validar_apuesta(self.apuesta_actual, apuesta, cantidad_dados, self.obligado):
+        cantidad_dados = self.cachos[idx_jugador].cantidad_dados()
+        aceptada = False
+        if self.obligado and self.pinta_fija is not None and apuesta[1] != self.pinta_fija:
+            aceptada = False
+        elif self.validador.validar_apuesta(self.apuesta_actual, apuesta, cantidad_dados, self.obligado):
             self.apuesta_actual = apuesta
             self.indice_ultimo_apostador = idx_jugador
-            return True
-        return False
+            aceptada = True
+        if self.registro is not None:
+            self.registro.apuesta(idx_jugador, apuesta, aceptada)
+        return aceptada
 
     def dudar(self, idx_jugador: int) -> bool:
         if self.apuesta_actual is None or self.indice_ultimo_apostador is None:
             raise RuntimeError("No hay apuesta vigente para dudar")
         resultado = self.arbitro.dudar(
-            self.cachos, self.apuesta_actual, self.obligado, idx_jugador, self.indice_ultimo_apostador
+            self.cachos, self.apuesta_actual, self.obligado, idx_jugador, self.indice_ultimo_apostador, self.mesa
         )
         self._refrescar_activos()
-        if resultado:
-            self.indice_inicial_proxima = self.indice_ultimo_apostador
-        else:
-            self.indice_inicial_proxima = idx_jugador
+        perdedor = self.indice_ultimo_apostador if resultado else idx_jugador
+        self.indice_inicial_proxima = perdedor
+        if self.registro is not None:
+            self.registro.duda(idx_jugador, resultado, perdedor, self.cachos[perdedor])
         return resultado
 
-    def calzar(self, idx_jugador: int) -> Optional[bool]:
+    def calzar(self, idx_jugador: int) -> bool | None:
         if self.apuesta_actual is None:
             raise RuntimeError("No hay apuesta vigente para calzar")
-        if not self.arbitro.validar_calzar(self.cachos, idx_jugador):
-            return None
-        res = self.arbitro.calzar(self.cachos, self.apuesta_actual, self.obligado, idx_jugador)
-        self._refrescar_activos()
-        self.indice_inicial_proxima = idx_jugador
+        if not self.arbitro.validar_calzar(self.cachos, idx_jugador, self.mesa):
+            res = None
+        else:
+            res = self.arbitro.calzar(self.cachos, self.apuesta_actual, self.obligado, idx_jugador, self.mesa)
+            self._refrescar_activos()
+            self.indice_inicial_proxima = idx_jugador
+        if self.registro is not None:
+            self.registro.calce(idx_jugador, res, self.cachos[idx_jugador])
         return res
 
     # ---------------------------------------------------------------------
     # Estado y fin
     # ---------------------------------------------------------------------
     def hay_ganador(self) -> bool:
-        activos = [i for i, c in enumerate(self.cachos) if len(c.get_dados()) > 0]
-        return len(activos) == 1
+        return len(self.mesa.asientos) == 1
 
     def ganador(self):
-        for i, c in enumerate(self.cachos):
-            if len(c.get_dados()) > 0:
-                return self.nombres[i]   # 🔑 corregido
+        primero = self.mesa.asientos.primero
+        if primero is not None:
+            return self.nombres[primero]   # 🔑 corregido
         return None
 
     def total_dados_en_mesa(self) -> int:
-        return sum(len(c.get_dados()) for c in self.cachos)
+        return self.mesa.total_dados
 
     def _refrescar_activos(self) -> None:
-        self.activos = [i for i, c in enumerate(self.cachos) if len(c.get_dados()) > 0]
-        if self.indice_inicial_proxima is not None and self.indice_inicial_proxima not in self.activos:
+        # mesa.asientos quita del anillo a quien perdió su último dado antes de responder
+        if self.indice_inicial_proxima is not None and self.indice_inicial_proxima not in self.mesa.asientos:
             self.indice_inicial_proxima = None
 
     def estado_jugador(self, idx: int) -> dict:
         return {
             "nombre": self.nombres[idx],
-            "dados": len(self.cachos[idx].get_dados()),
+            "dados": self.cachos[idx].cantidad_dados(),
             "reserva": getattr(self.cachos[idx], "reserva", 0),
         }
 
-    def quien_inicia_proxima(self) -> Optional[int]:
+    def quien_inicia_proxima(self) -> int | None:
         return self.indice_inicial_proxima
 
+    # ---------------------------------------------------------------------
+    # Instantáneas (para búsqueda en el árbol de juego y puntos de control)
+    # ---------------------------------------------------------------------
+    def instantanea(self) -> tuple:
+        """
+        Captura el estado de la partida en una tupla inmutable.
+
+        Returns:
+            - tuple: ((valores, reserva) por cacho, sentido, apuesta_actual,
+              indice_ultimo_apostador, obligado, modo_obligado, pinta_fija, indice_inicial_proxima).
+              Los valores de cada cacho van como bytes, un byte por dado; los jugadores
+              activos son los cachos con dados.
+        """
+        return (
+            tuple((cacho.get_valores(), cacho.reserva) for cacho in self.cachos),
+            self.sentido,
+            self.apuesta_actual,
+            self.indice_ultimo_apostador,
+            self.obligado,
+            self.modo_obligado,
+            self.pinta_fija,
+            self.indice_inicial_proxima,
+        )
 
-# ==== Consola ====
-def limpiar():
-    os.system("cls" if os.name == "nt" else "clear")
-
-def animar_texto(texto: str, delay: float = 0.03):
-    for ch in texto:
-        sys.stdout.write(ch)
-        sys.stdout.flush()
-        time.sleep(delay)
-    print()
-
-def animar_dados():
-    cuadros = ["[ ⚀ ]", "[ ⚁ ]", "[ ⚂ ]", "[ ⚃ ]", "[ ⚄ ]", "[ ⚅ ]"]
-    for _ in range(6):
-        for c in cuadros:
-            sys.stdout.write(f"\rLanzando dados... {c}")
-            sys.stdout.flush()
-            time.sleep(0.08)
-    print("\r", end="")
-
-
-# ==== Main ====
-def main():
-    limpiar()
-    animar_texto("=== Bienvenido al juego del Dudo ===", 0.02)
-
-    n = int(input("¿Cuántos jugadores participarán? (mínimo 2): "))
-    nombres = []
-    for i in range(n):
-        nombre = input(f"Nombre del jugador {i + 1}: ").strip() or f"jugador{i+1}"
-        nombres.append(nombre)
-
-    partida = GestorPartida(nombres)
-    limpiar()
-    animar_texto("\n Determinando jugador inicial...", 0.03)
-    time.sleep(0.8)
-    inicial = partida.determinar_inicial()
-    animar_texto(f"Comienza: {nombres[inicial]}\n", 0.02)
-
-    sentido = input(f"{nombres[inicial]}, elige sentido (izquierda/derecha): ").strip().lower()
-    partida.definir_sentido(sentido)
-    jugador_actual = inicial
-
-    while not partida.hay_ganador():
-        partida.iniciar_ronda()
-        ronda_activa = True
-        while ronda_activa and not partida.hay_ganador():
-            nombre = nombres[jugador_actual]
-            print(f"\nTurno de {nombre}")
-            print("Opciones: [A]postar, [D]udar, [C]alzar")
-            opcion = input("Elige acción: ").strip().upper()
-
-            if opcion == "A":
-                apariciones = int(input("Número de apariciones: "))
-                pinta = int(input("Pinta (1-6): "))
-                animar_dados()
-                if partida.apostar(jugador_actual, (apariciones, pinta)):
-                    jugador_actual = partida.siguiente_jugador(jugador_actual)
-                else:
-                    print("⚠️ Apuesta inválida.")
-
-            elif opcion == "D":
-                partida.dudar(jugador_actual)
-                ronda_activa = False
-                jugador_actual = partida.quien_inicia_proxima()
-
-            elif opcion == "C":
-                partida.calzar(jugador_actual)
-                ronda_activa = False
-                jugador_actual = partida.quien_inicia_proxima()
-
-    animar_texto(f"\n🏆 ¡El ganador es {partida.ganador()}!", 0.02)
+    def restaurar(self, instantanea: tuple) -> None:
+        """
+        Vuelve la partida al estado capturado por `instantanea()`; la mesa se actualiza a través de los cachos.
+
+        Raises:
+            - ValueError: Si la instantánea no es de esta partida o trae datos inválidos; la
+              partida se valida completa antes de asignar nada, así que en ese caso no cambia.
+        """
+        if len(instantanea) != 8:
+            raise ValueError("La instantánea debe tener 8 campos, como la de instantanea()")
+        cachos, sentido = instantanea[0], instantanea[1]
+        if len(cachos) != len(self.cachos):
+            raise ValueError("La instantánea es de una partida con otra cantidad de jugadores")
+        if sentido not in ("izquierda", "derecha"):
+            raise ValueError(f"Sentido inválido en la instantánea: {sentido!r}")
+        for valores, reserva in cachos:
+            if len(valores) > 5 or max(valores, default=0) > 6 or reserva < 0:
+                raise ValueError(f"Cacho inválido en la instantánea: {valores!r}, reserva {reserva}")
+
+        (_, self.sentido, self.apuesta_actual, self.indice_ultimo_apostador,
+         self.obligado, self.modo_obligado, self.pinta_fija, self.indice_inicial_proxima) = instantanea
+        for cacho, (valores, reserva) in zip(self.cachos, cachos):
+            cacho.restaurar(valores, reserva)
+
+    def clonar(self) -> "GestorPartida":
+        """
+        Copia independiente de la partida, mucho más barata que `copy.deepcopy`.
+
+        Los cachos y la mesa son nuevos; el árbitro, el validador y los nombres (que no
+        cambian durante la partida) se comparten. El clon tira dados con su propio
+        generador, derivado del de la partida: lo que tire el clon no altera los dados
+        futuros de la original. El clon no escribe en el registro de la partida original.
+        """
+        clon = GestorPartida.__new__(GestorPartida)
+        clon.generador = _generador_para_clon(self.generador)
+        clon.nombres = self.nombres
+        clon.cachos = [Cacho(clon.generador) for _ in self.cachos]
+        clon.mesa = Mesa(clon.cachos)
+        clon.arbitro = self.arbitro
+        clon.validador = self.validador
+        clon.registro = None
+        clon.restaurar(self.instantanea())
+        return clon
+
+
+def _generador_para_clon(generador):
+    # derivar() no consume valores del original; con el mismo original los clones repiten
+    # la misma secuencia, y esa secuencia no es la que el original va a tirar
+    derivar = getattr(generador, "derivar", None)
+    if derivar is not None:
+        return derivar("clon")
+    import copy
+
+    return copy.deepcopy(generador)
 
 
 if __name__ == "__main__":
+    # Compatibilidad con `python -m src.juego.gestor_partida`; la consola vive en src/juego/consola.py
+    from src.juego.consola import main
+
     main()
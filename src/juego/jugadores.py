@@ -0,0 +1,164 @@
+import random
+
+from src.juego.modelo_rivales import ModeloRivales
+from src.juego.probabilidad_ronda import ProbabilidadRonda
+
+
+def subir_sin_ciclos(apuesta_actual, opciones: list, total_dados: int) -> list:
+    """
+    Ajusta las apuestas mínimas de cada pinta para que siempre suban el nivel de la apuesta.
+
+    Las reglas permiten ciclos: (2, 3) -> (1, 4) -> (2, 3) son todas legales, porque subir
+    de pinta no exige apariciones. Una estrategia determinista que siempre elige la más
+    probable puede quedar dando vueltas para siempre; con estas opciones la apuesta sube
+    en el orden (apariciones, pinta), contando cada As como dos dados, y la ronda termina.
+    """
+    if apuesta_actual is None or apuesta_actual[1] == 1:
+        return opciones
+    apariciones_actual = apuesta_actual[0]
+    ajustadas = []
+    for minimo, pinta in opciones:
+        if pinta != 1 and minimo < apariciones_actual:
+            minimo = apariciones_actual
+        if minimo <= total_dados:
+            ajustadas.append((minimo, pinta))
+    return ajustadas
+
+
+class Jugador:
+    """
+    Protocolo de las estrategias que juegan con `jugar_partida`.
+
+    Cada método recibe la VistaPartida del asiento (solo lectura: estado público y los
+    dados propios) y el índice del jugador. Solo `decidir` es obligatorio; jugar_partida
+    también acepta objetos que no hereden de esta clase y usa los valores por omisión de
+    aquí para los métodos que no definan.
+    """
+
+    def decidir(self, vista, idx_jugador: int) -> tuple:
+        """Devuelve ("apostar", (apariciones, pinta)), ("dudar",) o ("calzar",)."""
+        raise NotImplementedError
+
+    def elegir_sentido(self, vista, idx_jugador: int) -> str:
+        return "derecha"
+
+    def elegir_modo_obligado(self, vista, idx_jugador: int) -> str:
+        return "cerrada"
+
+    def observar(self, vista, evento: str, jugador: int, datos: tuple) -> None:
+        """Recibe cada apuesta aceptada, duda y calce de la mesa (formatos en ModeloRivales)."""
+
+
+class JugadorAleatorio(Jugador):
+    """
+    Estrategia de referencia: apuesta una apuesta legal al azar y duda con más
+    probabilidad mientras más alta sea la apuesta vigente respecto de los dados en mesa.
+    """
+
+    def __init__(self, semilla=None, probabilidad_calzar: float = 0.05):
+        self.rng = random.Random(semilla)
+        self.probabilidad_calzar = probabilidad_calzar
+
+    def elegir_sentido(self, vista, idx_jugador: int) -> str:
+        return self.rng.choice(("izquierda", "derecha"))
+
+    def elegir_modo_obligado(self, vista, idx_jugador: int) -> str:
+        return self.rng.choice(("abierta", "cerrada"))
+
+    def decidir(self, vista, idx_jugador: int) -> tuple:
+        total_dados = vista.total_dados_en_mesa()
+        apuesta = vista.apuesta_actual
+        if apuesta is not None:
+            if self.rng.random() < apuesta[0] / total_dados:
+                return ("dudar",)
+            if self.rng.random() < self.probabilidad_calzar and vista.puede_calzar():
+                return ("calzar",)
+
+        opciones = vista.apuestas_validas()
+        if not opciones:
+            return ("dudar",)
+        minimo, pinta = self.rng.choice(opciones)
+        return ("apostar", (self.rng.randint(minimo, min(minimo + 2, total_dados)), pinta))
+
+
+class JugadorUmbral(Jugador):
+    """
+    Duda cuando la probabilidad de que la apuesta vigente sea cierta (vista desde sus
+    dados) baja de `umbral_duda`, calza si acertar es al menos `umbral_calce` y si no
+    apuesta la mínima legal de la pinta con más margen: la que más apariciones creíbles
+    (ciertas con probabilidad `confianza`) tiene por sobre ese mínimo.
+
+    El umbral de duda se corrige con el ModeloRivales: contra quien ya fue sorprendido
+    apostando en falso se duda antes, y contra quien apuesta en serio se duda después.
+    """
+
+    def __init__(
+        self,
+        semilla=None,
+        umbral_duda: float = 0.35,
+        umbral_calce: float = 0.4,
+        sensibilidad: float = 0.5,
+        confianza: float = 0.5,
+    ):
+        self.rng = random.Random(semilla)
+        self.umbral_duda = umbral_duda
+        self.umbral_calce = umbral_calce
+        self.sensibilidad = sensibilidad
+        self.confianza = confianza
+        self.probabilidad = ProbabilidadRonda()
+        self.modelo = None  # se crea con el primer evento observado, según los asientos de la mesa
+
+    def elegir_sentido(self, vista, idx_jugador: int) -> str:
+        return self.rng.choice(("izquierda", "derecha"))
+
+    def observar(self, vista, evento: str, jugador: int, datos: tuple) -> None:
+        if self.modelo is None or len(self.modelo.apuestas) != vista.jugadores:
+            self.modelo = ModeloRivales(vista.jugadores)
+        self.modelo.observar(vista, evento, jugador, datos)
+
+    def decidir(self, vista, idx_jugador: int) -> tuple:
+        obligado = vista.obligado
+        desconocidos = vista.total_dados_en_mesa() - vista.cantidad_dados(idx_jugador)
+        apuesta = vista.apuesta_actual
+        if apuesta is not None:
+            umbral = self.umbral_duda
+            if self.modelo is not None:
+                umbral += self.sensibilidad * (self.modelo.tasa_farol(vista.indice_ultimo_apostador) - self.modelo.previa)
+            if self.probabilidad.probabilidad_apuesta(vista, desconocidos, apuesta, obligado) < umbral:
+                return ("dudar",)
+            if (
+                vista.puede_calzar()
+                and self.probabilidad.probabilidad_calzar(vista, desconocidos, apuesta, obligado) >= self.umbral_calce
+            ):
+                return ("calzar",)
+
+        opciones = subir_sin_ciclos(apuesta, vista.apuestas_validas(), vista.total_dados_en_mesa())
+        if not opciones:
+            return ("dudar",)
+        return ("apostar", self._elegir_apuesta(vista, opciones, desconocidos, obligado))
+
+    def _elegir_apuesta(self, vista, opciones: list, desconocidos: int, obligado: bool) -> tuple:
+        # Las opciones son las mínimas de cada pinta; max se queda con la primera de las empatadas
+        creible = self.probabilidad.maximo_creible
+        confianza = self.confianza
+        return max(opciones, key=lambda opcion: creible(vista, desconocidos, opcion[1], obligado, confianza) - opcion[0])
+
+
+class JugadorFarol(JugadorUmbral):
+    """
+    Como JugadorUmbral, pero con probabilidad `frecuencia_farol` sube su apuesta una o
+    dos apariciones por sobre lo que sus dados respaldan, para que dudarle sea caro.
+    """
+
+    def __init__(self, semilla=None, frecuencia_farol: float = 0.3, **umbrales):
+        super().__init__(semilla, **umbrales)
+        self.frecuencia_farol = frecuencia_farol
+
+    def elegir_modo_obligado(self, vista, idx_jugador: int) -> str:
+        return "abierta"
+
+    def _elegir_apuesta(self, vista, opciones: list, desconocidos: int, obligado: bool) -> tuple:
+        apariciones, pinta = super()._elegir_apuesta(vista, opciones, desconocidos, obligado)
+        if self.rng.random() < self.frecuencia_farol:
+            apariciones = min(apariciones + self.rng.randint(1, 2), vista.total_dados_en_mesa())
+        return (apariciones, pinta)
@@ -0,0 +1,104 @@
+from src.juego.anillo_asientos import AnilloAsientos
+
+
+class Mesa:
+    """
+    Agregados de todos los cachos de una partida.
+
+    Cada cacho avisa a su mesa cuando cambia su histograma de caras (al agitar,
+    añadir o quitar un dado), así la mesa mantiene el histograma total sin
+    recorrer los dados y contar una pinta es una consulta de tiempo constante.
+    También avisa cuando cambia su cantidad de dados o su reserva; con eso la
+    mesa lleva los totales que consultan el árbitro y el gestor en cada decisión
+    (dados en juego, jugadores con un solo dado y dados reservados) y quita (o
+    repone) del anillo de turnos el asiento que queda sin dados.
+
+    Quitar un asiento del anillo es lo más caro de una duda, así que se deja
+    pendiente y se aplica la próxima vez que se consulta el anillo.
+    """
+
+    def __init__(self, cachos):
+        self.cachos = cachos
+        # histograma[k] = cantidad de dados que muestran k en toda la mesa (0 = sin lanzar)
+        self.histograma = [0] * 7
+        self._asientos = AnilloAsientos(len(cachos))
+        # Asientos que quedaron sin dados y todavía no se quitaron del anillo
+        self._sin_dados = []
+        self.total_dados = 0
+        self.jugadores_con_un_dado = 0
+        self.total_reservas = 0
+        for asiento, cacho in enumerate(cachos):
+            cacho._unir_mesa(self, asiento)
+            cantidad = cacho.cantidad_dados()
+            self.total_dados += cantidad
+            self.jugadores_con_un_dado += cantidad == 1
+            self.total_reservas += cacho.reserva
+            if cantidad == 0:
+                self._asientos.quitar(asiento)
+
+    @property
+    def asientos(self) -> AnilloAsientos:
+        """Anillo de turnos con los asientos que tienen dados."""
+        self.aplicar_eliminaciones()
+        return self._asientos
+
+    def aplicar_eliminaciones(self) -> None:
+        """
+        Quita del anillo los asientos que quedaron sin dados desde la última consulta.
+
+        Las listas que entrega `AnilloAsientos.enlaces` quedan al día después de llamarlo.
+        """
+        if not self._sin_dados:
+            return
+        for asiento in self._sin_dados:
+            self._asientos.quitar(asiento)
+        self._sin_dados.clear()
+
+    @property
+    def obligado(self):
+        """True si algún jugador tiene un solo dado."""
+        return self.jugadores_con_un_dado > 0
+
+    def _sumar_histograma(self, histograma, signo=1):
+        total = self.histograma
+        for cara in range(7):
+            total[cara] += signo * histograma[cara]
+
+    def _mover_dado(self, cara_anterior, cara_nueva):
+        # cara None indica que el dado no existía antes o ya no existe
+        if cara_anterior is not None:
+            self.histograma[cara_anterior] -= 1
+        if cara_nueva is not None:
+            self.histograma[cara_nueva] += 1
+
+    def _cambiar_cantidad(self, asiento, anterior, nueva):
+        self.total_dados += nueva - anterior
+        self.jugadores_con_un_dado += (nueva == 1) - (anterior == 1)
+        if nueva == 0 and anterior > 0:
+            self.asientos.quitar(asiento)
+        elif anterior == 0 and nueva > 0:
+            self.asientos.insertar(asiento)
+
+    def _quitar_dado(self, asiento, cara, quedan):
+        # Lo mismo que _mover_dado(cara, None) y _cambiar_cantidad(asiento, quedan + 1, quedan)
+        # en una sola llamada: es lo que hace cada duda y cada calce fallido
+        self.histograma[cara] -= 1
+        self.total_dados -= 1
+        if quedan == 1:
+            self.jugadores_con_un_dado += 1
+        elif quedan == 0:
+            self.jugadores_con_un_dado -= 1
+            self._sin_dados.append(asiento)
+
+    def _añadir_dado(self, asiento, cantidad):
+        # Un dado sin lanzar más en el cacho de `asiento`, que ahora tiene `cantidad`
+        self.histograma[0] += 1
+        self.total_dados += 1
+        if cantidad == 1:
+            self.jugadores_con_un_dado += 1
+            self.asientos.insertar(asiento)
+        elif cantidad == 2:
+            self.jugadores_con_un_dado -= 1
+
+    def _cambiar_reserva(self, diferencia):
+        self.total_reservas += diferencia
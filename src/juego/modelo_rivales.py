@@ -0,0 +1,55 @@
+class ModeloRivales:
+    """
+    Lo que un jugador aprende de cada rival mirando sus apuestas y cómo terminan las dudas.
+
+    Guarda por asiento unos pocos contadores que se actualizan en tiempo constante con cada
+    evento observado, así consultar el modelo en un turno no recorre la historia de la
+    partida. Las tasas usan un prior de Beta(a, b) para no sacar conclusiones de las
+    primeras jugadas.
+
+    Eventos (los mismos que entrega jugar_partida a `observar`):
+        ("apuesta", jugador, (apuesta,))                 apuesta aceptada
+        ("duda", jugador, (apostador, apuesta, acierto)) acierto = la apuesta era falsa
+        ("calce", jugador, (apuesta, acierto))
+    """
+
+    __slots__ = ("apuestas", "suma_agresividad", "dudadas", "faroles", "dudas", "dudas_acertadas", "_a", "_b")
+
+    def __init__(self, jugadores: int, a: float = 1.0, b: float = 2.0):
+        self.apuestas = [0] * jugadores
+        self.suma_agresividad = [0.0] * jugadores  # suma de apariciones / dados en mesa
+        self.dudadas = [0] * jugadores  # apuestas suyas que alguien dudó
+        self.faroles = [0] * jugadores  # de esas, las que resultaron falsas
+        self.dudas = [0] * jugadores
+        self.dudas_acertadas = [0] * jugadores
+        self._a = a
+        self._b = b
+
+    def observar(self, vista, evento: str, jugador: int, datos: tuple) -> None:
+        if evento == "apuesta":
+            self.apuestas[jugador] += 1
+            self.suma_agresividad[jugador] += datos[0][0] / vista.total_dados_en_mesa()
+        elif evento == "duda":
+            apostador, _, acierto = datos
+            self.dudas[jugador] += 1
+            self.dudadas[apostador] += 1
+            if acierto:
+                self.dudas_acertadas[jugador] += 1
+                self.faroles[apostador] += 1
+
+    @property
+    def previa(self) -> float:
+        """Tasa que devuelven tasa_farol y tasa_acierto_duda para un rival sin observaciones."""
+        return self._a / (self._a + self._b)
+
+    def tasa_farol(self, jugador: int) -> float:
+        """Estimación de la probabilidad de que una apuesta dudada de `jugador` sea falsa."""
+        return (self.faroles[jugador] + self._a) / (self.dudadas[jugador] + self._a + self._b)
+
+    def tasa_acierto_duda(self, jugador: int) -> float:
+        return (self.dudas_acertadas[jugador] + self._a) / (self.dudas[jugador] + self._a + self._b)
+
+    def agresividad(self, jugador: int) -> float:
+        """Promedio de apariciones apostadas sobre dados en mesa (0 si aún no apuesta)."""
+        apuestas = self.apuestas[jugador]
+        return self.suma_agresividad[jugador] / apuestas if apuestas else 0.0
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import numpy as np
+
+DADOS_POR_CACHO = 5
+
+
+class MotorLote:
+    """
+    Motor de simulación por lotes para muchas mesas de Dudo a la vez.
+
+    Guarda N mesas × P jugadores × 5 dados en un único arreglo de enteros
+    (0 = posición sin dado o dado sin lanzar) y resuelve dudar/calzar para
+    todas las mesas con operaciones vectorizadas, usando las mismas reglas
+    que ArbitroRonda y la misma semántica de reserva que Cacho.
+
+    Internamente los arreglos se guardan con las mesas en el último eje, para
+    que los conteos recorran las mesas de forma contigua; `dados`,
+    `cantidades` y `reservas` los exponen como vistas (N, P, 5) y (N, P).
+    Las tiradas se generan en orden mesa → jugador → dado, el mismo orden en
+    que GestorPartida agita sus cachos, de modo que una mesa del lote y una
+    partida alimentada con los mismos valores producen los mismos resultados.
+
+    Los dados salen de `np.random.default_rng(semilla)` y no del generador de
+    GestorPartida (`random` de la biblioteca estándar), así que una misma semilla
+    da tiradas distintas en uno y otro: la equivalencia es con los mismos valores
+    de dados, no con la misma semilla. Con la misma semilla el lote sí se repite.
+    """
+
+    def __init__(self, mesas: int, jugadores: int, semilla: int | None = None):
+        if mesas < 1:
+            raise ValueError("Se requiere al menos 1 mesa")
+        if jugadores < 2:
+            raise ValueError("Se requieren al menos 2 jugadores")
+
+        self.mesas = mesas
+        self.jugadores = jugadores
+        self.rng = np.random.default_rng(semilla)
+
+        self._caras = np.zeros((jugadores, DADOS_POR_CACHO, mesas), dtype=np.int8)
+        self._cantidades = np.full((jugadores, mesas), DADOS_POR_CACHO, dtype=np.int8)
+        self._reservas = np.zeros((jugadores, mesas), dtype=np.int16)
+        self._posiciones = np.arange(DADOS_POR_CACHO, dtype=np.int8)[:, None]
+        self._filas = np.arange(mesas)
+
+    @property
+    def dados(self) -> np.ndarray:
+        """Vista (N, P, 5) de los dados; escribir en ella modifica el lote."""
+        return self._caras.transpose(2, 0, 1)
+
+    @property
+    def cantidades(self) -> np.ndarray:
+        """Vista (N, P) con la cantidad de dados de cada jugador."""
+        return self._cantidades.T
+
+    @property
+    def reservas(self) -> np.ndarray:
+        """Vista (N, P) con los dados reservados de cada jugador."""
+        return self._reservas.T
+
+    # ---------------------------------------------------------------------
+    # Estado de las mesas
+    # ---------------------------------------------------------------------
+    def reiniciar(self, mascara: np.ndarray | None = None) -> None:
+        """Devuelve las mesas indicadas (o todas) al estado inicial de 5 dados por jugador."""
+        if mascara is None:
+            mascara = slice(None)
+        elif not mascara.any():
+            return
+        self._caras[..., mascara] = 0
+        self._cantidades[:, mascara] = DADOS_POR_CACHO
+        self._reservas[:, mascara] = 0
+
+    def agitar(self) -> None:
+        """Lanza todos los dados de todas las mesas con una sola llamada al generador."""
+        valores = self.rng.integers(1, 7, size=(self.mesas, self.jugadores, DADOS_POR_CACHO), dtype=np.int8)
+        en_juego = self._posiciones < self._cantidades[:, None, :]
+        np.multiply(valores.transpose(1, 2, 0), en_juego, out=self._caras)
+
+    def determinar_iniciales(self) -> np.ndarray:
+        """
+        Elige quién inicia en cada mesa como GestorPartida.determinar_inicial, para todas a la vez.
+
+        Los jugadores con dados de las mesas sin resolver tiran en un solo bloque; en cada
+        vuelta siguen solo las mesas con empate en el máximo, y en ellas solo los empatados.
+
+        Returns:
+            - np.ndarray: Índice del jugador que inicia en cada mesa (-1 si la mesa no tiene jugadores).
+        """
+        candidatos = (self._cantidades > 0).T.copy()
+        cuantos = candidatos.sum(axis=1)
+        iniciales = np.where(cuantos == 1, candidatos.argmax(axis=1), -1)
+        pendientes = np.flatnonzero(cuantos > 1)
+        while pendientes.size:
+            tiradas = self.rng.integers(1, 7, size=(pendientes.size, self.jugadores), dtype=np.int8)
+            tiradas *= candidatos[pendientes]
+            empatados = tiradas == tiradas.max(axis=1, keepdims=True)
+            resueltas = empatados.sum(axis=1) == 1
+            iniciales[pendientes[resueltas]] = empatados[resueltas].argmax(axis=1)
+            candidatos[pendientes] = empatados
+            pendientes = pendientes[~resueltas]
+        return iniciales
+
+    def histogramas(self) -> np.ndarray:
+        """
+        Cuenta las caras de cada mesa.
+
+        Returns:
+            - np.ndarray: Arreglo (N, 7); la columna k contiene cuántos dados muestran k.
+              La columna 0 cuenta posiciones vacías o dados sin lanzar.
+        """
+        return np.stack([(self._caras == cara).sum(axis=(0, 1)) for cara in range(7)], axis=1)
+
+    def contar(self, apuestas: np.ndarray, obligado) -> np.ndarray:
+        """Cantidad real de apariciones de la pinta apostada en cada mesa (ases comodines si no es obligado)."""
+        pintas = np.asarray(apuestas)[:, 1].astype(np.int8)
+        obligado = np.broadcast_to(np.asarray(obligado, dtype=bool), (self.mesas,))
+        coincide = self._caras == pintas
+        coincide |= (self._caras == 1) & (~obligado & (pintas != 1))
+        return coincide.sum(axis=(0, 1), dtype=np.int16)
+
+    def total_dados(self) -> np.ndarray:
+        return self._cantidades.sum(axis=0, dtype=np.int32)
+
+    def obligados(self) -> np.ndarray:
+        return (self._cantidades == 1).any(axis=0)
+
+    def hay_ganador(self) -> np.ndarray:
+        return (self._cantidades > 0).sum(axis=0) == 1
+
+    # ---------------------------------------------------------------------
+    # Arbitraje
+    # ---------------------------------------------------------------------
+    def dudar(self, apuestas: np.ndarray, obligado, indice_dudo, indice_apuesta) -> np.ndarray:
+        """
+        Resuelve una duda en cada mesa.
+
+        Args:
+            - apuestas (np.ndarray): Arreglo (N, 2) con (apariciones, pinta) por mesa.
+            - obligado (bool | np.ndarray): Si la ronda es obligada, por mesa o común a todas.
+            - indice_dudo (int | np.ndarray): Jugador que duda en cada mesa.
+            - indice_apuesta (int | np.ndarray): Jugador que hizo la apuesta en cada mesa.
+
+        Returns:
+            - np.ndarray: Booleanos, True donde la duda fue correcta (pierde dado quien apostó).
+        """
+        apariciones = np.asarray(apuestas)[:, 0]
+        resultado = apariciones > self.contar(apuestas, obligado)
+        perdedores = np.where(resultado, indice_apuesta, indice_dudo)
+        self._quitar_dado(self._filas, perdedores)
+        return resultado
+
+    def calzar(self, apuestas: np.ndarray, obligado, indice_calzo) -> np.ndarray:
+        """Resuelve un calce en cada mesa: gana un dado si acierta exacto, si no lo pierde."""
+        apariciones = np.asarray(apuestas)[:, 0]
+        resultado = apariciones == self.contar(apuestas, obligado)
+        indice_calzo = np.broadcast_to(np.asarray(indice_calzo), (self.mesas,))
+        self._añadir_dado(self._filas[resultado], indice_calzo[resultado])
+        self._quitar_dado(self._filas[~resultado], indice_calzo[~resultado])
+        return resultado
+
+    def validar_calzar(self, indice_calzo) -> np.ndarray:
+        """Se puede calzar con al menos la mitad de los dados en la mesa o si quien calza tiene un solo dado."""
+        mitad = self.total_dados() >= self.jugadores * DADOS_POR_CACHO / 2
+        return mitad | (self._cantidades[indice_calzo, self._filas] == 1)
+
+    # ---------------------------------------------------------------------
+    # Dados por jugador (misma semántica que Cacho)
+    # ---------------------------------------------------------------------
+    def _quitar_dado(self, mesas: np.ndarray, jugadores) -> None:
+        jugadores = np.broadcast_to(np.asarray(jugadores), mesas.shape)
+        tiene = self._cantidades[jugadores, mesas] > 0
+        con_reserva = tiene & (self._reservas[jugadores, mesas] > 0)
+        self._reservas[jugadores[con_reserva], mesas[con_reserva]] -= 1
+
+        sacar = tiene & ~con_reserva
+        j, m = jugadores[sacar], mesas[sacar]
+        self._cantidades[j, m] -= 1
+        self._caras[j, self._cantidades[j, m], m] = 0
+
+    def _añadir_dado(self, mesas: np.ndarray, jugadores) -> None:
+        jugadores = np.broadcast_to(np.asarray(jugadores), mesas.shape)
+        cabe = self._cantidades[jugadores, mesas] < DADOS_POR_CACHO
+        j, m = jugadores[cabe], mesas[cabe]
+        self._caras[j, self._cantidades[j, m], m] = 0
+        self._cantidades[j, m] += 1
+        self._reservas[jugadores[~cabe], mesas[~cabe]] += 1
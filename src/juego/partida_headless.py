@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from src.juego.gestor_partida import GestorPartida
+from src.juego.vista_partida import VistaPartida
+from src.servicios.generador_aleatorio import Generador_Aleatorio
+
+
+def siguiente_activo(partida: GestorPartida, idx: int) -> int:
+    """Siguiente jugador con dados en el sentido de juego (siguiente_jugador ya salta los eliminados)."""
+    return partida.siguiente_jugador(idx)
+
+
+def abrir_ronda(partida: GestorPartida) -> None:
+    """Agita los cachos; en ronda obligada el modo y la pinta fija de una ronda anterior no se heredan."""
+    partida.iniciar_ronda()
+    if partida.obligado:
+        partida.configurar_obligado(None, None)
+
+
+def inicial_siguiente_ronda(partida: GestorPartida, perdedor: int) -> int:
+    """Quien inicia la próxima ronda; si quedó eliminado, el siguiente al perdedor en el sentido de juego."""
+    inicial = partida.quien_inicia_proxima()
+    if inicial is None or inicial not in partida.mesa.asientos:
+        return siguiente_activo(partida, perdedor)
+    return inicial
+
+
+def _avisar(observadores: list, evento: str, jugador: int, datos: tuple) -> None:
+    for observar, vista in observadores:
+        observar(vista, evento, jugador, datos)
+
+
+def jugar_partida(jugadores: list, generador: Generador_Aleatorio | None = None, registro=None) -> dict:
+    """
+    Juega una partida completa sin consola, pidiendo cada acción a las estrategias.
+
+    Cada estrategia recibe la VistaPartida de su asiento, no el gestor, y las que definen
+    `observar` reciben después de cada apuesta aceptada, duda o calce el evento correspondiente.
+
+    Args:
+        - jugadores (list): Una estrategia por asiento (ver Jugador en src/juego/jugadores.py para el protocolo).
+        - generador (Generador_Aleatorio | None): Fuente de dados; con semilla la partida es reproducible.
+        - registro (RegistroBinario | None): Si se entrega, la partida graba sus eventos en él.
+
+    Returns:
+        - dict: {"ganador": índice del ganador, "rondas": rondas jugadas, "apuestas": apuestas aceptadas}
+
+    Raises:
+        - ValueError: Si una estrategia propone una acción que el gestor rechaza.
+    """
+    partida = GestorPartida([f"jugador{i + 1}" for i in range(len(jugadores))], generador, registro)
+    vistas = [VistaPartida(partida, asiento) for asiento in range(len(jugadores))]
+    observadores = [
+        (jugador.observar, vista) for jugador, vista in zip(jugadores, vistas) if hasattr(jugador, "observar")
+    ]
+    actual = partida.determinar_inicial()
+    sentido = getattr(jugadores[actual], "elegir_sentido", None)
+    partida.definir_sentido(sentido(vistas[actual], actual) if sentido else "derecha")
+
+    rondas = 0
+    apuestas = 0
+    while not partida.hay_ganador():
+        abrir_ronda(partida)
+        rondas += 1
+        while True:
+            accion = jugadores[actual].decidir(vistas[actual], actual)
+            if accion[0] == "apostar":
+                primera = partida.apuesta_actual is None
+                if not partida.apostar(actual, accion[1]):
+                    raise ValueError(f"Apuesta inválida del jugador {actual}: {accion[1]}")
+                apuestas += 1
+                if primera and partida.obligado:
+                    # Quien abre la ronda obligada elige el modo y fija la pinta
+                    elegir_modo = getattr(jugadores[actual], "elegir_modo_obligado", None)
+                    modo = elegir_modo(vistas[actual], actual) if elegir_modo else "cerrada"
+                    partida.configurar_obligado(modo, accion[1][1])
+                if observadores:
+                    _avisar(observadores, "apuesta", actual, (accion[1],))
+                actual = siguiente_activo(partida, actual)
+            elif accion[0] == "dudar":
+                apostador, apuesta = partida.indice_ultimo_apostador, partida.apuesta_actual
+                acierto = partida.dudar(actual)
+                perdedor = apostador if acierto else actual
+                if observadores:
+                    _avisar(observadores, "duda", actual, (apostador, apuesta, acierto))
+                break
+            elif accion[0] == "calzar":
+                apuesta = partida.apuesta_actual
+                acierto = partida.calzar(actual)
+                if acierto is None:
+                    raise ValueError(f"El jugador {actual} no puede calzar")
+                perdedor = actual
+                if observadores:
+                    _avisar(observadores, "calce", actual, (apuesta, acierto))
+                break
+            else:
+                raise ValueError(f"Acción desconocida: {accion!r}")
+
+        actual = inicial_siguiente_ronda(partida, perdedor)
+
+    return {"ganador": partida.activos[0], "rondas": rondas, "apuestas": apuestas}
@@ -0,0 +1,98 @@
+from __future__ import annotations
+from functools import lru_cache
+from math import comb
+
+from src.juego.contador_pintas import ContadorPintas
+
+
+@lru_cache(maxsize=None)
+def _tabla_binomial(n: int, comodin: bool) -> tuple[tuple[float, ...], tuple[float, ...]]:
+    """
+    Distribución de cuántos de `n` dados desconocidos cuentan para una pinta.
+
+    Con comodín (ases valen) cada dado cuenta con p = 1/3; sin comodín p = 1/6.
+
+    Returns:
+        - tuple: (pmf, cola) con pmf[k] = P(X = k) y cola[k] = P(X >= k), para k de 0 a n + 1.
+    """
+    p = 1 / 3 if comodin else 1 / 6
+    q = 1 - p
+    pmf = [comb(n, k) * p ** k * q ** (n - k) for k in range(n + 1)] + [0.0]
+    cola = [0.0] * (n + 2)
+    for k in range(n, -1, -1):
+        cola[k] = cola[k + 1] + pmf[k]
+    cola[0] = 1.0
+    return tuple(pmf), tuple(cola)
+
+
+@lru_cache(maxsize=None)
+def _maximo_en_cola(n: int, comodin: bool, confianza: float) -> int:
+    """Mayor k tal que P(X >= k) >= confianza para los n dados desconocidos (0 si ninguno)."""
+    _, cola = _tabla_binomial(n, comodin)
+    k = 0
+    while k < n and cola[k + 1] >= confianza:
+        k += 1
+    return k
+
+
+class ProbabilidadRonda:
+    """
+    Probabilidades exactas de que una apuesta sea verdadera o de que un calce acierte,
+    vistas desde el cacho de quien decide.
+
+    Los dados propios se cuentan con su histograma; los dados desconocidos del resto de
+    la mesa siguen una binomial: cada uno cuenta con p = 1/3 si los ases son comodines
+    y con p = 1/6 si se apuesta a ases o la ronda es obligada.
+    """
+
+    def __init__(self, max_dados: int | None = None):
+        self.contador_pintas = ContadorPintas()
+        # Se precalculan las tablas hasta el máximo de dados de la mesa; más allá se calculan al consultarlas
+        if max_dados is not None:
+            for n in range(max_dados + 1):
+                _tabla_binomial(n, True)
+                _tabla_binomial(n, False)
+
+    def _faltantes(self, cacho, dados_desconocidos, apuesta, obligado):
+        apariciones, pinta = apuesta
+        propios = self.contador_pintas.contar_en_histograma(cacho.get_histograma(), pinta, obligado)
+        comodin = not obligado and pinta != 1
+        pmf, cola = _tabla_binomial(dados_desconocidos, comodin)
+        return apariciones - propios, pmf, cola
+
+    def probabilidad_apuesta(self, cacho, dados_desconocidos, apuesta, obligado) -> float:
+        """
+        Probabilidad de que la apuesta sea verdadera, es decir, de que una duda sea incorrecta
+
+        Args:
+            - cacho (Cacho): Cacho de quien decide, con sus dados ya lanzados.
+            - dados_desconocidos (int): Cantidad de dados del resto de la mesa.
+            - apuesta (tuple[int, int]): Apuesta (apariciones, pinta) a evaluar.
+            - obligado (bool): True si la ronda es obligada (los ases no son comodines).
+
+        Returns:
+            - float: P(apariciones reales >= apariciones apostadas)
+        """
+        faltantes, _, cola = self._faltantes(cacho, dados_desconocidos, apuesta, obligado)
+        if faltantes <= 0:
+            return 1.0
+        if faltantes > dados_desconocidos:
+            return 0.0
+        return cola[faltantes]
+
+    def probabilidad_calzar(self, cacho, dados_desconocidos, apuesta, obligado) -> float:
+        """Probabilidad de que las apariciones reales sean exactamente las apostadas (calce correcto)."""
+        faltantes, pmf, _ = self._faltantes(cacho, dados_desconocidos, apuesta, obligado)
+        if faltantes < 0 or faltantes > dados_desconocidos:
+            return 0.0
+        return pmf[faltantes]
+
+    def maximo_creible(self, cacho, dados_desconocidos, pinta, obligado, confianza: float = 0.5) -> int:
+        """
+        Mayor cantidad de apariciones de `pinta` que es verdadera con probabilidad al menos `confianza`.
+
+        Returns:
+            - int: Apariciones propias más las que aportan los dados desconocidos con esa confianza.
+        """
+        propios = self.contador_pintas.contar_en_histograma(cacho.get_histograma(), pinta, obligado)
+        return propios + _maximo_en_cola(dados_desconocidos, not obligado and pinta != 1, confianza)
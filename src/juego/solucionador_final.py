@@ -0,0 +1,339 @@
+"""
+Solucionador de finales de Dudo con pocos jugadores y pocos dados (CFR).
+
+Resuelve una ronda con minimización de arrepentimiento contrafactual (CFR) sobre
+conjuntos de información: los dados propios (como multiconjunto), la cantidad de
+dados de cada rival, las apuestas de la ronda y el estado obligado / pinta fija.
+Las reglas salen de ValidadorApuesta (apuestas legales) y ArbitroRonda (quién
+pierde al dudar o calzar, y cuándo se puede calzar).
+
+Simplificaciones:
+    - Se juega una sola ronda: quien pierde un dado obtiene -1 y el resto se reparte +1;
+      un calce exacto vale +1 para quien calza y -1 repartido entre los demás.
+    - Las apuestas se abstraen a la subida mínima de cada pinta (generar_apuestas_validas) y,
+      con `subidas` > 1, a las siguientes apariciones; nunca más que los dados en mesa.
+    - Tras `max_apuestas` apuestas el jugador de turno solo puede dudar o calzar, porque
+      las reglas permiten ciclos de apuestas.
+    - En ronda obligada la primera apuesta fija la pinta (modo "cerrada").
+
+El árbol se recorre una vez por iteración para todas las manos a la vez (vectores
+NumPy por jugador). La tabla de transposición guarda arrepentimientos y estrategia
+acumulada por nodo, con clave `codificar_estado(...)`, límite LRU y guardado en disco.
+Si el árbol tiene más nodos que el límite, el nodo descartado pierde lo acumulado y al
+volver a visitarlo empieza de cero, así que la estrategia deja de ser la de CFR en esos
+nodos; `descartados` cuenta cuántas veces pasó (0 = CFR exacto).
+"""
+from __future__ import annotations
+import pickle
+import string
+import time
+from collections import OrderedDict
+from collections.abc import Sequence
+from itertools import combinations_with_replacement
+from math import factorial
+
+import numpy as np
+
+from src.juego.arbitro_ronda import ArbitroRonda
+from src.juego.cacho import Cacho
+from src.juego.validador_apuesta import ValidadorApuesta
+
+DUDAR = "dudar"
+CALZAR = "calzar"
+
+
+def manos_posibles(cantidad: int) -> tuple[list[tuple[int, ...]], np.ndarray]:
+    """
+    Multiconjuntos de `cantidad` dados y su probabilidad.
+
+    Returns:
+        - tuple: (manos ordenadas, arreglo de probabilidades que suma 1)
+    """
+    manos = list(combinations_with_replacement(range(1, 7), cantidad))
+    probabilidades = []
+    for mano in manos:
+        formas = factorial(cantidad)
+        for cara in set(mano):
+            formas //= factorial(mano.count(cara))
+        probabilidades.append(formas / 6 ** cantidad)
+    return manos, np.array(probabilidades)
+
+
+def codificar_estado(dados: Sequence[int], obligado: bool, historia: Sequence[tuple[int, int]]) -> int:
+    """
+    Clave entera compacta de un nodo público: dados por jugador, obligado y apuestas.
+
+    Cada apuesta ocupa 8 bits (apariciones * 6 + pinta), así que admite hasta 41 apariciones.
+    """
+    clave = 1  # centinela: fija la longitud en bits de la clave
+    clave = (clave << 4) | len(dados)
+    for cantidad in dados:
+        clave = (clave << 3) | cantidad
+    clave = (clave << 1) | bool(obligado)
+    for apariciones, pinta in historia:
+        if apariciones > 41:
+            raise ValueError("La clave compacta admite hasta 41 apariciones por apuesta")
+        clave = (clave << 8) | (apariciones * 6 + pinta)
+    return clave
+
+
+class SolucionadorFinal:
+    """
+    CFR para un final de 2 o 3 jugadores.
+
+    Args:
+        - dados (Sequence[int]): Dados de cada jugador, en el orden en que juegan.
+        - inicial (int): Jugador que abre la ronda.
+        - asientos (int | None): Jugadores con que empezó la partida; define la regla de calce
+          (al menos asientos * 5 / 2 dados en mesa). Por defecto, len(dados).
+        - max_apuestas (int): Apuestas por ronda antes de obligar a dudar o calzar.
+        - subidas (int): Cantidades de apariciones que se consideran por pinta, desde la mínima legal.
+        - max_nodos (int): Nodos que guarda la tabla de transposición (se descartan los menos usados,
+          con sus arrepentimientos). Debe cubrir el árbol entero para que la solución sea exacta.
+    """
+
+    def __init__(self, dados: Sequence[int], inicial: int = 0, asientos: int | None = None,
+                 max_apuestas: int = 4, max_nodos: int = 200_000, subidas: int = 1):
+        if not 2 <= len(dados) <= 3 or not all(1 <= d <= 5 for d in dados):
+            raise ValueError("Se requieren 2 o 3 jugadores con 1 a 5 dados cada uno")
+        self.dados = tuple(dados)
+        self.jugadores = len(dados)
+        self.inicial = inicial
+        self.obligado = any(d == 1 for d in self.dados)
+        self.total_dados = sum(self.dados)
+        self.max_apuestas = max_apuestas
+        self.subidas = subidas
+        self.max_nodos = max_nodos
+        self.iteraciones = 0
+        # Nodos quitados de la tabla por el límite LRU; cada uno reinicia sus arrepentimientos
+        self.descartados = 0
+        self.tabla: OrderedDict[int, list] = OrderedDict()
+
+        self.validador = ValidadorApuesta()
+        self.arbitro = ArbitroRonda()
+        # Cachos de referencia solo para consultar la regla de calce del árbitro
+        self._cachos = [Cacho() for _ in range(asientos or self.jugadores)]
+        for cacho, cantidad in zip(self._cachos, self.dados + (0,) * len(self._cachos)):
+            cacho.restaurar(bytes(cantidad))
+
+        self.manos = []
+        self._probabilidades = []
+        histogramas = []
+        for cantidad in self.dados:
+            manos, probabilidades = manos_posibles(cantidad)
+            self.manos.append(manos)
+            self._probabilidades.append(probabilidades)
+            histograma = np.zeros((len(manos), 7), dtype=np.int16)
+            for i, mano in enumerate(manos):
+                for cara in mano:
+                    histograma[i, cara] += 1
+            histogramas.append(histograma)
+        self._indice_mano = [{mano: i for i, mano in enumerate(manos)} for manos in self.manos]
+
+        # Histograma de mesa para cada combinación de manos, aplanado a (M, 7)
+        forma = tuple(len(m) for m in self.manos)
+        conjunto = np.zeros(forma + (7,), dtype=np.int16)
+        for j, histograma in enumerate(histogramas):
+            vista = [1] * self.jugadores
+            vista[j] = len(histograma)
+            conjunto = conjunto + histograma.reshape(tuple(vista) + (7,))
+        self._forma = forma
+        self._histogramas_mesa = conjunto.reshape(-1, 7)
+        self._utilidades: dict[tuple, list[np.ndarray]] = {}
+
+    # ---------------------------------------------------------------------
+    # Reglas
+    # ---------------------------------------------------------------------
+    def _turno(self, historia) -> int:
+        return (self.inicial + len(historia)) % self.jugadores
+
+    def acciones(self, historia: Sequence[tuple[int, int]]) -> list:
+        """Acciones del jugador de turno tras `historia`: apuestas (apariciones, pinta), DUDAR y CALZAR."""
+        actor = self._turno(historia)
+        actual = historia[-1] if historia else None
+        acciones = []
+        if len(historia) < self.max_apuestas:
+            minimas = self.validador.generar_apuestas_validas(actual, self.dados[actor], self.obligado, self.total_dados)
+            for minimo, pinta in minimas:
+                if self.obligado and historia and pinta != historia[0][1]:
+                    continue
+                acciones.extend((apariciones, pinta) for apariciones in range(minimo, min(minimo + self.subidas, self.total_dados + 1)))
+        if actual is not None:
+            acciones.append(DUDAR)
+            if self.arbitro.validar_calzar(self._cachos, actor):
+                acciones.append(CALZAR)
+        return acciones
+
+    def _utilidad(self, accion: str, apuesta: tuple[int, int], actor: int, apostador: int) -> list[np.ndarray]:
+        clave = (accion, apuesta, actor, apostador)
+        utilidades = self._utilidades.get(clave)
+        if utilidades is None:
+            apuestas = np.broadcast_to(np.array(apuesta), (len(self._histogramas_mesa), 2))
+            otros = 1 / (self.jugadores - 1)
+            if accion == DUDAR:
+                _, perdedor = self.arbitro.dudar_lote(self._histogramas_mesa, apuestas, self.obligado, actor, apostador)
+            else:
+                _, perdedor = self.arbitro.calzar_lote(self._histogramas_mesa, apuestas, self.obligado, actor)
+            utilidades = []
+            for jugador in range(self.jugadores):
+                if accion == DUDAR:
+                    u = np.where(perdedor == jugador, -1.0, otros)
+                elif jugador == actor:
+                    u = np.where(perdedor == -1, 1.0, -1.0)
+                else:
+                    u = np.where(perdedor == -1, -otros, otros)
+                utilidades.append(u.reshape(self._forma))
+            self._utilidades[clave] = utilidades
+        return utilidades
+
+    def _valores_terminales(self, accion, historia, alcances) -> list[np.ndarray]:
+        actor = self._turno(historia)
+        apostador = (actor - 1) % self.jugadores
+        utilidades = self._utilidad(accion, historia[-1], actor, apostador)
+        # valor[i][h] = suma sobre las manos rivales de utilidad * alcance (con azar) de cada rival
+        ejes = string.ascii_lowercase[:self.jugadores]
+        valores = []
+        for i, utilidad in enumerate(utilidades):
+            operandos = [utilidad] + [alcances[j] for j in range(self.jugadores) if j != i]
+            entrada = ",".join([ejes] + [ejes[j] for j in range(self.jugadores) if j != i])
+            valores.append(np.einsum(f"{entrada}->{ejes[i]}", *operandos))
+        return valores
+
+    # ---------------------------------------------------------------------
+    # Tabla de transposición
+    # ---------------------------------------------------------------------
+    def _nodo(self, historia, acciones) -> list:
+        clave = codificar_estado(self.dados, self.obligado, historia)
+        nodo = self.tabla.get(clave)
+        if nodo is None:
+            actor = self._turno(historia)
+            forma = (len(self.manos[actor]), len(acciones))
+            nodo = [np.zeros(forma), np.zeros(forma)]  # arrepentimientos, estrategia acumulada
+            self.tabla[clave] = nodo
+            if len(self.tabla) > self.max_nodos:
+                self.tabla.popitem(last=False)
+                self.descartados += 1
+        else:
+            self.tabla.move_to_end(clave)
+        return nodo
+
+    @staticmethod
+    def _emparejar(arrepentimientos: np.ndarray) -> np.ndarray:
+        positivos = np.maximum(arrepentimientos, 0)
+        suma = positivos.sum(axis=1, keepdims=True)
+        uniforme = np.full_like(positivos, 1 / positivos.shape[1])
+        return np.divide(positivos, suma, out=uniforme, where=suma > 0)
+
+    # ---------------------------------------------------------------------
+    # CFR
+    # ---------------------------------------------------------------------
+    def _cfr(self, historia: tuple, alcances: list) -> list[np.ndarray]:
+        actor = self._turno(historia)
+        acciones = self.acciones(historia)
+        arrepentimientos, acumulada = self._nodo(historia, acciones)
+        estrategia = self._emparejar(arrepentimientos)
+
+        valores = [np.zeros(len(m)) for m in self.manos]
+        valores_accion = []
+        for a, accion in enumerate(acciones):
+            hijos = list(alcances)
+            hijos[actor] = alcances[actor] * estrategia[:, a]
+            if accion in (DUDAR, CALZAR):
+                resultado = self._valores_terminales(accion, historia, hijos)
+            else:
+                resultado = self._cfr(historia + (accion,), hijos)
+            valores_accion.append(resultado[actor])
+            for i in range(self.jugadores):
+                if i == actor:
+                    valores[i] += estrategia[:, a] * resultado[i]
+                else:
+                    valores[i] += resultado[i]
+
+        for a, valor in enumerate(valores_accion):
+            arrepentimientos[:, a] += valor - valores[actor]
+        acumulada += alcances[actor][:, None] * estrategia
+        return valores
+
+    def resolver(self, iteraciones: int = 200) -> float:
+        """Ejecuta `iteraciones` de CFR y devuelve los segundos que tomó."""
+        inicio = time.perf_counter()
+        for _ in range(iteraciones):
+            self._cfr((), list(self._probabilidades))
+            self.iteraciones += 1
+        return time.perf_counter() - inicio
+
+    # ---------------------------------------------------------------------
+    # Consultas
+    # ---------------------------------------------------------------------
+    def estrategia(self, mano: Sequence[int], historia: Sequence[tuple[int, int]] = ()) -> dict[object, float]:
+        """
+        Estrategia promedio (la que converge al equilibrio) del jugador de turno.
+
+        Args:
+            - mano (Sequence[int]): Dados propios del jugador de turno, en cualquier orden.
+            - historia (Sequence[tuple[int, int]]): Apuestas de la ronda hasta ahora.
+
+        Returns:
+            - dict: Probabilidad de cada acción (apuesta, DUDAR o CALZAR).
+
+        Raises:
+            - ValueError: Si la mano no tiene la cantidad de dados del jugador de turno.
+        """
+        historia = tuple(tuple(a) for a in historia)
+        actor = self._turno(historia)
+        acciones = self.acciones(historia)
+        fila = self._indice_mano[actor].get(tuple(sorted(mano)))
+        if fila is None:
+            raise ValueError(f"El jugador {actor} tiene {self.dados[actor]} dados, la mano {tuple(mano)} no corresponde")
+        nodo = self.tabla.get(codificar_estado(self.dados, self.obligado, historia))
+        if nodo is None or nodo[1][fila].sum() == 0:
+            return {accion: 1 / len(acciones) for accion in acciones}
+        acumulada = nodo[1][fila]
+        return dict(zip(acciones, (acumulada / acumulada.sum()).tolist()))
+
+    def valor(self) -> list[float]:
+        """Utilidad esperada de cada jugador si todos siguen la estrategia promedio."""
+        valores = self._evaluar((), list(self._probabilidades))
+        # Los valores de cada jugador no incluyen el azar de su propia mano
+        return [float(v @ p) for v, p in zip(valores, self._probabilidades)]
+
+    def _evaluar(self, historia: tuple, alcances: list) -> list[np.ndarray]:
+        actor = self._turno(historia)
+        acciones = self.acciones(historia)
+        nodo = self.tabla.get(codificar_estado(self.dados, self.obligado, historia))
+        if nodo is None:
+            estrategia = np.full((len(self.manos[actor]), len(acciones)), 1 / len(acciones))
+        else:
+            suma = nodo[1].sum(axis=1, keepdims=True)
+            estrategia = np.divide(nodo[1], suma, out=np.full_like(nodo[1], 1 / len(acciones)), where=suma > 0)
+        valores = [np.zeros(len(m)) for m in self.manos]
+        for a, accion in enumerate(acciones):
+            hijos = list(alcances)
+            hijos[actor] = alcances[actor] * estrategia[:, a]
+            if accion in (DUDAR, CALZAR):
+                resultado = self._valores_terminales(accion, historia, hijos)
+            else:
+                resultado = self._evaluar(historia + (accion,), hijos)
+            for i in range(self.jugadores):
+                # Los valores ya vienen ponderados por el alcance del que actúa, salvo el suyo propio
+                valores[i] += estrategia[:, a] * resultado[i] if i == actor else resultado[i]
+        return valores
+
+    # ---------------------------------------------------------------------
+    # Persistencia
+    # ---------------------------------------------------------------------
+    def guardar(self, ruta: str) -> None:
+        """Guarda la tabla de transposición y la configuración en `ruta` (pickle)."""
+        configuracion = (self.dados, self.inicial, len(self._cachos), self.max_apuestas, self.max_nodos, self.subidas)
+        with open(ruta, "wb") as archivo:
+            pickle.dump((configuracion, self.iteraciones, self.tabla), archivo, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def cargar(cls, ruta: str) -> "SolucionadorFinal":
+        """Reconstruye un solucionador guardado con `guardar`; se puede seguir resolviendo."""
+        with open(ruta, "rb") as archivo:
+            configuracion, iteraciones, tabla = pickle.load(archivo)
+        solucionador = cls(*configuracion)
+        solucionador.iteraciones = iteraciones
+        solucionador.tabla = tabla
+        return solucionador
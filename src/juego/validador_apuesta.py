@@ -1,4 +1,37 @@
 import math 
+import operator
+from functools import lru_cache
+
+
+@lru_cache(maxsize=4096)
+def _tabla_minimos(apuesta_actual, obligado, un_dado):
+    """
+    Mínimo de apariciones legal para cada pinta, con las mismas reglas de validar_apuesta.
+
+    Returns:
+        tuple: 6 elementos, uno por pinta (1 a 6); None si ninguna apuesta a esa pinta es legal.
+    """
+    if apuesta_actual is None:
+        return tuple(1 if pinta != 1 or un_dado else None for pinta in range(1, 7))
+
+    apariciones_actual, pinta_actual = apuesta_actual
+    minimos = []
+    for pinta in range(1, 7):
+        if obligado and pinta > pinta_actual and not un_dado:
+            minimos.append(None)
+        elif pinta_actual == 1:
+            #Desde As: a otra pinta el doble más uno, a As subir al menos uno
+            minimos.append(apariciones_actual * 2 + 1 if pinta != 1 else apariciones_actual + 1)
+        elif pinta == 1:
+            #Hacia As: la mitad más uno si es par, la mitad hacia arriba si es impar
+            minimos.append(apariciones_actual // 2 + 1 if apariciones_actual % 2 == 0 else (apariciones_actual + 1) // 2)
+        elif pinta > pinta_actual:
+            minimos.append(1)
+        else:
+            minimos.append(apariciones_actual + 1)
+    return tuple(minimos)
+
+
 class ValidadorApuesta:
     """
     Validador de apuestas para el dudo chileno, está encargado de validar si una apuesta es válida.
@@ -74,5 +107,37 @@ class ValidadorApuesta:
         if (pinta_nueva <= pinta_actual and apariciones_nueva <= apariciones_actual):
             return False
         return True
-        
 
+    def generar_apuestas_validas(self, apuesta_actual, cantidad_dados, obligado, total_dados):
+        """
+        Entrega la apuesta legal mínima de cada pinta, sin probar candidato por candidato.
+
+        Args:
+            - apuesta_actual (tuple[int, int] | None): Apuesta vigente (apariciones, pinta), None si es la primera de la ronda.
+            - cantidad_dados (int): Cantidad de dados del jugador que va a apostar.
+            - obligado (bool): True si la ronda es obligada.
+            - total_dados (int): Dados en la mesa; no se entregan apuestas con más apariciones que esto.
+
+        Returns:
+            list[tuple[int, int]]:
+                Una apuesta (apariciones, pinta) por cada pinta que tenga alguna apuesta legal, ordenadas por pinta.
+                Cualquier apuesta a esa pinta con más apariciones también es legal.
+
+        Raises:
+            - ValueError: Si apuesta_actual no es un par de enteros con apariciones >= 1 y pinta de 1 a 6.
+        """
+        if apuesta_actual is not None:
+            # La tabla se guarda por apuesta: solo se aceptan claves enteras y en rango
+            try:
+                apariciones, pinta = (operator.index(v) for v in apuesta_actual)
+            except (TypeError, ValueError):
+                raise ValueError(f"Apuesta inválida: {apuesta_actual!r}") from None
+            if apariciones < 1 or not 1 <= pinta <= 6:
+                raise ValueError(f"Apuesta inválida: {apuesta_actual!r}")
+            apuesta_actual = (apariciones, pinta)
+        minimos = _tabla_minimos(apuesta_actual, bool(obligado), cantidad_dados == 1)
+        return [
+            (minimo, pinta)
+            for pinta, minimo in enumerate(minimos, start=1)
+            if minimo is not None and minimo <= total_dados
+        ]
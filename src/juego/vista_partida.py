@@ -0,0 +1,91 @@
+class VistaPartida:
+    """
+    Lo que un jugador puede ver de la partida desde su asiento, sin poder modificarla.
+
+    Expone el estado público (apuesta vigente, dados de cada jugador, ronda obligada,
+    sentido) y solo los dados propios. Los nombres coinciden con los de GestorPartida,
+    así una estrategia escrita para la vista lee lo mismo que leería del gestor. La vista
+    no copia nada: lee el estado de la partida en el momento de la consulta, por lo que
+    se crea una vez por asiento y sirve toda la partida.
+    """
+
+    __slots__ = ("_partida", "asiento")
+
+    def __init__(self, partida, asiento: int):
+        self._partida = partida
+        self.asiento = asiento
+
+    def __setattr__(self, nombre, valor):
+        if hasattr(self, "asiento"):
+            raise AttributeError("VistaPartida es de solo lectura")
+        object.__setattr__(self, nombre, valor)
+
+    # Estado público de la ronda
+    @property
+    def apuesta_actual(self):
+        return self._partida.apuesta_actual
+
+    @property
+    def indice_ultimo_apostador(self):
+        return self._partida.indice_ultimo_apostador
+
+    @property
+    def obligado(self) -> bool:
+        return self._partida.obligado
+
+    @property
+    def modo_obligado(self):
+        return self._partida.modo_obligado
+
+    @property
+    def pinta_fija(self):
+        return self._partida.pinta_fija
+
+    @property
+    def sentido(self) -> str:
+        return self._partida.sentido
+
+    @property
+    def jugadores(self) -> int:
+        return len(self._partida.cachos)
+
+    @property
+    def activos(self) -> list[int]:
+        return self._partida.activos
+
+    def total_dados_en_mesa(self) -> int:
+        return self._partida.mesa.total_dados
+
+    def cantidad_dados(self, idx: int) -> int:
+        """Dados que tiene el jugador `idx` (es información pública)."""
+        return self._partida.cachos[idx].cantidad_dados()
+
+    def siguiente_jugador(self, idx: int) -> int:
+        return self._partida.siguiente_jugador(idx)
+
+    # Dados propios: la vista se puede usar como cacho en ProbabilidadRonda
+    def get_valores(self) -> bytes:
+        return self._partida.cachos[self.asiento].get_valores()
+
+    def get_histograma(self) -> tuple:
+        return tuple(self._partida.cachos[self.asiento].get_histograma())
+
+    # Acciones legales
+    def apuestas_validas(self) -> list[tuple[int, int]]:
+        """La apuesta legal mínima de cada pinta para este asiento (respeta la pinta fija del obligado)."""
+        partida = self._partida
+        opciones = partida.validador.generar_apuestas_validas(
+            partida.apuesta_actual,
+            partida.cachos[self.asiento].cantidad_dados(),
+            partida.obligado,
+            partida.mesa.total_dados,
+        )
+        if partida.obligado and partida.pinta_fija is not None:
+            opciones = [opcion for opcion in opciones if opcion[1] == partida.pinta_fija]
+        return opciones
+
+    def puede_calzar(self) -> bool:
+        partida = self._partida
+        return partida.apuesta_actual is not None and partida.arbitro.validar_calzar(
+            partida.cachos, self.asiento, partida.mesa
+        )
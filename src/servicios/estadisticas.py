@@ -0,0 +1,253 @@
+"""
+Estadísticas de balance de reglas calculadas en flujo sobre los eventos de las partidas.
+
+Los eventos son las tuplas (tipo, jugador, datos) de registro_partida: salen igual de
+`leer_eventos` (partidas grabadas) que de `eventos_simulados` (partidas sin consola
+jugadas en el momento), así que el mismo análisis sirve para ambos. EstadisticasReglas
+los consume de a uno y guarda solo agregados de tamaño fijo: contadores, medias y
+varianzas de Welford e histogramas de celdas fijas. Dos agregados se combinan con
+`fusionar`; los contadores e histogramas quedan idénticos a los de una sola pasada y
+las medias y varianzas coinciden salvo redondeo de punto flotante.
+
+Uso:
+    estadisticas = estadisticas_en_paralelo([JugadorAleatorio] * 4, partidas=100_000)
+    print(estadisticas.resumen())
+"""
+from __future__ import annotations
+import os
+from collections.abc import Iterable, Iterator
+
+from src.juego.partida_headless import jugar_partida
+from src.servicios.generador_aleatorio import Generador_Aleatorio
+from src.servicios.registro_partida import Evento, RegistroEventos
+
+
+class Welford:
+    """Media y varianza en una pasada (Welford); `fusionar` usa la fórmula de Chan et al."""
+
+    __slots__ = ("n", "media", "m2")
+
+    def __init__(self):
+        self.n = 0
+        self.media = 0.0
+        self.m2 = 0.0
+
+    def agregar(self, valor: float) -> None:
+        self.n += 1
+        delta = valor - self.media
+        self.media += delta / self.n
+        self.m2 += delta * (valor - self.media)
+
+    def fusionar(self, otro: "Welford") -> None:
+        if otro.n == 0:
+            return
+        n = self.n + otro.n
+        delta = otro.media - self.media
+        self.media += delta * otro.n / n
+        self.m2 += otro.m2 + delta * delta * self.n * otro.n / n
+        self.n = n
+
+    @property
+    def varianza(self) -> float:
+        """Varianza muestral (0 con menos de dos valores)."""
+        return self.m2 / (self.n - 1) if self.n > 1 else 0.0
+
+
+class Histograma:
+    """Conteos en celdas de ancho fijo desde `minimo`; la última celda acumula lo que se pasa."""
+
+    __slots__ = ("minimo", "ancho", "conteos")
+
+    def __init__(self, minimo: int, ancho: int, celdas: int):
+        self.minimo = minimo
+        self.ancho = ancho
+        self.conteos = [0] * celdas
+
+    def agregar(self, valor: float) -> None:
+        celda = int((valor - self.minimo) // self.ancho)
+        self.conteos[min(max(celda, 0), len(self.conteos) - 1)] += 1
+
+    def fusionar(self, otro: "Histograma") -> None:
+        if (otro.minimo, otro.ancho, len(otro.conteos)) != (self.minimo, self.ancho, len(self.conteos)):
+            raise ValueError("Solo se pueden fusionar histogramas con las mismas celdas")
+        self.conteos = [a + b for a, b in zip(self.conteos, otro.conteos)]
+
+
+class EstadisticasReglas:
+    """
+    Agregados de balance de reglas: victorias por asiento y por posición respecto de quien
+    inicia, aciertos de dudas y calces, duración de las partidas y uso del obligado.
+    """
+
+    _CONTADORES = (
+        "partidas", "dudas", "dudas_acertadas", "calces", "calces_acertados", "calces_no_permitidos",
+        "rondas_jugadas", "rondas_obligadas", "obligado_abierta", "obligado_cerrada",
+    )
+
+    def __init__(self):
+        for nombre in self._CONTADORES:
+            setattr(self, nombre, 0)
+        self.victorias_por_asiento: list[int] = []
+        self.victorias_por_posicion: list[int] = []  # 0 = quien inició la partida, 1 = el siguiente en el sentido de juego...
+        self.rondas = Welford()
+        self.apuestas_por_ronda = Welford()
+        self.histograma_rondas = Histograma(0, 5, 20)
+        # Estado de la partida en curso
+        self._dados: list[int] = []
+        self._inicial = 0
+        self._paso = 1  # +1 si se juega hacia la derecha (índices crecientes), -1 hacia la izquierda
+        self._apuestas_ronda = 0
+        self._rondas_partida = 0
+
+    def consumir(self, eventos: Iterable[Evento]) -> "EstadisticasReglas":
+        """Actualiza los agregados con `eventos` (una o más partidas completas) y se devuelve a sí mismo."""
+        for tipo, jugador, datos in eventos:
+            if tipo == "apuesta":
+                self._apuestas_ronda += datos[1]
+            elif tipo == "ronda":
+                self._rondas_partida += 1
+                self.rondas_jugadas += 1
+                self.rondas_obligadas += datos[0]
+            elif tipo == "duda":
+                self.dudas += 1
+                self.dudas_acertadas += datos[0]
+                self._dados[datos[1]] = datos[2]
+                self._cerrar_ronda()
+            elif tipo == "calce":
+                if datos[0] is None:
+                    self.calces_no_permitidos += 1
+                    continue
+                self.calces += 1
+                self.calces_acertados += datos[0]
+                self._dados[jugador] = datos[1]
+                self._cerrar_ronda()
+            elif tipo == "obligado":
+                if datos[0] == "abierta":
+                    self.obligado_abierta += 1
+                elif datos[0] == "cerrada":
+                    self.obligado_cerrada += 1
+            elif tipo == "inicio":
+                self._cerrar_partida()
+                self._dados = [5] * jugador
+                self._rondas_partida = 0
+                self._paso = 1
+            elif tipo == "inicial":
+                self._inicial = jugador
+            elif tipo == "sentido":
+                self._paso = 1 if datos[0] == "derecha" else -1
+        self._cerrar_partida()
+        return self
+
+    def _cerrar_ronda(self) -> None:
+        self.apuestas_por_ronda.agregar(self._apuestas_ronda)
+        self._apuestas_ronda = 0
+
+    def _cerrar_partida(self) -> None:
+        con_dados = [asiento for asiento, dados in enumerate(self._dados) if dados]
+        if len(con_dados) == 1:
+            ganador = con_dados[0]
+            jugadores = len(self._dados)
+            for conteos in (self.victorias_por_asiento, self.victorias_por_posicion):
+                conteos.extend([0] * (jugadores - len(conteos)))
+            self.victorias_por_asiento[ganador] += 1
+            self.victorias_por_posicion[(ganador - self._inicial) * self._paso % jugadores] += 1
+            self.partidas += 1
+            self.rondas.agregar(self._rondas_partida)
+            self.histograma_rondas.agregar(self._rondas_partida)
+        # Una partida sin terminar no se cuenta
+        self._dados = []
+
+    def fusionar(self, otro: "EstadisticasReglas") -> "EstadisticasReglas":
+        """Suma a este agregado los de `otro` (por ejemplo, el de otro proceso)."""
+        for nombre in self._CONTADORES:
+            setattr(self, nombre, getattr(self, nombre) + getattr(otro, nombre))
+        for nombre in ("victorias_por_asiento", "victorias_por_posicion"):
+            propios, ajenos = getattr(self, nombre), getattr(otro, nombre)
+            propios.extend([0] * (len(ajenos) - len(propios)))
+            for i, cantidad in enumerate(ajenos):
+                propios[i] += cantidad
+        self.rondas.fusionar(otro.rondas)
+        self.apuestas_por_ronda.fusionar(otro.apuestas_por_ronda)
+        self.histograma_rondas.fusionar(otro.histograma_rondas)
+        return self
+
+    def resumen(self) -> dict:
+        """Tasas listas para informar (las tasas sin casos son 0)."""
+        def tasa(parte, total):
+            return parte / total if total else 0.0
+
+        return {
+            "partidas": self.partidas,
+            "victorias_por_asiento": [tasa(v, self.partidas) for v in self.victorias_por_asiento],
+            "victorias_por_posicion": [tasa(v, self.partidas) for v in self.victorias_por_posicion],
+            "dudas_acertadas": tasa(self.dudas_acertadas, self.dudas),
+            "calces_acertados": tasa(self.calces_acertados, self.calces),
+            "rondas_media": self.rondas.media,
+            "rondas_desviacion": self.rondas.varianza ** 0.5,
+            "apuestas_por_ronda": self.apuestas_por_ronda.media,
+            "rondas_obligadas": tasa(self.rondas_obligadas, self.rondas_jugadas),
+            "obligado_abierta": tasa(self.obligado_abierta, self.obligado_abierta + self.obligado_cerrada),
+        }
+
+
+def eventos_simulados(fabricas: list, partidas: int, semilla: int = 0, desde: int = 0) -> Iterator[Evento]:
+    """
+    Juega partidas sin consola y entrega sus eventos a medida que terminan.
+
+    Solo se guardan los eventos de la partida en curso. La partida número `i` usa semillas
+    derivadas de (semilla, i), así que un rango de partidas da lo mismo en cualquier proceso.
+    """
+    base = Generador_Aleatorio(semilla)
+    registro = RegistroEventos()
+    for partida in range(desde, desde + partidas):
+        jugadores = [fabrica(f"{semilla}/{partida}/{asiento}") for asiento, fabrica in enumerate(fabricas)]
+        jugar_partida(jugadores, base.derivar(partida), registro)
+        yield from registro.eventos
+        registro.eventos.clear()
+
+
+def _estadisticas_de_lote(fabricas: list, partidas: int, semilla: int, desde: int) -> EstadisticasReglas:
+    return EstadisticasReglas().consumir(eventos_simulados(fabricas, partidas, semilla, desde))
+
+
+def estadisticas_en_paralelo(
+    fabricas: list,
+    partidas: int,
+    procesos: int | None = None,
+    semilla: int = 0,
+    tamano_lote: int = 1000,
+) -> EstadisticasReglas:
+    """
+    Calcula EstadisticasReglas de muchas partidas repartidas en lotes y fusiona los parciales.
+
+    Args:
+        - fabricas (list): Una por asiento; se llama con una semilla y devuelve la estrategia.
+        - partidas (int): Total de partidas.
+        - procesos (int | None): Procesos del pool (None = núcleos disponibles, 1 = sin pool).
+        - semilla (int): Semilla base.
+        - tamano_lote (int): Partidas por tarea; cada tarea devuelve solo su agregado.
+
+    Returns:
+        - EstadisticasReglas: Agregado de todas las partidas.
+    """
+    lotes = [(desde, min(tamano_lote, partidas - desde)) for desde in range(0, partidas, tamano_lote)]
+    total = EstadisticasReglas()
+    if procesos == 1:
+        for desde, cantidad in lotes:
+            total.fusionar(_estadisticas_de_lote(fabricas, cantidad, semilla, desde))
+        return total
+
+    # El pool se importa solo si se usa: los procesos de trabajo no lo necesitan
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=procesos or os.cpu_count()) as pool:
+        parciales = pool.map(
+            _estadisticas_de_lote,
+            [fabricas] * len(lotes),
+            [cantidad for _, cantidad in lotes],
+            [semilla] * len(lotes),
+            [desde for desde, _ in lotes],
+        )
+        for parcial in parciales:
+            total.fusionar(parcial)
+    return total
@@ -1,5 +1,69 @@
 import random
 
+CARAS = (1, 2, 3, 4, 5, 6)
+
+
 class Generador_Aleatorio:
+    """
+    Fuente de valores de dado inyectable en Dado, Cacho y GestorPartida.
+
+    Sin semilla usa el módulo global `random`, igual que antes. Con semilla usa
+    su propio `random.Random`, de modo que una partida se puede repetir, y los
+    valores salen de un buffer que se rellena en bloque.
+
+    Cualquier objeto con `generar()` y `generar_muchos(n)` sirve como fuente.
+    """
+
+    def __init__(self, semilla=None, tamano_buffer=256):
+        self.tamano_buffer = tamano_buffer
+        self.sembrar(semilla)
+
+    def sembrar(self, semilla):
+        """Reinicia el generador con una nueva semilla (None vuelve al módulo global `random`)."""
+        self.semilla = semilla
+        self._rng = None if semilla is None else random.Random(semilla)
+        self._buffer = []
+        self._posicion = 0
+
+    def derivar(self, indice):
+        """
+        Crea un flujo independiente y reproducible, por ejemplo uno por mesa o por proceso.
+
+        Args:
+            - indice (int): Identificador del flujo. El mismo índice con la misma semilla da siempre la misma secuencia.
+
+        Returns:
+            - Generador_Aleatorio: Generador nuevo con semilla derivada de la semilla propia y el índice.
+        """
+        semilla = self.semilla if self.semilla is not None else random.getrandbits(64)
+        return Generador_Aleatorio(f"{semilla}/{indice}", self.tamano_buffer)
+
     def generar(self):
-        return random.randint(1,6)
+        if self._rng is None:
+            return random.randint(1, 6)
+        if self._posicion >= len(self._buffer):
+            self._rellenar(self.tamano_buffer)
+        valor = self._buffer[self._posicion]
+        self._posicion += 1
+        return valor
+
+    def generar_muchos(self, n):
+        """Devuelve una lista con `n` valores; con semilla es la misma secuencia que `n` llamadas a generar()."""
+        if self._rng is None:
+            return [random.randint(1, 6) for _ in range(n)]
+        fin = self._posicion + n
+        if fin > len(self._buffer):
+            self._rellenar(max(self.tamano_buffer, n))
+            fin = n
+        valores = self._buffer[self._posicion:fin]
+        self._posicion = fin
+        return valores
+
+    def _rellenar(self, cantidad):
+        # Se conservan los valores aún no usados para no alterar la secuencia
+        pendientes = self._buffer[self._posicion:]
+        self._buffer = pendientes + self._rng.choices(CARAS, k=cantidad)
+        self._posicion = 0
+
+
+generador_por_defecto = Generador_Aleatorio()
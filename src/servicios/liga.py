@@ -0,0 +1,282 @@
+"""
+Simulación de ligas repartida en fragmentos con los totales en memoria compartida.
+
+Cada fragmento es un rango contiguo de partidas que juega un proceso. Los totales de
+cada fragmento (victorias, duración de las partidas, dudas, calces, dados perdidos) van
+en una fila de enteros de 64 bits de un bloque `multiprocessing.shared_memory`: el
+proceso escribe ahí directamente mientras juega, a través del mismo protocolo de
+`registro` que usa GestorPartida, y no devuelve nada por la cola del pool. Al terminar,
+el proceso principal suma las filas.
+
+Cada partida usa un flujo de dados y semillas de estrategia derivados de
+(semilla, número de partida), así el resultado no depende de cuántos fragmentos o
+procesos se usen. Con `punto_control` cada fragmento guarda su fila cada
+`cada_partidas` partidas completas; al volver a llamar con el mismo directorio se
+cargan las filas guardadas y cada fragmento sigue desde su última partida guardada,
+con el mismo resultado que sin interrupción.
+"""
+from __future__ import annotations
+import json
+import os
+import time
+from functools import partial
+from multiprocessing import shared_memory
+
+from src.juego.partida_headless import jugar_partida
+from src.servicios.generador_aleatorio import Generador_Aleatorio
+
+# Duraciones (en rondas) del histograma; la última celda acumula las más largas
+RONDAS_MAX = 64
+_CONTADORES = ("partidas", "rondas", "apuestas", "dudas", "dudas_acertadas", "calces", "calces_acertados", "rondas_obligadas")
+
+
+def campos(asientos: int) -> dict:
+    """Posición (inicio, largo) de cada campo en la fila de un fragmento."""
+    posiciones = {}
+    inicio = 0
+    for nombre, largo in [(nombre, 1) for nombre in _CONTADORES] + [
+        ("victorias", asientos),
+        ("dados_perdidos", asientos),
+        ("duracion", RONDAS_MAX + 1),
+    ]:
+        posiciones[nombre] = (inicio, largo)
+        inicio += largo
+    return posiciones
+
+
+def ancho_fila(asientos: int) -> int:
+    return sum(largo for _, largo in campos(asientos).values())
+
+
+class ContadorFila:
+    """Registro de GestorPartida que suma los eventos de la partida en una fila de la memoria compartida."""
+
+    def __init__(self, fila: memoryview, asientos: int):
+        self.fila = fila
+        posiciones = campos(asientos)
+        self._dudas = posiciones["dudas"][0]
+        self._calces = posiciones["calces"][0]
+        self._obligadas = posiciones["rondas_obligadas"][0]
+        self._perdidos = posiciones["dados_perdidos"][0]
+
+    # Eventos que no se cuentan
+    def inicio(self, jugadores):
+        pass
+
+    def tiradas(self, valores):
+        pass
+
+    def inicial(self, jugador):
+        pass
+
+    def sentido(self, sentido):
+        pass
+
+    def obligado(self, modo, pinta_fija):
+        pass
+
+    def apuesta(self, jugador, apuesta, aceptada):
+        pass
+
+    def ronda(self, cachos, obligado):
+        if obligado:
+            self.fila[self._obligadas] += 1
+
+    def duda(self, jugador, resultado, perdedor, cacho_perdedor):
+        fila = self.fila
+        fila[self._dudas] += 1
+        fila[self._dudas + 1] += resultado
+        fila[self._perdidos + perdedor] += 1
+
+    def calce(self, jugador, resultado, cacho):
+        fila = self.fila
+        fila[self._calces] += 1
+        if resultado:
+            fila[self._calces + 1] += 1
+        else:
+            fila[self._perdidos + jugador] += 1
+
+
+def _ruta_fragmento(punto_control: str, fragmento: int) -> str:
+    return os.path.join(punto_control, f"fragmento_{fragmento:04d}.bin")
+
+
+def _guardar_fila(ruta: str, fila: memoryview) -> None:
+    temporal = f"{ruta}.{os.getpid()}.tmp"
+    with open(temporal, "wb") as archivo:
+        archivo.write(fila.tobytes())
+    os.replace(temporal, ruta)
+
+
+def _jugar_fragmento(
+    nombre_memoria: str,
+    fragmento: int,
+    desde: int,
+    hasta: int,
+    fabricas: list,
+    semilla: int,
+    punto_control: str | None,
+    cada_partidas: int,
+) -> None:
+    """Juega las partidas [desde, hasta) que aún no estén contadas en la fila del fragmento."""
+    asientos = len(fabricas)
+    ancho = ancho_fila(asientos)
+    memoria = shared_memory.SharedMemory(name=nombre_memoria)
+    enteros = memoria.buf.cast("q")
+    fila = enteros[fragmento * ancho:(fragmento + 1) * ancho]
+    try:
+        posiciones = campos(asientos)
+        victorias = posiciones["victorias"][0]
+        duracion = posiciones["duracion"][0]
+        contador = ContadorFila(fila, asientos)
+        base = Generador_Aleatorio(semilla)
+        for partida in range(desde + fila[0], hasta):
+            jugadores = [fabrica(f"{semilla}/{partida}/{asiento}") for asiento, fabrica in enumerate(fabricas)]
+            resultado = jugar_partida(jugadores, base.derivar(partida), contador)
+            fila[victorias + resultado["ganador"]] += 1
+            fila[duracion + min(resultado["rondas"], RONDAS_MAX)] += 1
+            fila[1] += resultado["rondas"]
+            fila[2] += resultado["apuestas"]
+            # partidas va al final: una fila guardada solo cuenta partidas completas
+            fila[0] += 1
+            if punto_control is not None and fila[0] % cada_partidas == 0:
+                _guardar_fila(_ruta_fragmento(punto_control, fragmento), fila)
+        if punto_control is not None:
+            _guardar_fila(_ruta_fragmento(punto_control, fragmento), fila)
+    finally:
+        # Las vistas se liberan antes de cerrar: close() falla si queda alguna
+        fila.release()
+        enteros.release()
+        memoria.close()
+
+
+def _nombre_fabrica(fabrica) -> str:
+    """
+    Nombre estable de una fábrica para liga.json.
+
+    Un `partial` (como `partial(JugadorTabla, ruta)`) se nombra por su función y sus
+    argumentos; los argumentos que no son valores simples se nombran por su tipo, porque
+    su repr suele incluir una dirección de memoria que cambia en cada ejecución.
+    """
+    if isinstance(fabrica, partial):
+        argumentos = [_forma_estable(valor) for valor in fabrica.args]
+        argumentos += [f"{clave}={_forma_estable(valor)}" for clave, valor in sorted(fabrica.keywords.items())]
+        return f"{_nombre_fabrica(fabrica.func)}({', '.join(argumentos)})"
+    if not hasattr(fabrica, "__qualname__"):
+        fabrica = type(fabrica)
+    return f"{fabrica.__module__}.{fabrica.__qualname__}"
+
+
+def _forma_estable(valor) -> str:
+    if valor is None or isinstance(valor, (bool, int, float, str, bytes)):
+        return repr(valor)
+    if isinstance(valor, (tuple, list)):
+        return f"[{', '.join(_forma_estable(elemento) for elemento in valor)}]"
+    return _nombre_fabrica(valor)
+
+
+def _preparar_punto_control(punto_control: str, parametros: dict) -> None:
+    os.makedirs(punto_control, exist_ok=True)
+    ruta = os.path.join(punto_control, "liga.json")
+    if os.path.exists(ruta):
+        with open(ruta, encoding="utf-8") as archivo:
+            guardados = json.load(archivo)
+        if guardados != parametros:
+            raise ValueError(f"El punto de control {punto_control} es de otra liga: {guardados}")
+    else:
+        with open(ruta, "w", encoding="utf-8") as archivo:
+            json.dump(parametros, archivo)
+
+
+def jugar_liga(
+    fabricas: list,
+    partidas: int,
+    procesos: int | None = None,
+    semilla: int = 0,
+    fragmentos: int | None = None,
+    punto_control: str | None = None,
+    cada_partidas: int = 1000,
+) -> dict:
+    """
+    Juega una liga repartida en fragmentos y suma los totales escritos en memoria compartida.
+
+    Args:
+        - fabricas (list): Una por asiento; se llama con una semilla y devuelve la estrategia.
+          Deben poder enviarse a otro proceso (clases, funciones de módulo o `partial` de ellas).
+        - partidas (int): Total de partidas.
+        - procesos (int | None): Procesos del pool (None = núcleos disponibles, 1 = sin pool).
+        - semilla (int): Semilla base de la liga.
+        - fragmentos (int | None): Rangos de partidas en que se divide la liga (None = 4 por proceso).
+        - punto_control (str | None): Directorio donde cada fragmento guarda su avance; si ya
+          tiene avance de la misma liga, se continúa desde ahí.
+        - cada_partidas (int): Cada cuántas partidas guarda su fila un fragmento.
+
+    Returns:
+        - dict: totales de la liga (los de `campos`, con listas para victorias, dados_perdidos
+          y duracion), partidas retomadas del punto de control, segundos y partidas por segundo.
+
+    Raises:
+        - ValueError: Si `punto_control` pertenece a una liga con otros parámetros.
+    """
+    procesos = procesos or os.cpu_count() or 1
+    fragmentos = fragmentos or min(partidas, 4 * procesos) or 1
+    asientos = len(fabricas)
+    ancho = ancho_fila(asientos)
+    limites = [partidas * i // fragmentos for i in range(fragmentos + 1)]
+
+    if punto_control is not None:
+        _preparar_punto_control(punto_control, {
+            "estrategias": [_nombre_fabrica(fabrica) for fabrica in fabricas],
+            "partidas": partidas,
+            "semilla": semilla,
+            "fragmentos": fragmentos,
+            "ancho_fila": ancho,
+        })
+
+    memoria = shared_memory.SharedMemory(create=True, size=max(fragmentos * ancho * 8, 8))
+    enteros = memoria.buf.cast("q")
+    try:
+        for i in range(len(enteros)):
+            enteros[i] = 0
+        if punto_control is not None:
+            for fragmento in range(fragmentos):
+                ruta = _ruta_fragmento(punto_control, fragmento)
+                if os.path.exists(ruta):
+                    with open(ruta, "rb") as archivo:
+                        enteros[fragmento * ancho:(fragmento + 1) * ancho] = memoryview(archivo.read()).cast("q")
+        retomadas = sum(enteros[fragmento * ancho] for fragmento in range(fragmentos))
+
+        tareas = [
+            (memoria.name, fragmento, limites[fragmento], limites[fragmento + 1], fabricas, semilla, punto_control, cada_partidas)
+            for fragmento in range(fragmentos)
+        ]
+        inicio = time.perf_counter()
+        if procesos == 1:
+            for tarea in tareas:
+                _jugar_fragmento(*tarea)
+        else:
+            # El pool se importa solo si se usa: los procesos de trabajo no lo necesitan
+            from concurrent.futures import ProcessPoolExecutor
+
+            with ProcessPoolExecutor(max_workers=procesos) as pool:
+                for futuro in [pool.submit(_jugar_fragmento, *tarea) for tarea in tareas]:
+                    futuro.result()
+        segundos = time.perf_counter() - inicio
+
+        # Pasada final: se suman las filas de todos los fragmentos
+        totales = [0] * ancho
+        for posicion, valor in enumerate(enteros):
+            totales[posicion % ancho] += valor
+    finally:
+        enteros.release()
+        memoria.close()
+        memoria.unlink()
+
+    resultado = {}
+    for nombre, (posicion, largo) in campos(asientos).items():
+        resultado[nombre] = totales[posicion] if nombre in _CONTADORES else totales[posicion:posicion + largo]
+    jugadas = resultado["partidas"] - retomadas
+    resultado["retomadas"] = retomadas
+    resultado["segundos"] = segundos
+    resultado["partidas_por_segundo"] = jugadas / segundos if segundos > 0 else float("inf")
+    return resultado
@@ -0,0 +1,108 @@
+"""
+Métricas opcionales de GestorPartida: contadores y latencias por operación.
+
+La instrumentación no toca la clase: `instrumentar` reemplaza, solo en la instancia
+indicada, los métodos medidos por envoltorios que anotan en un objeto Metricas. Una
+partida sin instrumentar ejecuta exactamente el mismo código de siempre, así que
+desactivada no cuesta nada, y GestorPartida sigue siendo lógica pura sin I/O:
+exportar las métricas es responsabilidad de quien las consulta.
+
+Uso:
+    metricas = Metricas()
+    instrumentar(partida, metricas)
+    ...
+    print(metricas.a_prometheus())
+    metricas.exportar("/var/lib/node_exporter/dudo.prom")
+"""
+from __future__ import annotations
+import os
+import time
+from bisect import bisect_left
+
+OPERACIONES = ("iniciar_ronda", "apostar", "dudar", "calzar", "determinar_inicial")
+
+# Límites superiores (en segundos) de los buckets del histograma de latencias
+LIMITES_LATENCIA = (1e-6, 2.5e-6, 5e-6, 1e-5, 2.5e-5, 5e-5, 1e-4, 2.5e-4, 5e-4, 1e-3, 1e-2)
+
+
+class Metricas:
+    """Contadores y histogramas de latencia acumulados por una o varias partidas."""
+
+    def __init__(self, limites=LIMITES_LATENCIA):
+        self.limites = tuple(limites)
+        self.llamadas: dict[str, int] = dict.fromkeys(OPERACIONES, 0)
+        self.segundos: dict[str, float] = dict.fromkeys(OPERACIONES, 0.0)
+        # buckets[op][i] cuenta las llamadas con latencia <= limites[i]; el último es +Inf
+        self.buckets: dict[str, list[int]] = {op: [0] * (len(self.limites) + 1) for op in OPERACIONES}
+        self.apuestas_rechazadas = 0
+        self.calces_no_permitidos = 0
+        self.dudas_acertadas = 0
+        self.calces_acertados = 0
+
+    def observar(self, operacion: str, segundos: float) -> None:
+        self.llamadas[operacion] += 1
+        self.segundos[operacion] += segundos
+        self.buckets[operacion][bisect_left(self.limites, segundos)] += 1
+
+    def a_prometheus(self, prefijo: str = "dudo") -> str:
+        """Devuelve las métricas en el formato de texto de Prometheus."""
+        lineas = [
+            f"# HELP {prefijo}_operacion_segundos Latencia de las operaciones de GestorPartida.",
+            f"# TYPE {prefijo}_operacion_segundos histogram",
+        ]
+        for op in OPERACIONES:
+            acumulado = 0
+            for limite, cantidad in zip(self.limites + (float("inf"),), self.buckets[op]):
+                acumulado += cantidad
+                le = "+Inf" if limite == float("inf") else repr(limite)
+                lineas.append(f'{prefijo}_operacion_segundos_bucket{{operacion="{op}",le="{le}"}} {acumulado}')
+            lineas.append(f'{prefijo}_operacion_segundos_sum{{operacion="{op}"}} {self.segundos[op]!r}')
+            lineas.append(f'{prefijo}_operacion_segundos_count{{operacion="{op}"}} {self.llamadas[op]}')
+
+        contadores = (
+            ("apuestas_rechazadas_total", "Apuestas que apostar() rechazó.", self.apuestas_rechazadas),
+            ("calces_no_permitidos_total", "Calces que validar_calzar() no permitió.", self.calces_no_permitidos),
+            ("dudas_acertadas_total", "Dudas en que pierde dado quien apostó.", self.dudas_acertadas),
+            ("calces_acertados_total", "Calces exactos.", self.calces_acertados),
+        )
+        for nombre, ayuda, valor in contadores:
+            lineas += [f"# HELP {prefijo}_{nombre} {ayuda}", f"# TYPE {prefijo}_{nombre} counter", f"{prefijo}_{nombre} {valor}"]
+        return "\n".join(lineas) + "\n"
+
+    def exportar(self, ruta: str, prefijo: str = "dudo") -> None:
+        """Escribe las métricas en `ruta` reemplazando el archivo de una vez (apto para el textfile collector)."""
+        temporal = f"{ruta}.{os.getpid()}.tmp"
+        with open(temporal, "w", encoding="utf-8") as archivo:
+            archivo.write(self.a_prometheus(prefijo))
+        os.replace(temporal, ruta)
+
+
+def instrumentar(partida, metricas: Metricas) -> None:
+    """Mide las operaciones de `partida` (solo esta instancia) acumulando en `metricas`."""
+    reloj = time.perf_counter
+
+    for op in OPERACIONES:
+        original = getattr(type(partida), op).__get__(partida)
+
+        def medido(*args, _original=original, _op=op, **kwargs):
+            inicio = reloj()
+            resultado = _original(*args, **kwargs)
+            metricas.observar(_op, reloj() - inicio)
+            if _op == "apostar" and not resultado:
+                metricas.apuestas_rechazadas += 1
+            elif _op == "calzar":
+                if resultado is None:
+                    metricas.calces_no_permitidos += 1
+                elif resultado:
+                    metricas.calces_acertados += 1
+            elif _op == "dudar" and resultado:
+                metricas.dudas_acertadas += 1
+            return resultado
+
+        setattr(partida, op, medido)
+
+
+def desinstrumentar(partida) -> None:
+    """Quita los envoltorios de `instrumentar`; la partida vuelve a usar los métodos de su clase."""
+    for op in OPERACIONES:
+        partida.__dict__.pop(op, None)
@@ -0,0 +1,425 @@
+"""
+Registro binario de partidas: un archivo solo de anexado con registros de 8 bytes.
+
+Cada registro es (tipo: u8, jugador: u8, datos: 6 bytes). Según el tipo:
+
+    INICIO    jugador = cantidad de jugadores
+    TIRADAS   datos = hasta 6 dados tirados para decidir quién inicia (0 = sin dado); las
+              tiradas de una partida van en tantos registros como hagan falta, antes de INICIAL
+    INICIAL   jugador = quien inicia la partida
+    SENTIDO   datos[0] = 0 derecha, 1 izquierda
+    DADOS     datos[0:5] = valores del cacho (0 = sin dado), datos[5] = reserva
+    RONDA     datos[0] = obligado; va después de los DADOS de todos los cachos
+    OBLIGADO  datos[0] = modo (0 ninguno, 1 abierta, 2 cerrada), datos[1] = pinta fija (0 ninguna)
+    APUESTA   datos = apariciones (u16), pinta (u8), aceptada (u8)
+    DUDA      datos = resultado, perdedor, dados del perdedor, reserva del perdedor
+    CALCE     datos = resultado (0 falso, 1 verdadero, 2 no permitido), dados, reserva
+
+GestorPartida escribe los eventos si recibe un `registro`; `leer_eventos` los recorre
+desde un archivo mapeado en memoria (`decodificar_eventos` hace lo mismo con registros
+ya leídos) y `reconstruir` rehace la partida hasta un evento.
+Si la ruta termina en ".gz" el registro se escribe y se lee comprimido con gzip; así
+se guardan corpus de muchas partidas seguidas (cada una empieza con su INICIO).
+"""
+from __future__ import annotations
+import gzip
+import mmap
+import struct
+from collections import deque
+from collections.abc import Iterator
+
+INICIO, INICIAL, SENTIDO, DADOS, RONDA, OBLIGADO, APUESTA, DUDA, CALCE, TIRADAS = range(10)
+NOMBRES_TIPO = ("inicio", "inicial", "sentido", "dados", "ronda", "obligado", "apuesta", "duda", "calce", "tiradas")
+
+REGISTRO = struct.Struct("<BB6s")
+_APUESTA = struct.Struct("<HBBxx")
+# Formatos de registro completo para los eventos frecuentes (evitan armar `datos` aparte)
+_APUESTA_REGISTRO = struct.Struct("<BBHBBxx")
+_DADOS = struct.Struct("<BB5sB")
+_CORTO = struct.Struct("<BBBBBB2x")  # tipo, jugador y hasta 4 bytes de datos
+_MODOS = (None, "abierta", "cerrada")
+_CODIGOS_MODO = {modo: codigo for codigo, modo in enumerate(_MODOS)}
+_SENTIDOS = ("derecha", "izquierda")
+_MAXIMO_BYTE = 0xFF  # jugadores y reservas van en un u8
+
+Evento = tuple[str, int, tuple]
+
+# Bytes descomprimidos que se leen por vez de un registro .gz
+TAMANO_BLOQUE = 1 << 20
+
+
+class DivergenciaRegistro(ValueError):
+    """La partida rehecha se apartó de la grabada; `evento` es el índice del primer evento distinto."""
+
+    def __init__(self, evento: int, mensaje: str):
+        super().__init__(f"Evento {evento}: {mensaje}")
+        self.evento = evento
+        self.mensaje = mensaje
+
+
+def _abrir(ruta: str, modo: str):
+    if ruta.endswith(".gz"):
+        return gzip.open(ruta, modo, compresslevel=6)
+    return open(ruta, modo)
+
+
+# Formato de la ronda completa (DADOS de cada cacho seguidos de RONDA) y sus argumentos
+# con los campos fijos ya puestos, según la cantidad de cachos
+_RONDAS: dict = {}
+
+
+def _plantilla_ronda(cachos: int) -> tuple:
+    formato = struct.Struct("<" + _DADOS.format[1:] * cachos + _CORTO.format[1:])
+    campos = []
+    for jugador in range(cachos):
+        campos += (DADOS, jugador, b"", 0)
+    campos += (RONDA, 0, False, 0, 0, 0)
+    plantilla = _RONDAS[cachos] = (formato, campos)
+    return plantilla
+
+
+def _reserva_excedida(reserva: int) -> ValueError:
+    return ValueError(f"Una reserva de {reserva} dados no cabe en el registro (máximo {_MAXIMO_BYTE})")
+
+
+def _apuesta_representable(apuesta, aceptada: bool) -> tuple:
+    """
+    (apariciones, pinta) que caben en el registro para una apuesta que no cabe tal cual.
+
+    Una apuesta rechazada se graba con 0 apariciones, que al rehacerla se rechaza igual.
+    Una aceptada tiene valores enteros (quizás como float) y solo puede pasarse de u16 en
+    apariciones: se acota a 65535, que sigue siendo imposible de cumplir con los dados.
+    """
+    if not aceptada:
+        try:
+            pinta = min(max(int(apuesta[1]), 0), 255)
+        except (TypeError, ValueError, OverflowError):
+            pinta = 0
+        return 0, pinta
+    return min(int(apuesta[0]), 0xFFFF), int(apuesta[1])
+
+
+class RegistroBinario:
+    """
+    Escribe los eventos de una partida en `ruta`.
+
+    Cada evento se empaqueta directamente al búfer en memoria, sin más llamadas; el búfer
+    se vuelca al archivo al comenzar una ronda si ya tiene `tamano_buffer` registros o
+    más, y al cerrar. Jugadores y reservas ocupan un byte cada uno: un registro admite
+    hasta 255 jugadores y reservas de hasta 255 dados (si no, ValueError).
+    """
+
+    def __init__(self, ruta: str, tamano_buffer: int = 4096):
+        self.ruta = ruta
+        self._archivo = _abrir(ruta, "ab")
+        self._buffer = bytearray()
+        self._limite = tamano_buffer * REGISTRO.size
+
+    # Eventos que emite GestorPartida; cada uno se empaqueta con un solo Struct.pack
+    def inicio(self, jugadores: int) -> None:
+        if not 0 < jugadores <= _MAXIMO_BYTE:
+            raise ValueError(f"El registro admite de 1 a {_MAXIMO_BYTE} jugadores, no {jugadores}")
+        self._buffer += _CORTO.pack(INICIO, jugadores, 0, 0, 0, 0)
+
+    def tiradas(self, valores) -> None:
+        valores = bytes(valores)
+        for desde in range(0, len(valores), 6):
+            self._buffer += REGISTRO.pack(TIRADAS, 0, valores[desde:desde + 6])
+
+    def inicial(self, jugador: int) -> None:
+        self._buffer += _CORTO.pack(INICIAL, jugador, 0, 0, 0, 0)
+
+    def sentido(self, sentido: str) -> None:
+        self._buffer += _CORTO.pack(SENTIDO, 0, _SENTIDOS.index(sentido), 0, 0, 0)
+
+    def ronda(self, cachos, obligado: bool) -> None:
+        # Los DADOS de todos los cachos y la RONDA salen de un solo pack; es también el
+        # único evento que revisa el tamaño del búfer, una vez por ronda y no por evento
+        buffer = self._buffer
+        if len(buffer) >= self._limite:
+            self.vaciar()
+        formato, plantilla = _RONDAS.get(len(cachos)) or _plantilla_ronda(len(cachos))
+        campos = plantilla[:]
+        posicion = 2
+        for cacho in cachos:
+            campos[posicion] = cacho.get_valores()
+            campos[posicion + 1] = cacho.reserva
+            posicion += 4
+        campos[posicion] = obligado  # el byte de datos de RONDA
+        try:
+            buffer += formato.pack(*campos)
+        except struct.error:
+            raise _reserva_excedida(max(cacho.reserva for cacho in cachos)) from None
+
+    def obligado(self, modo: str | None, pinta_fija: int | None) -> None:
+        self._buffer += _CORTO.pack(OBLIGADO, 0, _CODIGOS_MODO[modo], pinta_fija or 0, 0, 0)
+
+    def apuesta(self, jugador: int, apuesta, aceptada: bool) -> None:
+        try:
+            registro = _APUESTA_REGISTRO.pack(APUESTA, jugador, apuesta[0], apuesta[1], aceptada)
+        except struct.error:
+            registro = _APUESTA_REGISTRO.pack(APUESTA, jugador, *_apuesta_representable(apuesta, aceptada), aceptada)
+        self._buffer += registro
+
+    def duda(self, jugador: int, resultado: bool, perdedor: int, cacho_perdedor) -> None:
+        reserva = cacho_perdedor.reserva
+        try:
+            self._buffer += _CORTO.pack(DUDA, jugador, resultado, perdedor, cacho_perdedor.cantidad_dados(), reserva)
+        except struct.error:
+            raise _reserva_excedida(reserva) from None
+
+    def calce(self, jugador: int, resultado: bool | None, cacho) -> None:
+        codigo = 2 if resultado is None else resultado
+        reserva = cacho.reserva
+        try:
+            self._buffer += _CORTO.pack(CALCE, jugador, codigo, cacho.cantidad_dados(), reserva, 0)
+        except struct.error:
+            raise _reserva_excedida(reserva) from None
+
+    def vaciar(self) -> None:
+        self._archivo.write(self._buffer)
+        self._buffer.clear()
+        self._archivo.flush()
+
+    def cerrar(self) -> None:
+        self.vaciar()
+        self._archivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.cerrar()
+
+
+class RegistroEventos:
+    """
+    Registro en memoria: guarda los eventos ya decodificados, iguales a los de `leer_eventos`.
+
+    Sirve para procesar partidas en vivo con el mismo código que lee registros grabados;
+    quien lo usa vacía `eventos` entre partidas para no acumular la historia.
+    """
+
+    def __init__(self):
+        self.eventos: list = []
+
+    def inicio(self, jugadores: int) -> None:
+        self.eventos.append(("inicio", jugadores, ()))
+
+    def tiradas(self, valores) -> None:
+        # En partes de 6, como en el registro binario
+        valores = bytes(valores)
+        for desde in range(0, len(valores), 6):
+            self.eventos.append(("tiradas", 0, (valores[desde:desde + 6],)))
+
+    def inicial(self, jugador: int) -> None:
+        self.eventos.append(("inicial", jugador, ()))
+
+    def sentido(self, sentido: str) -> None:
+        self.eventos.append(("sentido", 0, (sentido,)))
+
+    def ronda(self, cachos, obligado: bool) -> None:
+        eventos = self.eventos
+        for jugador, cacho in enumerate(cachos):
+            eventos.append(("dados", jugador, (cacho.get_valores(), cacho.reserva)))
+        eventos.append(("ronda", 0, (bool(obligado),)))
+
+    def obligado(self, modo: str | None, pinta_fija: int | None) -> None:
+        self.eventos.append(("obligado", 0, (modo, pinta_fija or None)))
+
+    def apuesta(self, jugador: int, apuesta, aceptada: bool) -> None:
+        self.eventos.append(("apuesta", jugador, (tuple(apuesta), bool(aceptada))))
+
+    def duda(self, jugador: int, resultado: bool, perdedor: int, cacho_perdedor) -> None:
+        self.eventos.append(("duda", jugador, (bool(resultado), perdedor, cacho_perdedor.cantidad_dados(), cacho_perdedor.reserva)))
+
+    def calce(self, jugador: int, resultado: bool | None, cacho) -> None:
+        resultado = None if resultado is None else bool(resultado)
+        self.eventos.append(("calce", jugador, (resultado, cacho.cantidad_dados(), cacho.reserva)))
+
+
+def _decodificar(tipo: int, datos: bytes) -> tuple:
+    if tipo == DADOS:
+        return (bytes(datos[:5]).rstrip(b"\0"), datos[5])
+    if tipo == TIRADAS:
+        return (bytes(datos).rstrip(b"\0"),)
+    if tipo == RONDA:
+        return (bool(datos[0]),)
+    if tipo == SENTIDO:
+        return (_SENTIDOS[datos[0]],)
+    if tipo == OBLIGADO:
+        return (_MODOS[datos[0]], datos[1] or None)
+    if tipo == APUESTA:
+        apariciones, pinta, aceptada = _APUESTA.unpack(datos)
+        return ((apariciones, pinta), bool(aceptada))
+    if tipo == DUDA:
+        return (bool(datos[0]), datos[1], datos[2], datos[3])
+    if tipo == CALCE:
+        return (None if datos[0] == 2 else bool(datos[0]), datos[1], datos[2])
+    return ()
+
+
+def decodificar_eventos(datos) -> Iterator[Evento]:
+    """Recorre los eventos de registros ya leídos (bytes o memoryview de un múltiplo de 8 bytes)."""
+    for tipo, jugador, campo in REGISTRO.iter_unpack(datos):
+        yield NOMBRES_TIPO[tipo], jugador, _decodificar(tipo, campo)
+
+
+def leer_bloques(ruta: str, tamano_bloque: int = TAMANO_BLOQUE) -> Iterator[bytes]:
+    """Recorre un registro .gz en bloques descomprimidos de registros completos."""
+    with _abrir(ruta, "rb") as archivo:
+        resto = b""
+        while True:
+            leido = archivo.read(tamano_bloque)
+            if not leido:
+                break
+            bloque = resto + leido
+            corte = len(bloque) - len(bloque) % REGISTRO.size
+            resto = bloque[corte:]
+            yield bloque[:corte]
+        if resto:
+            raise ValueError(f"{ruta}: el registro termina con un evento incompleto")
+
+
+def leer_eventos(ruta: str) -> Iterator[Evento]:
+    """Recorre los eventos de un registro sin cargarlo completo: (tipo, jugador, datos decodificados)."""
+    if ruta.endswith(".gz"):
+        for bloque in leer_bloques(ruta):
+            yield from decodificar_eventos(bloque)
+        return
+    with open(ruta, "rb") as archivo:
+        if archivo.seek(0, 2) == 0:
+            return
+        with mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+            vista = memoryview(mapa)
+            try:
+                yield from decodificar_eventos(vista)
+            finally:
+                vista.release()
+
+
+class GeneradorGrabado:
+    """Fuente de dados que entrega valores grabados en vez de lanzarlos."""
+
+    def __init__(self):
+        self.valores = deque()
+
+    def generar(self):
+        return self.valores.popleft()
+
+    def generar_muchos(self, n):
+        return [self.valores.popleft() for _ in range(n)]
+
+
+def reconstruir(eventos, indice: int | None = None):
+    """
+    Rehace una partida ejecutando sobre un GestorPartida nuevo los eventos anteriores a `indice`.
+
+    Además de los resultados de apuestas, dudas y calces, compara los dados de cada ronda
+    y los dados y reserva con que queda quien pierde o calza, así que cualquier cambio de
+    comportamiento de GestorPartida, ArbitroRonda o ValidadorApuesta se detecta en el
+    primer evento afectado.
+
+    El orden de turnos también se comprueba: con las TIRADAS grabadas se vuelve a ejecutar
+    `determinar_inicial`, y desde ahí cada apuesta, duda o calce debe venir del jugador al
+    que el motor le da el turno (`siguiente_jugador` tras una apuesta aceptada, el inicial
+    de la ronda siguiente tras una duda o un calce). Los registros sin TIRADAS (anteriores
+    a ese evento) toman quién inicia tal como se grabó; los que no tienen INICIAL, como
+    los de partidas armadas a mano, no comprueban turnos.
+
+    Args:
+        - eventos (str | Iterable[Evento]): Ruta de un registro o eventos ya leídos.
+        - indice (int | None): Cantidad de eventos a aplicar (None = todos).
+
+    Returns:
+        - GestorPartida: La partida tal como estaba después del último evento aplicado.
+
+    Raises:
+        - DivergenciaRegistro: Si el registro no empieza con INICIO, la partida rehecha no
+          coincide con la grabada o falla al aplicar un evento.
+    """
+    from src.juego.gestor_partida import GestorPartida
+    from src.juego.partida_headless import inicial_siguiente_ronda
+
+    if isinstance(eventos, str):
+        eventos = leer_eventos(eventos)
+    generador = GeneradorGrabado()
+    partida = None
+    grabados = []
+    tiradas = False
+    turno = None  # a quién le toca según el motor (None = no se comprueba)
+    numero = 0
+    try:
+        for numero, (tipo, jugador, datos) in enumerate(eventos):
+            if indice is not None and numero >= indice:
+                break
+            if tipo == "inicio":
+                partida = GestorPartida([f"jugador{i + 1}" for i in range(jugador)], generador)
+            elif partida is None:
+                raise DivergenciaRegistro(numero, "el registro debe comenzar con un evento de inicio")
+            elif tipo == "tiradas":
+                generador.valores.extend(datos[0])
+                tiradas = True
+            elif tipo == "inicial":
+                if tiradas:
+                    inicial = partida.determinar_inicial()
+                    if inicial != jugador or generador.valores:
+                        raise DivergenciaRegistro(numero, f"con las tiradas grabadas inicia {inicial}, no {jugador}")
+                else:
+                    partida.indice_inicial_proxima = jugador
+                turno = jugador
+            elif tipo == "sentido":
+                partida.definir_sentido(datos[0])
+            elif tipo == "dados":
+                generador.valores.extend(datos[0])
+                grabados.append(datos)
+            elif tipo == "ronda":
+                partida.iniciar_ronda()
+                if [(c.get_valores(), c.reserva) for c in partida.cachos] != grabados or generador.valores:
+                    raise DivergenciaRegistro(numero, "los dados de la ronda no coinciden con los grabados")
+                if partida.obligado != datos[0]:
+                    raise DivergenciaRegistro(numero, f"la ronda debía ser obligado={datos[0]}")
+                grabados.clear()
+            elif tipo == "obligado":
+                partida.configurar_obligado(*datos)
+            elif tipo == "apuesta":
+                _comparar_turno(numero, turno, jugador)
+                if partida.apostar(jugador, datos[0]) != datos[1]:
+                    raise DivergenciaRegistro(numero, f"la apuesta {datos[0]} no se resolvió igual que en el registro")
+                if datos[1] and turno is not None:
+                    turno = partida.siguiente_jugador(jugador)
+            elif tipo == "duda":
+                _comparar_turno(numero, turno, jugador)
+                apostador = partida.indice_ultimo_apostador
+                resultado = partida.dudar(jugador)
+                if resultado != datos[0]:
+                    raise DivergenciaRegistro(numero, "la duda no se resolvió igual que en el registro")
+                _comparar_cacho(numero, partida.cachos[datos[1]], datos[2], datos[3])
+                if turno is not None:
+                    turno = inicial_siguiente_ronda(partida, apostador if resultado else jugador)
+            elif tipo == "calce":
+                _comparar_turno(numero, turno, jugador)
+                resultado = partida.calzar(jugador)
+                if resultado != datos[0]:
+                    raise DivergenciaRegistro(numero, "el calce no se resolvió igual que en el registro")
+                _comparar_cacho(numero, partida.cachos[jugador], datos[1], datos[2])
+                if resultado is not None and turno is not None:
+                    turno = inicial_siguiente_ronda(partida, jugador)
+    except DivergenciaRegistro:
+        raise
+    except Exception as error:
+        raise DivergenciaRegistro(numero, f"{type(error).__name__}: {error}") from error
+    return partida
+
+
+def _comparar_turno(numero: int, turno: int | None, jugador: int) -> None:
+    if turno is not None and jugador != turno:
+        raise DivergenciaRegistro(numero, f"actuó el jugador {jugador} y el turno era del jugador {turno}")
+
+
+def _comparar_cacho(numero: int, cacho, dados: int, reserva: int) -> None:
+    if (cacho.cantidad_dados(), cacho.reserva) != (dados, reserva):
+        raise DivergenciaRegistro(
+            numero,
+            f"el cacho quedó con {cacho.cantidad_dados()} dados y reserva {cacho.reserva}; se grabó {dados} y {reserva}",
+        )
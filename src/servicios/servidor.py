@@ -0,0 +1,276 @@
+"""
+Servidor asyncio para muchas mesas de Dudo en un solo proceso.
+
+Protocolo: un objeto JSON por línea en cada sentido. Cada pedido lleva "accion" y,
+opcionalmente, un "id" que se devuelve en la respuesta:
+
+    {"accion": "crear_mesa", "jugadores": ["Ana", "Beto"], "sentido": "derecha", "semilla": 1}
+    {"accion": "unirse", "mesa": 1, "jugador": 0}        # recibir notificaciones de la mesa
+    {"accion": "estado", "mesa": 1, "jugador": 0}        # "jugador" agrega los dados propios
+    {"accion": "apostar", "mesa": 1, "jugador": 0, "apuesta": [3, 4], "modo": "cerrada"}
+    {"accion": "dudar", "mesa": 1, "jugador": 1}
+    {"accion": "calzar", "mesa": 1, "jugador": 1}
+    {"accion": "info"}
+
+Respuestas: {"ok": true, ...} o {"ok": false, "error": "..."}. Las notificaciones
+a los suscritos tienen "evento": "turno", "resultado" o "fin".
+
+Las mesas inactivas no tienen tareas propias: solo su GestorPartida y unos pocos
+campos. De las mesas terminadas se conservan las últimas `max_terminadas` para que
+los clientes puedan consultar el resultado; las más viejas se descartan. El servidor
+nunca llama a los ayudantes de consola (animar_texto, animar_dados).
+"""
+from __future__ import annotations
+import asyncio
+import json
+from collections import deque
+
+from src.juego.gestor_partida import GestorPartida
+from src.juego.partida_headless import abrir_ronda, inicial_siguiente_ronda, siguiente_activo
+from src.servicios.generador_aleatorio import Generador_Aleatorio
+
+
+class MesaServidor:
+    __slots__ = ("partida", "turno", "suscriptores", "terminada")
+
+    def __init__(self, partida: GestorPartida, turno: int):
+        self.partida = partida
+        self.turno = turno
+        self.suscriptores = None  # se crea al primer suscriptor para no gastar memoria en mesas inactivas
+        self.terminada = False
+
+
+class ServidorDudo:
+    def __init__(self, semilla=None, max_terminadas: int = 1024):
+        self.mesas: dict[int, MesaServidor] = {}
+        self._suscripciones: dict[object, list] = {}  # conexión -> mesas a las que está unida
+        self._terminadas = deque()  # mesas terminadas, de la más vieja a la más nueva
+        self.max_terminadas = max_terminadas
+        self._por_drenar = set()  # suscriptores con notificaciones escritas y sin drain()
+        self.generador = Generador_Aleatorio(semilla)
+        self._siguiente_id = 1
+
+    # ---------------------------------------------------------------------
+    # Red
+    # ---------------------------------------------------------------------
+    async def iniciar(self, host: str = "127.0.0.1", puerto: int = 0, ruta_unix: str | None = None):
+        """Abre el servidor TCP (o en un socket Unix si se da `ruta_unix`) y lo devuelve."""
+        if ruta_unix is not None:
+            return await asyncio.start_unix_server(self._atender, path=ruta_unix)
+        return await asyncio.start_server(self._atender, host, puerto)
+
+    async def _atender(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            while True:
+                linea = await reader.readline()
+                if not linea:
+                    break
+                try:
+                    mensaje = json.loads(linea)
+                    respuesta = self.procesar(mensaje, writer)
+                    if isinstance(mensaje, dict) and "id" in mensaje:
+                        respuesta["id"] = mensaje["id"]
+                except Exception as error:
+                    # Un pedido malformado no debe cortar la sesión del cliente
+                    respuesta = {"ok": False, "error": f"{type(error).__name__}: {error}"}
+                writer.write(_codificar(respuesta))
+                await writer.drain()
+                await self._drenar()
+        except ConnectionError:
+            pass
+        finally:
+            self._desuscribir(writer)
+            writer.close()
+
+    def _desuscribir(self, writer) -> None:
+        for id_mesa in self._suscripciones.pop(writer, ()):
+            mesa = self.mesas.get(id_mesa)
+            if mesa is not None and writer in mesa.suscriptores:
+                mesa.suscriptores.remove(writer)
+
+    def _notificar(self, id_mesa: int, mesa: MesaServidor, evento: dict) -> None:
+        if not mesa.suscriptores:
+            return
+        evento["mesa"] = id_mesa
+        datos = _codificar(evento)
+        for writer in mesa.suscriptores:
+            if not writer.is_closing():
+                writer.write(datos)
+                self._por_drenar.add(writer)
+
+    async def _drenar(self) -> None:
+        # Espera a que se vacíen los búferes de los suscriptores notificados: un cliente
+        # que no lee frena a quien le manda jugadas en vez de hacer crecer la memoria
+        if not self._por_drenar:
+            return
+        escritores = [writer for writer in self._por_drenar if not writer.is_closing()]
+        self._por_drenar.clear()
+        await asyncio.gather(*(writer.drain() for writer in escritores), return_exceptions=True)
+
+    def _terminar(self, id_mesa: int, mesa: MesaServidor) -> None:
+        mesa.terminada = True
+        self._terminadas.append(id_mesa)
+        while len(self._terminadas) > self.max_terminadas:
+            id_vieja = self._terminadas.popleft()
+            vieja = self.mesas.pop(id_vieja)
+            for writer in vieja.suscriptores or ():
+                suscripciones = self._suscripciones.get(writer)
+                if suscripciones is not None and id_vieja in suscripciones:
+                    suscripciones.remove(id_vieja)
+
+    # ---------------------------------------------------------------------
+    # Acciones
+    # ---------------------------------------------------------------------
+    def procesar(self, mensaje: dict, conexion=None) -> dict:
+        """Atiende un pedido ya decodificado; `conexion` es el writer al que se envían las notificaciones."""
+        if not isinstance(mensaje, dict):
+            return {"ok": False, "error": "El pedido debe ser un objeto JSON"}
+        accion = mensaje.get("accion")
+        if accion == "crear_mesa":
+            return self._crear_mesa(mensaje)
+        if accion == "info":
+            return {"ok": True, "mesas": len(self.mesas), "memoria_max_kib": _memoria_max_kib()}
+
+        id_mesa = mensaje.get("mesa")
+        mesa = self.mesas.get(id_mesa)
+        if mesa is None:
+            return {"ok": False, "error": f"Mesa inexistente: {id_mesa}"}
+        jugador = mensaje.get("jugador")
+        if jugador is not None and not _es_asiento(mesa.partida, jugador):
+            return {"ok": False, "error": f"Jugador inexistente: {jugador}"}
+        if accion == "estado":
+            return self._estado(id_mesa, mesa, jugador)
+        if accion == "unirse":
+            if mesa.suscriptores is None:
+                mesa.suscriptores = []
+            if conexion is not None and conexion not in mesa.suscriptores:
+                mesa.suscriptores.append(conexion)
+                self._suscripciones.setdefault(conexion, []).append(id_mesa)
+            return self._estado(id_mesa, mesa, jugador)
+        if accion not in ("apostar", "dudar", "calzar"):
+            return {"ok": False, "error": f"Acción desconocida: {accion}"}
+
+        if mesa.terminada:
+            return {"ok": False, "error": "La partida terminó"}
+        if jugador != mesa.turno:
+            return {"ok": False, "error": "No es tu turno"}
+        try:
+            if accion == "apostar":
+                return self._apostar(id_mesa, mesa, jugador, mensaje)
+            return self._resolver(id_mesa, mesa, jugador, accion)
+        except RuntimeError as error:
+            return {"ok": False, "error": str(error)}
+
+    def _crear_mesa(self, mensaje: dict) -> dict:
+        semilla = mensaje.get("semilla")
+        generador = Generador_Aleatorio(semilla) if semilla is not None else self.generador
+        partida = GestorPartida(mensaje.get("jugadores", []), generador)
+        turno = partida.determinar_inicial()
+        partida.definir_sentido(mensaje.get("sentido", "derecha"))
+        abrir_ronda(partida)
+
+        id_mesa = self._siguiente_id
+        self._siguiente_id += 1
+        self.mesas[id_mesa] = MesaServidor(partida, turno)
+        return {"ok": True, "mesa": id_mesa, "turno": turno}
+
+    def _apostar(self, id_mesa: int, mesa: MesaServidor, jugador: int, mensaje: dict) -> dict:
+        partida = mesa.partida
+        apuesta = mensaje.get("apuesta")
+        # Como en _es_asiento: solo enteros (ni floats como 1e400, ni bool)
+        if not isinstance(apuesta, list) or len(apuesta) != 2 or any(type(x) is not int for x in apuesta):
+            return {"ok": False, "error": "La apuesta debe ser [apariciones, pinta] con enteros"}
+        apuesta = tuple(apuesta)
+        modo = mensaje.get("modo", "cerrada")
+        if modo not in ("abierta", "cerrada"):
+            return {"ok": False, "error": "modo debe ser 'abierta' o 'cerrada'"}
+        primera = partida.apuesta_actual is None
+        if not partida.apostar(jugador, apuesta):
+            return {"ok": False, "error": "Apuesta inválida"}
+        if primera and partida.obligado:
+            partida.configurar_obligado(modo, apuesta[1])
+        mesa.turno = siguiente_activo(partida, jugador)
+        self._notificar(id_mesa, mesa, {"evento": "turno", "jugador": mesa.turno, "apuesta": list(apuesta)})
+        return {"ok": True, "turno": mesa.turno}
+
+    def _resolver(self, id_mesa: int, mesa: MesaServidor, jugador: int, accion: str) -> dict:
+        partida = mesa.partida
+        if accion == "dudar":
+            apostador = partida.indice_ultimo_apostador
+            resultado = partida.dudar(jugador)
+            perdedor = apostador if resultado else jugador
+        else:
+            resultado = partida.calzar(jugador)
+            if resultado is None:
+                return {"ok": False, "error": "No se puede calzar"}
+            perdedor = jugador
+
+        respuesta = {"ok": True, "resultado": resultado, "dados": _dados(partida)}
+        self._notificar(id_mesa, mesa, {"evento": "resultado", "accion": accion, "jugador": jugador, **respuesta})
+        if partida.hay_ganador():
+            respuesta["ganador"] = partida.activos[0]
+            self._notificar(id_mesa, mesa, {"evento": "fin", "ganador": respuesta["ganador"]})
+            self._terminar(id_mesa, mesa)
+            return respuesta
+
+        mesa.turno = inicial_siguiente_ronda(partida, perdedor)
+        abrir_ronda(partida)
+        respuesta["turno"] = mesa.turno
+        self._notificar(id_mesa, mesa, {"evento": "turno", "jugador": mesa.turno, "apuesta": None})
+        return respuesta
+
+    def _estado(self, id_mesa: int, mesa: MesaServidor, jugador: int | None) -> dict:
+        partida = mesa.partida
+        estado = {
+            "ok": True,
+            "mesa": id_mesa,
+            "turno": mesa.turno,
+            "apuesta": list(partida.apuesta_actual) if partida.apuesta_actual else None,
+            "obligado": partida.obligado,
+            "modo_obligado": partida.modo_obligado,
+            "pinta_fija": partida.pinta_fija,
+            "dados": _dados(partida),
+            "terminada": mesa.terminada,
+        }
+        if jugador is not None:
+            estado["dados_propios"] = list(partida.cachos[jugador].get_valores())
+        return estado
+
+
+def _es_asiento(partida: GestorPartida, jugador) -> bool:
+    # bool es subclase de int: True no debe pasar por el asiento 1
+    return type(jugador) is int and 0 <= jugador < len(partida.cachos)
+
+
+def _memoria_max_kib() -> int | None:
+    """Pico de memoria residente del proceso (None donde no hay `resource`, como en Windows)."""
+    try:
+        import resource
+    except ImportError:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _dados(partida: GestorPartida) -> list:
+    return [cacho.cantidad_dados() for cacho in partida.cachos]
+
+
+def _codificar(mensaje: dict) -> bytes:
+    return json.dumps(mensaje, separators=(",", ":")).encode() + b"\n"
+
+
+async def _servir(host: str, puerto: int, ruta_unix: str | None) -> None:
+    servidor = await ServidorDudo().iniciar(host, puerto, ruta_unix)
+    async with servidor:
+        await servidor.serve_forever()
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Servidor de mesas de Dudo")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--puerto", type=int, default=8765)
+    parser.add_argument("--unix", default=None, help="Ruta de socket Unix en vez de TCP")
+    argumentos = parser.parse_args()
+    asyncio.run(_servir(argumentos.host, argumentos.puerto, argumentos.unix))
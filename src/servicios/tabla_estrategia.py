@@ -0,0 +1,198 @@
+"""
+Tablas de estrategia de solo lectura, mapeadas en memoria desde disco.
+
+Una tabla asocia claves de `codificar_informacion` (enteros de 64 bits) con unas pocas
+probabilidades float32, por ejemplo las de dudar y calzar en ese conjunto de
+información. Se construye una vez con `construir_tabla` y cada proceso la abre con
+TablaEstrategia: abrir solo mapea el archivo y lee la cabecera, no copia las claves ni
+los valores, así que N procesos que juegan con la misma tabla comparten una sola copia
+en la caché de páginas del sistema operativo.
+
+Formato (little-endian):
+
+    cabecera   "DUDOTAB1", versión (u16), columnas (u16), 4 bytes libres, entradas (u64)
+    claves     entradas × u64, ordenadas de menor a mayor
+    valores    entradas × columnas × float32, en el orden de las claves
+
+La búsqueda es binaria (bisect) directamente sobre las claves mapeadas.
+
+Uso:
+    construir_tabla("tabla.bin", {clave: (p_dudar, p_calzar), ...}, columnas=2)
+    jugar_liga([partial(JugadorTabla, "tabla.bin"), JugadorUmbral], partidas=100_000)
+"""
+from __future__ import annotations
+import mmap
+import os
+import struct
+import sys
+from array import array
+from bisect import bisect_left
+
+from src.juego.conjunto_informacion import codificar_vista
+from src.juego.jugadores import JugadorUmbral, subir_sin_ciclos
+
+MAGICO = b"DUDOTAB1"
+VERSION = 1
+_CABECERA = struct.Struct("<8sHH4xQ")
+
+
+def construir_tabla(ruta: str, entradas, columnas: int) -> int:
+    """
+    Escribe una tabla de estrategia ordenada por clave.
+
+    Args:
+        - ruta (str): Archivo de salida; se escribe en un temporal y se reemplaza al final,
+          así un proceso que tenga abierta la tabla anterior no ve un archivo a medias.
+        - entradas (dict | Iterable[tuple[int, Sequence[float]]]): Clave y sus `columnas` valores.
+        - columnas (int): Valores por clave.
+
+    Returns:
+        - int: Cantidad de entradas escritas.
+
+    Raises:
+        - ValueError: Si una clave se repite, no cabe en 64 bits o no tiene `columnas` valores.
+    """
+    if sys.byteorder != "little":
+        raise ValueError("Las tablas de estrategia se escriben en little-endian")
+    if hasattr(entradas, "items"):
+        entradas = entradas.items()
+    ordenadas = sorted(entradas, key=lambda entrada: entrada[0])
+
+    claves = array("Q")
+    valores = array("f")
+    anterior = None
+    for clave, fila in ordenadas:
+        if clave == anterior:
+            raise ValueError(f"Clave repetida: {clave}")
+        if len(fila) != columnas:
+            raise ValueError(f"La clave {clave} tiene {len(fila)} valores y la tabla {columnas} columnas")
+        try:
+            claves.append(clave)
+        except OverflowError:
+            raise ValueError(f"La clave {clave} no cabe en 64 bits sin signo") from None
+        valores.extend(fila)
+        anterior = clave
+
+    temporal = f"{ruta}.{os.getpid()}.tmp"
+    with open(temporal, "wb") as archivo:
+        archivo.write(_CABECERA.pack(MAGICO, VERSION, columnas, len(claves)))
+        claves.tofile(archivo)
+        valores.tofile(archivo)
+    os.replace(temporal, ruta)
+    return len(claves)
+
+
+class TablaEstrategia:
+    """
+    Tabla de estrategia abierta con mmap; las búsquedas leen las páginas mapeadas sin copiarlas.
+
+    Raises:
+        - ValueError: Si el archivo no es una tabla de estrategia o está truncado.
+    """
+
+    def __init__(self, ruta: str):
+        if sys.byteorder != "little":
+            raise ValueError("Las tablas de estrategia se leen en little-endian")
+        with open(ruta, "rb") as archivo:
+            # El mapa sigue válido después de cerrar el archivo
+            self._mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            if len(self._mapa) < _CABECERA.size:
+                raise ValueError(f"{ruta} no es una tabla de estrategia")
+            magico, version, self.columnas, self.entradas = _CABECERA.unpack_from(self._mapa)
+            if magico != MAGICO or version != VERSION:
+                raise ValueError(f"{ruta} no es una tabla de estrategia (versión {VERSION})")
+            fin_claves = _CABECERA.size + 8 * self.entradas
+            if len(self._mapa) != fin_claves + 4 * self.entradas * self.columnas:
+                raise ValueError(f"{ruta} está truncada")
+        except ValueError:
+            self._mapa.close()
+            raise
+        vista = memoryview(self._mapa)
+        self._claves = vista[_CABECERA.size:fin_claves].cast("Q")
+        self._valores = vista[fin_claves:].cast("f")
+        vista.release()
+
+    def _posicion(self, clave: int) -> int:
+        claves = self._claves
+        i = bisect_left(claves, clave)
+        return i if i < len(claves) and claves[i] == clave else -1
+
+    def buscar(self, clave: int, defecto=None):
+        """Valores de `clave` como lista de floats, o `defecto` si la clave no está."""
+        i = self._posicion(clave)
+        if i < 0:
+            return defecto
+        columnas = self.columnas
+        return self._valores[i * columnas:(i + 1) * columnas].tolist()
+
+    def __getitem__(self, clave: int) -> list:
+        valores = self.buscar(clave)
+        if valores is None:
+            raise KeyError(clave)
+        return valores
+
+    def __contains__(self, clave: int) -> bool:
+        return self._posicion(clave) >= 0
+
+    def __len__(self) -> int:
+        return self.entradas
+
+    def cerrar(self) -> None:
+        # Las vistas se liberan antes de cerrar: close() falla si queda alguna
+        self._claves.release()
+        self._valores.release()
+        self._mapa.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+
+_ABIERTAS: dict = {}
+
+
+def abrir_tabla(ruta: str) -> TablaEstrategia:
+    """Abre la tabla una sola vez por proceso; las siguientes llamadas con la misma ruta la reutilizan."""
+    ruta = os.path.abspath(ruta)
+    tabla = _ABIERTAS.get(ruta)
+    if tabla is None:
+        tabla = _ABIERTAS[ruta] = TablaEstrategia(ruta)
+    return tabla
+
+
+class JugadorTabla(JugadorUmbral):
+    """
+    Juega con una tabla de estrategia de dos columnas: probabilidad de dudar y de calzar
+    en cada conjunto de información. Si no duda ni calza apuesta como JugadorUmbral, y en
+    los estados que no están en la tabla juega como JugadorUmbral.
+
+    `tabla` puede ser una TablaEstrategia o una ruta; con una ruta, las estrategias del
+    mismo proceso comparten la tabla abierta, así `partial(JugadorTabla, ruta)` sirve de
+    fábrica para jugar_liga o estadisticas_en_paralelo.
+    """
+
+    def __init__(self, tabla, semilla=None, **umbrales):
+        super().__init__(semilla, **umbrales)
+        self.tabla = abrir_tabla(tabla) if isinstance(tabla, str) else tabla
+
+    def decidir(self, vista, idx_jugador: int) -> tuple:
+        valores = self.tabla.buscar(codificar_vista(vista))
+        if valores is None:
+            return super().decidir(vista, idx_jugador)
+        apuesta = vista.apuesta_actual
+        if apuesta is not None:
+            azar = self.rng.random()
+            if azar < valores[0]:
+                return ("dudar",)
+            if azar < valores[0] + valores[1] and vista.puede_calzar():
+                return ("calzar",)
+
+        obligado = vista.obligado
+        desconocidos = vista.total_dados_en_mesa() - vista.cantidad_dados(idx_jugador)
+        opciones = subir_sin_ciclos(apuesta, vista.apuestas_validas(), vista.total_dados_en_mesa())
+        if not opciones:
+            return ("dudar",)
+        return ("apostar", self._elegir_apuesta(vista, opciones, desconocidos, obligado))
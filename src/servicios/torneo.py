@@ -0,0 +1,80 @@
+from __future__ import annotations
+import os
+import time
+
+from src.juego.partida_headless import jugar_partida
+from src.servicios.generador_aleatorio import Generador_Aleatorio
+
+
+def _jugar_lote(fabricas: list, semilla: int, lote: int, partidas: int) -> dict:
+    """Juega `partidas` partidas con flujos derivados del número de lote y devuelve solo los totales."""
+    generador = Generador_Aleatorio(semilla).derivar(lote)
+    jugadores = [fabrica(f"{semilla}/{lote}/{asiento}") for asiento, fabrica in enumerate(fabricas)]
+    victorias = [0] * len(fabricas)
+    rondas = 0
+    for _ in range(partidas):
+        resultado = jugar_partida(jugadores, generador)
+        victorias[resultado["ganador"]] += 1
+        rondas += resultado["rondas"]
+    return {"victorias": victorias, "rondas": rondas, "partidas": partidas}
+
+
+def jugar_torneo(
+    fabricas: list,
+    partidas: int,
+    procesos: int | None = None,
+    semilla: int = 0,
+    tamano_lote: int = 500,
+) -> dict:
+    """
+    Juega muchas partidas entre las mismas estrategias repartidas en un ProcessPoolExecutor.
+
+    Las partidas se agrupan en lotes; cada lote usa un flujo de dados y semillas de
+    estrategia derivados de (semilla, número de lote), así el resultado no depende de
+    cuántos procesos se usen, y cada proceso devuelve solo los totales de su lote.
+
+    Args:
+        - fabricas (list): Una por asiento; se llama con una semilla y devuelve la estrategia.
+          Deben poder enviarse a otro proceso (clases o funciones de módulo).
+        - partidas (int): Total de partidas a jugar.
+        - procesos (int | None): Procesos del pool (None = núcleos disponibles, 1 = sin pool).
+        - semilla (int): Semilla base del torneo.
+        - tamano_lote (int): Partidas por tarea enviada al pool.
+
+    Returns:
+        - dict: victorias por asiento, rondas y partidas totales, segundos y partidas por segundo.
+    """
+    lotes: list[tuple] = []
+    for lote, inicio in enumerate(range(0, partidas, tamano_lote)):
+        lotes.append((lote, min(tamano_lote, partidas - inicio)))
+
+    inicio = time.perf_counter()
+    if procesos == 1:
+        resultados = [_jugar_lote(fabricas, semilla, lote, cantidad) for lote, cantidad in lotes]
+    else:
+        # El pool se importa solo si se usa: los procesos de trabajo no lo necesitan
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=procesos or os.cpu_count()) as pool:
+            resultados = list(pool.map(
+                _jugar_lote,
+                [fabricas] * len(lotes),
+                [semilla] * len(lotes),
+                [lote for lote, _ in lotes],
+                [cantidad for _, cantidad in lotes],
+            ))
+    segundos = time.perf_counter() - inicio
+
+    victorias = [0] * len(fabricas)
+    rondas = 0
+    for resultado in resultados:
+        for asiento, cantidad in enumerate(resultado["victorias"]):
+            victorias[asiento] += cantidad
+        rondas += resultado["rondas"]
+    return {
+        "victorias": victorias,
+        "rondas": rondas,
+        "partidas": partidas,
+        "segundos": segundos,
+        "partidas_por_segundo": partidas / segundos if segundos > 0 else float("inf"),
+    }
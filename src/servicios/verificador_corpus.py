@@ -0,0 +1,180 @@
+"""
+Verificación de corpus de partidas grabadas contra la versión actual del juego.
+
+Un corpus es un registro binario (ver registro_partida.py), normalmente comprimido
+(".gz"), con muchas partidas seguidas: cada una empieza con su evento INICIO y trae
+los dados de cada ronda y todas las acciones de los jugadores. Verificar una partida
+es rehacerla con `reconstruir`, que compara cada resultado con el grabado y comprueba
+que cada jugador actúe en su turno (quién inicia se vuelve a decidir con las tiradas
+grabadas); la primera diferencia queda informada con el número de partida y el índice
+del evento dentro de ella.
+
+El proceso principal solo descomprime y corta el corpus en lotes de partidas completas
+(sin decodificar eventos); los lotes se verifican en un ProcessPoolExecutor con una
+cantidad acotada de tareas pendientes, así la memoria no crece con el tamaño del corpus.
+
+Uso:
+    python -m src.servicios.verificador_corpus partidas.dudo.gz --procesos 8
+"""
+from __future__ import annotations
+import argparse
+import os
+import sys
+import time
+from collections import deque
+from collections.abc import Iterator
+
+from src.servicios.registro_partida import (
+    INICIO,
+    REGISTRO,
+    DivergenciaRegistro,
+    decodificar_eventos,
+    leer_bloques,
+    reconstruir,
+)
+
+_MARCA_INICIO = bytes((INICIO,))
+
+
+def _inicios(datos: bytes) -> list[int]:
+    """Posiciones (en bytes) de los eventos INICIO de `datos`."""
+    # Los tipos están cada REGISTRO.size bytes; se buscan con find sobre esa franja
+    tipos = datos[::REGISTRO.size]
+    posiciones = []
+    posicion = tipos.find(_MARCA_INICIO)
+    while posicion != -1:
+        posiciones.append(posicion * REGISTRO.size)
+        posicion = tipos.find(_MARCA_INICIO, posicion + 1)
+    return posiciones
+
+
+def partidas_del_corpus(ruta: str, tamano_lote: int = 2000) -> Iterator[tuple[int, bytes]]:
+    """
+    Corta un corpus en lotes de partidas completas sin decodificarlas.
+
+    Args:
+        - ruta (str): Corpus (".gz" o sin comprimir).
+        - tamano_lote (int): Partidas aproximadas por lote.
+
+    Returns:
+        - Iterator[tuple[int, bytes]]: (número de la primera partida del lote, registros del lote).
+
+    Raises:
+        - ValueError: Si el corpus no empieza con un evento INICIO.
+    """
+    pendiente = b""
+    primera = 0
+    for bloque in leer_bloques(ruta):
+        datos = pendiente + bloque
+        if primera == 0 and datos and datos[0] != INICIO:
+            raise ValueError(f"{ruta}: el corpus debe comenzar con un evento de inicio")
+        posiciones = _inicios(datos)
+        # La última partida puede seguir en el próximo bloque
+        completas = len(posiciones) - 1
+        desde = 0
+        while completas >= tamano_lote:
+            hasta = posiciones[tamano_lote]
+            yield primera, datos[desde:hasta]
+            posiciones = posiciones[tamano_lote:]
+            desde = hasta
+            primera += tamano_lote
+            completas -= tamano_lote
+        pendiente = datos[desde:]
+    if pendiente:
+        yield primera, pendiente
+
+
+def verificar_partida(datos: bytes) -> DivergenciaRegistro | None:
+    """Rehace una partida a partir de sus registros; devuelve la primera divergencia o None."""
+    try:
+        reconstruir(decodificar_eventos(datos))
+    except DivergenciaRegistro as divergencia:
+        return divergencia
+    return None
+
+
+def _verificar_lote(primera: int, datos: bytes) -> tuple[int, int, list]:
+    """Verifica las partidas de un lote; devuelve (partidas, eventos, fallas)."""
+    posiciones = _inicios(datos) + [len(datos)]
+    fallas = []
+    for numero, (desde, hasta) in enumerate(zip(posiciones, posiciones[1:]), primera):
+        divergencia = verificar_partida(datos[desde:hasta])
+        if divergencia is not None:
+            fallas.append((numero, divergencia.evento, divergencia.mensaje))
+    return len(posiciones) - 1, len(datos) // REGISTRO.size, fallas
+
+
+def verificar_corpus(ruta: str, procesos: int | None = None, tamano_lote: int = 2000) -> dict:
+    """
+    Rehace todas las partidas de un corpus y reúne las que no coinciden con lo grabado.
+
+    Args:
+        - ruta (str): Corpus (".gz" o sin comprimir).
+        - procesos (int | None): Procesos del pool (None = núcleos disponibles, 1 = sin pool).
+        - tamano_lote (int): Partidas por tarea enviada al pool.
+
+    Returns:
+        - dict: partidas, eventos, fallas (lista ordenada de (partida, evento, mensaje)),
+          segundos y partidas por segundo.
+    """
+    partidas = eventos = 0
+    fallas = []
+
+    def acumular(resultado):
+        nonlocal partidas, eventos
+        partidas += resultado[0]
+        eventos += resultado[1]
+        fallas.extend(resultado[2])
+
+    inicio = time.perf_counter()
+    lotes = partidas_del_corpus(ruta, tamano_lote)
+    if procesos == 1:
+        for primera, datos in lotes:
+            acumular(_verificar_lote(primera, datos))
+    else:
+        # El pool se importa solo si se usa: los procesos de trabajo no lo necesitan
+        from concurrent.futures import ProcessPoolExecutor
+
+        procesos = procesos or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=procesos) as pool:
+            # Pocas tareas en vuelo: pool.map enviaría el corpus completo de una vez
+            pendientes = deque()
+            for primera, datos in lotes:
+                pendientes.append(pool.submit(_verificar_lote, primera, datos))
+                if len(pendientes) >= 2 * procesos:
+                    acumular(pendientes.popleft().result())
+            while pendientes:
+                acumular(pendientes.popleft().result())
+    segundos = time.perf_counter() - inicio
+
+    fallas.sort()
+    return {
+        "partidas": partidas,
+        "eventos": eventos,
+        "fallas": fallas,
+        "segundos": segundos,
+        "partidas_por_segundo": partidas / segundos if segundos > 0 else float("inf"),
+    }
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Verifica un corpus de partidas grabadas contra el código actual.")
+    parser.add_argument("corpus", help="Registro de partidas (.gz o sin comprimir)")
+    parser.add_argument("--procesos", type=int, default=None, help="Procesos de verificación (por omisión, todos los núcleos)")
+    parser.add_argument("--lote", type=int, default=2000, help="Partidas por tarea")
+    parser.add_argument("--mostrar", type=int, default=20, help="Fallas a listar")
+    args = parser.parse_args(argv)
+
+    resultado = verificar_corpus(args.corpus, args.procesos, args.lote)
+    for numero, evento, mensaje in resultado["fallas"][:args.mostrar]:
+        print(f"partida {numero}, evento {evento}: {mensaje}")
+    print(
+        f"{resultado['partidas']:,} partidas, {resultado['eventos']:,} eventos, "
+        f"{len(resultado['fallas']):,} con diferencias, {resultado['segundos']:.1f} s "
+        f"({resultado['partidas_por_segundo']:,.0f} partidas/s)"
+    )
+    return 1 if resultado["fallas"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
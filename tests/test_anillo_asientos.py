@@ -0,0 +1,78 @@
+import pytest
+from src.juego.anillo_asientos import AnilloAsientos
+
+
+def test_recorrido_inicial():
+    anillo = AnilloAsientos(4)
+    assert list(anillo) == [0, 1, 2, 3]
+    assert len(anillo) == 4
+    assert anillo.siguiente(3) == 0
+    assert anillo.anterior(0) == 3
+
+
+def test_quitar_salta_asientos_en_ambos_sentidos():
+    anillo = AnilloAsientos(5)
+    anillo.quitar(1)
+    anillo.quitar(2)
+    assert list(anillo) == [0, 3, 4]
+    assert anillo.siguiente(0) == 3
+    assert anillo.anterior(3) == 0
+    assert 2 not in anillo and 3 in anillo
+    # Desde un asiento eliminado se llega al próximo activo
+    assert anillo.siguiente(1) == 3
+    assert anillo.anterior(2) == 0
+    anillo.quitar(2)  # quitar dos veces no cambia nada
+    assert len(anillo) == 3
+
+
+def test_primero_se_actualiza():
+    anillo = AnilloAsientos(3)
+    anillo.quitar(0)
+    assert anillo.primero == 1
+    assert list(anillo) == [1, 2]
+    anillo.quitar(1)
+    anillo.quitar(2)
+    assert anillo.primero is None
+    assert list(anillo) == []
+    with pytest.raises(ValueError):
+        anillo.siguiente(0)
+
+
+def test_insertar_repone_el_asiento_entre_sus_vecinos():
+    anillo = AnilloAsientos(5)
+    anillo.quitar(3)
+    anillo.quitar(2)
+    anillo.quitar(0)
+    anillo.insertar(3)
+    assert list(anillo) == [1, 3, 4]
+    assert anillo.siguiente(2) == 3
+    anillo.insertar(0)
+    assert anillo.primero == 0
+    assert list(anillo) == [0, 1, 3, 4]
+    assert anillo.anterior(0) == 4
+
+
+def _proximo_activo(anillo, asiento, paso):
+    n = len(anillo._presente)
+    asiento = (asiento + paso) % n
+    while asiento not in anillo:
+        asiento = (asiento + paso) % n
+    return asiento
+
+
+def test_enlaces_siempre_apuntan_a_un_activo():
+    import random
+
+    rng = random.Random(3)
+    anillo = AnilloAsientos(12)
+    derecha, izquierda = anillo.enlaces(True), anillo.enlaces(False)
+    for _ in range(200):
+        asiento = rng.randrange(12)
+        if asiento in anillo and len(anillo) > 1:
+            anillo.quitar(asiento)
+        else:
+            anillo.insertar(asiento)
+        for i in range(12):
+            assert derecha[i] == anillo.siguiente(i) == _proximo_activo(anillo, i, 1)
+            assert izquierda[i] == anillo.anterior(i) == _proximo_activo(anillo, i, -1)
+        assert anillo.primero == min(anillo)
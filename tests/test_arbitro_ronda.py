@@ -3,6 +3,7 @@ import sys
 import pytest
 from src.juego.arbitro_ronda import ArbitroRonda
 from src.juego.cacho import Cacho
+from src.juego.mesa import Mesa
 
 
 class TestArbitroRonda:
@@ -36,6 +37,18 @@ class TestArbitroRonda:
         assert arbitro_ronda.dudar(cachos, (3, 2), obligado, 0, 1) == False
         assert arbitro_ronda.dudar(cachos, (1, 2), obligado, 0, 1) == False
 
+    def test_duda_con_histograma_de_mesa(self, mocker):
+        mocker.patch("src.servicios.generador_aleatorio.random.randint", side_effect=[1, 2, 2, 3, 4, 1, 1, 5, 6, 6])
+        cachos = [Cacho() for _ in range(2)]
+        mesa = Mesa(cachos)
+        for cacho in cachos:
+            cacho.agitar()
+        arbitro_ronda = ArbitroRonda()
+        # Hay 2 Tontos y 3 Ases: sin obligado cuentan 5, con obligado 2
+        assert arbitro_ronda.dudar(cachos, (5, 2), False, 0, 1, mesa) == False
+        assert arbitro_ronda.dudar(cachos, (3, 2), True, 0, 1, mesa) == True
+        assert arbitro_ronda.calzar(cachos, (3, 1), False, 0, mesa) == True
+
     def test_calzar_correcta(self, mocker):
         mocker.patch("src.servicios.generador_aleatorio.random.randint", return_value=2)
         cachos = [Cacho() for _ in range(2)]
@@ -169,4 +182,54 @@ class TestArbitroRonda:
         cachos[indice_calzo].quitar_dado()
 
         assert len(cachos[indice_calzo].get_dados()) == 1
-        assert arbitro_ronda.validar_calzar(cachos, indice_calzo) == True
\ No newline at end of file
+        assert arbitro_ronda.validar_calzar(cachos, indice_calzo) == True
+
+    def test_validar_calzar_con_totales_de_mesa(self):
+        cachos = [Cacho() for _ in range(3)]
+        mesa = Mesa(cachos)
+        arbitro_ronda = ArbitroRonda()
+        for paso in range(14):
+            cachos[paso % 3].quitar_dado()
+            for indice_calzo in range(3):
+                assert arbitro_ronda.validar_calzar(cachos, indice_calzo, mesa) == arbitro_ronda.validar_calzar(cachos, indice_calzo)
+
+    def test_lote_coincide_con_metodos_escalares(self):
+        np = pytest.importorskip("numpy")
+        rng = np.random.default_rng(5)
+        arbitro_ronda = ArbitroRonda()
+        filas = 400
+        histogramas = np.zeros((filas, 7), dtype=np.int16)
+        apuestas = np.stack([rng.integers(1, 12, filas), rng.integers(1, 7, filas)], axis=1)
+        obligado = rng.random(filas) < 0.3
+        dudo, apostador = rng.integers(0, 3, filas), rng.integers(0, 3, filas)
+
+        resultados_duda = []
+        resultados_calce = []
+        for i in range(filas):
+            valores = [bytes(rng.integers(1, 7, rng.integers(1, 6))) for _ in range(3)]
+            for cara in b"".join(valores):
+                histogramas[i, cara] += 1
+
+            def cachos_de_la_fila():
+                cachos = [Cacho() for _ in valores]
+                for cacho, v in zip(cachos, valores):
+                    cacho.restaurar(v)
+                return cachos
+
+            apuesta = tuple(int(x) for x in apuestas[i])
+            cachos = cachos_de_la_fila()
+            resultado = arbitro_ronda.dudar(cachos, apuesta, bool(obligado[i]), int(dudo[i]), int(apostador[i]))
+            perdedor = next(j for j, c in enumerate(cachos) if c.cantidad_dados() < len(valores[j]))
+            resultados_duda.append((resultado, perdedor))
+            resultados_calce.append(arbitro_ronda.calzar(cachos_de_la_fila(), apuesta, bool(obligado[i]), 0))
+
+        resultado, perdedor = arbitro_ronda.dudar_lote(histogramas, apuestas, obligado, dudo, apostador)
+        assert list(zip(resultado.tolist(), perdedor.tolist())) == resultados_duda
+        resultado, perdedor = arbitro_ronda.calzar_lote(histogramas, apuestas, obligado, 0)
+        assert resultado.tolist() == resultados_calce
+        assert perdedor.tolist() == [-1 if r else 0 for r in resultados_calce]
+
+    def test_lote_rechaza_histogramas_mal_formados(self):
+        np = pytest.importorskip("numpy")
+        with pytest.raises(ValueError):
+            ArbitroRonda().dudar_lote(np.zeros((3, 6)), np.ones((3, 2), dtype=int), False, 0, 1)
@@ -14,6 +14,41 @@ class TestCacho:
         for dado in cacho.get_dados():
             assert dado.get_pinta() == "Quina"
 
+    def test_agitar_una_sola_llamada_al_generador(self, mocker):
+        generador = mocker.Mock()
+        generador.generar_muchos.return_value = [1, 2, 3, 4, 5]
+        cacho = Cacho(generador)
+        cacho.agitar()
+        generador.generar_muchos.assert_called_once_with(5)
+        generador.generar.assert_not_called()
+        assert [dado.get_valor() for dado in cacho.get_dados()] == [1, 2, 3, 4, 5]
+
+    def test_valores_empaquetados(self, mocker):
+        mocker.patch("src.servicios.generador_aleatorio.random.randint", side_effect=[1, 2, 3, 4, 5])
+        cacho = Cacho()
+        cacho.agitar()
+        assert cacho.get_valores() == bytes([1, 2, 3, 4, 5])
+        assert cacho.cantidad_dados() == 5
+        assert not hasattr(cacho, "__dict__")
+
+    def test_histograma_se_actualiza(self, mocker):
+        mocker.patch("src.servicios.generador_aleatorio.random.randint", side_effect=[1, 1, 3, 6, 6])
+        cacho = Cacho()
+        assert list(cacho.get_histograma()) == [5, 0, 0, 0, 0, 0, 0]
+        cacho.agitar()
+        assert list(cacho.get_histograma()) == [0, 2, 0, 1, 0, 0, 2]
+        cacho.quitar_dado()
+        assert list(cacho.get_histograma()) == [0, 2, 0, 1, 0, 0, 1]
+        cacho.añadir_dado()
+        assert list(cacho.get_histograma()) == [1, 2, 0, 1, 0, 0, 1]
+
+    def test_restaurar(self):
+        cacho = Cacho()
+        cacho.restaurar(bytes([2, 2, 5]), reserva=1)
+        assert cacho.get_valores() == bytes([2, 2, 5])
+        assert cacho.reserva == 1
+        assert list(cacho.get_histograma()) == [0, 0, 2, 0, 0, 1, 0]
+
     def test_añadir_dado(self):
         cacho = Cacho()
         #Se debe quitar un dado porque no puede haber mas de 5 dados en un cacho
@@ -0,0 +1,91 @@
+import pytest
+from src.juego.conjunto_informacion import (
+    MANOS, MAX_JUGADORES, codificar_informacion, codificar_vista, decodificar_informacion, indice_mano,
+)
+from src.juego.gestor_partida import GestorPartida
+from src.juego.vista_partida import VistaPartida
+from src.servicios.generador_aleatorio import Generador_Aleatorio
+
+
+@pytest.fixture
+def partida():
+    gp = GestorPartida(["A", "B", "C", "D"], Generador_Aleatorio(semilla=7))
+    gp.iniciar_ronda()
+    return gp
+
+
+def test_hay_462_manos_distintas():
+    assert len(MANOS) == len(set(MANOS)) == 462
+    assert max(indice_mano((0,) + mano) for mano in MANOS) < 512
+
+
+def test_ida_y_vuelta(partida):
+    partida.apostar(0, (3, 4))
+    partida.cachos[2].quitar_dado()
+    partida.obligado = True
+    partida.pinta_fija = 4
+    campos = decodificar_informacion(codificar_informacion(partida, 1), 4)
+    assert campos["histograma"] == tuple(partida.cachos[1].get_histograma()[1:])
+    assert campos["apuesta"] == (3, 4)
+    assert campos["obligado"] is True
+    assert campos["pinta_fija"] == 4
+    # Rivales en orden de juego desde el asiento 1 hacia la derecha: 2, 3, 0
+    assert campos["rivales"] == (4, 5, 5)
+
+
+def test_sin_apuesta_ni_pinta_fija(partida):
+    campos = decodificar_informacion(codificar_informacion(partida, 0), 4)
+    assert campos["apuesta"] is None
+    assert campos["obligado"] is False
+    assert campos["pinta_fija"] is None
+
+
+def test_el_orden_de_los_dados_no_cambia_la_clave(partida):
+    clave = codificar_informacion(partida, 0)
+    cacho = partida.cachos[0]
+    cacho.restaurar(bytes(reversed(cacho.get_valores())))
+    assert codificar_informacion(partida, 0) == clave
+    assert codificar_vista(VistaPartida(partida, 0)) == clave
+
+
+def test_los_rivales_siguen_el_sentido(partida):
+    partida.cachos[1].quitar_dado()
+    assert decodificar_informacion(codificar_informacion(partida, 0), 4)["rivales"] == (4, 5, 5)
+    partida.sentido = "izquierda"
+    assert decodificar_informacion(codificar_informacion(partida, 0), 4)["rivales"] == (5, 5, 4)
+
+
+@pytest.mark.parametrize("apariciones", [20, 21, 63, 64, 127, 10_000])
+def test_apuestas_por_sobre_los_dados_en_mesa(partida, apariciones):
+    # 20 dados en mesa: desde 21 apariciones todas las apuestas son igual de imposibles
+    assert partida.apostar(0, (apariciones, 3))
+    campos = decodificar_informacion(codificar_informacion(partida, 1), 4)
+    assert campos["apuesta"] == (min(apariciones, 21), 3)
+    assert campos["obligado"] is False
+    assert campos["pinta_fija"] is None
+
+
+def test_estados_distintos_dan_claves_distintas(partida):
+    claves = {codificar_informacion(partida, 0)}
+    partida.apostar(0, (2, 3))
+    claves.add(codificar_informacion(partida, 0))
+    partida.apostar(1, (2, 4))
+    claves.add(codificar_informacion(partida, 0))
+    partida.cachos[3].quitar_dado()
+    claves.add(codificar_informacion(partida, 0))
+    assert len(claves) == 4
+
+
+def test_cabe_en_64_bits_con_el_maximo_de_jugadores():
+    gp = GestorPartida([str(i) for i in range(MAX_JUGADORES)], Generador_Aleatorio(semilla=1))
+    gp.iniciar_ronda()
+    gp.apuesta_actual = (60, 6)
+    gp.obligado = True
+    gp.pinta_fija = 6
+    assert codificar_informacion(gp, 0) < 2 ** 64
+
+
+def test_demasiados_jugadores():
+    gp = GestorPartida([str(i) for i in range(MAX_JUGADORES + 1)], Generador_Aleatorio(semilla=1))
+    with pytest.raises(ValueError):
+        codificar_informacion(gp, 0)
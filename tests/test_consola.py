@@ -0,0 +1,39 @@
+import subprocess
+import sys
+
+from src.juego.consola import main
+
+
+class TestMainIntegration:
+    def test_main_flujo_minimo(self, mocker):
+        mocker.patch("builtins.input", side_effect=[
+            "2", "Ana", "Beto",  # jugadores
+            "derecha",  # sentido
+            "A", "2", "3",  # apuesta válida
+            "D"  # dudar → termina la ronda
+        ])
+        mocker.patch("time.sleep")
+        mocker.patch("os.system")
+        mocker.patch("src.juego.consola.animar_dados")
+        mocker.patch("src.juego.consola.animar_texto")
+
+        # 🔑 forzar que después de la primera ronda el juego termine
+        mocker.patch("src.juego.consola.GestorPartida.hay_ganador", side_effect=[False, True, True])
+        mocker.patch("src.juego.consola.GestorPartida.ganador", return_value="Ana")
+
+        main()
+
+
+def test_logica_no_importa_la_consola():
+    codigo = (
+        "import sys, src.juego.partida_headless, src.juego.jugadores, src.servicios.torneo;"
+        "print(sorted(m for m in ('src.juego.consola', 'typing', 'numpy', 'concurrent.futures') if m in sys.modules))"
+    )
+    salida = subprocess.run([sys.executable, "-c", codigo], capture_output=True, text=True, check=True).stdout
+    assert salida.strip() == "[]"
+
+
+def test_paquete_juego_importa_al_usar():
+    codigo = "import sys, src.juego as j; antes = 'src.juego.gestor_partida' in sys.modules; j.GestorPartida; print(antes, 'src.juego.gestor_partida' in sys.modules)"
+    salida = subprocess.run([sys.executable, "-c", codigo], capture_output=True, text=True, check=True).stdout
+    assert salida.split() == ["False", "True"]
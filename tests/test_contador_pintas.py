@@ -28,4 +28,15 @@ def test_contar_pinta_obligado():
     assert contadorPintas.contar_pinta(dados, 3, True) == 2
     assert contadorPintas.contar_pinta(dados, 4, True) == 2
     assert contadorPintas.contar_pinta(dados, 5, True) == 2
-    assert contadorPintas.contar_pinta(dados, 6, True) == 2
\ No newline at end of file
+    assert contadorPintas.contar_pinta(dados, 6, True) == 2
+
+def test_contar_en_histograma_igual_que_contar_pinta():
+    dados = [Mock() for _ in range(12)]
+    for i in range(12):
+        dados[i].get_valor.return_value = (i % 6) + 1
+    histograma = [0, 2, 2, 2, 2, 2, 2]
+    contadorPintas = ContadorPintas()
+    for pinta in range(1, 7):
+        for obligado in (True, False):
+            assert contadorPintas.contar_en_histograma(histograma, pinta, obligado) == \
+                contadorPintas.contar_pinta(dados, pinta, obligado)
@@ -1,5 +1,6 @@
 import pytest
 from src.juego.dado import Dado
+from src.juego.cacho import Cacho
 from src.servicios.generador_aleatorio import Generador_Aleatorio
 
 class TestDado:
@@ -17,4 +18,17 @@ class TestDado:
         dado = Dado()
         assert str(dado) == "No lanzado"
         dado.lanzar()
-        assert str(dado) == dado.get_pinta()
\ No newline at end of file
+        assert str(dado) == dado.get_pinta()
+
+    def test_dado_no_tiene_dict(self):
+        assert not hasattr(Dado(), "__dict__")
+
+    def test_vista_de_cacho_lee_y_escribe_en_el_cacho(self):
+        cacho = Cacho()
+        dado = cacho.get_dados()[2]
+        assert dado.get_valor() is None
+        assert str(dado) == "No lanzado"
+        dado.asignar(6)
+        assert cacho.get_valores()[2] == 6
+        assert dado.get_pinta() == "Sexto"
+        assert str(dado) == "Sexto"
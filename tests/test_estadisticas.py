@@ -0,0 +1,95 @@
+import random
+
+import pytest
+from src.juego.jugadores import JugadorAleatorio, JugadorUmbral
+from src.juego.partida_headless import jugar_partida
+from src.servicios.estadisticas import (
+    EstadisticasReglas,
+    Histograma,
+    Welford,
+    estadisticas_en_paralelo,
+    eventos_simulados,
+)
+from src.servicios.generador_aleatorio import Generador_Aleatorio
+from src.servicios.registro_partida import RegistroBinario, RegistroEventos, leer_eventos
+
+
+def test_welford_y_fusion():
+    valores = [random.Random(1).gauss(10, 3) for _ in range(50)] + list(range(30))
+    completo, izquierda, derecha = Welford(), Welford(), Welford()
+    for valor in valores:
+        completo.agregar(valor)
+    for valor in valores[:17]:
+        izquierda.agregar(valor)
+    for valor in valores[17:]:
+        derecha.agregar(valor)
+    izquierda.fusionar(derecha)
+    media = sum(valores) / len(valores)
+    varianza = sum((v - media) ** 2 for v in valores) / (len(valores) - 1)
+    assert izquierda.n == completo.n == len(valores)
+    assert izquierda.media == pytest.approx(media) and completo.media == pytest.approx(media)
+    assert izquierda.varianza == pytest.approx(varianza) and completo.varianza == pytest.approx(varianza)
+
+
+def test_histograma():
+    histograma = Histograma(0, 5, 4)
+    for valor in (-1, 0, 4, 5, 14, 15, 100):
+        histograma.agregar(valor)
+    assert histograma.conteos == [3, 1, 1, 2]
+    with pytest.raises(ValueError):
+        histograma.fusionar(Histograma(0, 5, 3))
+
+
+def test_registro_en_memoria_igual_al_binario(tmp_path):
+    ruta = str(tmp_path / "partida.dudo")
+    jugadores = lambda: [JugadorAleatorio(semilla=i) for i in range(3)]
+    en_memoria = RegistroEventos()
+    jugar_partida(jugadores(), Generador_Aleatorio(semilla=6), en_memoria)
+    with RegistroBinario(ruta) as registro:
+        jugar_partida(jugadores(), Generador_Aleatorio(semilla=6), registro)
+    assert en_memoria.eventos == list(leer_eventos(ruta))
+
+
+def test_estadisticas_de_partidas():
+    fabricas = [JugadorAleatorio, JugadorUmbral, JugadorAleatorio]
+    estadisticas = EstadisticasReglas().consumir(eventos_simulados(fabricas, 40, semilla=2))
+    assert estadisticas.partidas == 40
+    assert sum(estadisticas.victorias_por_asiento) == sum(estadisticas.victorias_por_posicion) == 40
+    assert estadisticas.dudas + estadisticas.calces == estadisticas.rondas_jugadas
+    assert estadisticas.rondas.n == 40
+    assert estadisticas.rondas.media * 40 == pytest.approx(estadisticas.rondas_jugadas)
+    assert sum(estadisticas.histograma_rondas.conteos) == 40
+    assert estadisticas.obligado_abierta + estadisticas.obligado_cerrada <= estadisticas.rondas_obligadas
+
+    resumen = estadisticas.resumen()
+    assert sum(resumen["victorias_por_asiento"]) == pytest.approx(1.0)
+    assert 0 < resumen["dudas_acertadas"] < 1
+
+
+def test_posicion_en_el_sentido_de_juego():
+    def partida(sentido):
+        # 4 jugadores, inicia el 1 y gana el 0 al sacarle el último dado al 3
+        return [
+            ("inicio", 4, ()), ("inicial", 1, ()), ("sentido", 0, (sentido,)),
+            ("calce", 1, (0, 0, 0)), ("calce", 2, (0, 0, 0)), ("calce", 3, (0, 0, 0)),
+        ]
+
+    derecha = EstadisticasReglas().consumir(partida("derecha"))
+    izquierda = EstadisticasReglas().consumir(partida("izquierda"))
+    # Hacia la derecha el 0 juega último (1, 2, 3, 0); hacia la izquierda, segundo (1, 0, 3, 2)
+    assert derecha.victorias_por_posicion == [0, 0, 0, 1]
+    assert izquierda.victorias_por_posicion == [0, 1, 0, 0]
+    assert derecha.victorias_por_asiento == izquierda.victorias_por_asiento == [1, 0, 0, 0]
+
+
+def test_fusion_exacta_en_paralelo():
+    fabricas = [JugadorAleatorio] * 3
+    una_pasada = EstadisticasReglas().consumir(eventos_simulados(fabricas, 30, semilla=4))
+    for procesos in (1, 2):
+        fusionadas = estadisticas_en_paralelo(fabricas, 30, procesos=procesos, semilla=4, tamano_lote=7)
+        for nombre in EstadisticasReglas._CONTADORES + ("victorias_por_asiento", "victorias_por_posicion"):
+            assert getattr(fusionadas, nombre) == getattr(una_pasada, nombre)
+        assert fusionadas.histograma_rondas.conteos == una_pasada.histograma_rondas.conteos
+        assert fusionadas.rondas.n == una_pasada.rondas.n
+        assert fusionadas.rondas.media == pytest.approx(una_pasada.rondas.media)
+        assert fusionadas.rondas.varianza == pytest.approx(una_pasada.rondas.varianza)
@@ -0,0 +1,41 @@
+from src.servicios.generador_aleatorio import Generador_Aleatorio
+
+
+class TestGeneradorAleatorio:
+    def test_valores_entre_1_y_6(self):
+        generador = Generador_Aleatorio(semilla=7)
+        valores = generador.generar_muchos(1000)
+        assert len(valores) == 1000
+        assert set(valores) == {1, 2, 3, 4, 5, 6}
+
+    def test_misma_semilla_misma_secuencia(self):
+        a = Generador_Aleatorio(semilla=42)
+        b = Generador_Aleatorio(semilla=42)
+        assert [a.generar() for _ in range(50)] == [b.generar() for _ in range(50)]
+
+    def test_generar_muchos_sigue_la_secuencia_de_generar(self):
+        # El buffer no debe alterar la secuencia aunque se crucen sus bordes
+        a = Generador_Aleatorio(semilla=3, tamano_buffer=8)
+        b = Generador_Aleatorio(semilla=3, tamano_buffer=8)
+        uno_a_uno = [a.generar() for _ in range(40)]
+        en_bloque = b.generar_muchos(5) + [b.generar()] + b.generar_muchos(20) + b.generar_muchos(14)
+        assert en_bloque == uno_a_uno
+
+    def test_sembrar_reinicia_la_secuencia(self):
+        generador = Generador_Aleatorio(semilla=1)
+        primera = generador.generar_muchos(10)
+        generador.sembrar(1)
+        assert generador.generar_muchos(10) == primera
+
+    def test_derivar_flujos_independientes_y_reproducibles(self):
+        base = Generador_Aleatorio(semilla=5)
+        mesa_0 = base.derivar(0).generar_muchos(30)
+        mesa_1 = base.derivar(1).generar_muchos(30)
+        assert mesa_0 != mesa_1
+        assert Generador_Aleatorio(semilla=5).derivar(0).generar_muchos(30) == mesa_0
+
+    def test_sin_semilla_usa_random_global(self, mocker):
+        mocker.patch("src.servicios.generador_aleatorio.random.randint", return_value=4)
+        generador = Generador_Aleatorio()
+        assert generador.generar() == 4
+        assert generador.generar_muchos(3) == [4, 4, 4]
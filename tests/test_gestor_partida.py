@@ -1,6 +1,7 @@
+import copy
 import pytest
-import builtins
-from src.juego.gestor_partida import GestorPartida, main
+from src.juego.gestor_partida import GestorPartida
+from src.servicios.generador_aleatorio import Generador_Aleatorio
 
 class TestGestorPartida:
     def test_init_requires_at_least_two_players(self):
@@ -70,6 +71,15 @@ class TestGestorPartida:
         idx = gp.determinar_inicial()
         assert idx in (0, 1)
 
+    def test_misma_semilla_misma_partida(self):
+        valores = []
+        for _ in range(2):
+            gp = GestorPartida(["A", "B", "C"], Generador_Aleatorio(semilla=11))
+            inicial = gp.determinar_inicial()
+            gp.iniciar_ronda()
+            valores.append((inicial, [[d.get_valor() for d in c.get_dados()] for c in gp.cachos]))
+        assert valores[0] == valores[1]
+
     def test_definir_sentido(self):
         gp = GestorPartida(["A", "B"])
         gp.definir_sentido("izquierda")
@@ -128,6 +138,50 @@ class TestGestorPartida:
         gp.definir_sentido("izquierda")
         assert gp.siguiente_jugador(0) == 2
 
+    def test_siguiente_jugador_salta_eliminados(self):
+        gp = GestorPartida(["A", "B", "C", "D"])
+        for _ in range(5):
+            gp.cachos[1].quitar_dado()
+        assert gp.activos == [0, 2, 3]
+        assert gp.siguiente_jugador(0) == 2
+        assert gp.siguiente_jugador(1) == 2
+        gp.definir_sentido("izquierda")
+        assert gp.siguiente_jugador(2) == 0
+        assert gp.siguiente_jugador(0) == 3
+
+    def test_sentido_es_una_sola_representacion(self):
+        gp = GestorPartida(["A", "B", "C", "D", "E"])
+        gp.sentido = "izquierda"
+        assert gp.siguiente_jugador(0) == 4
+        with pytest.raises(ValueError):
+            gp.sentido = "arriba"
+        assert not hasattr(gp, "sentido_horario")
+        # Desde un asiento eliminado hace rato se llega igual al próximo activo
+        for asiento in (3, 4, 2):
+            for _ in range(5):
+                gp.cachos[asiento].quitar_dado()
+        assert gp.siguiente_jugador(3) == 1
+        gp.sentido = "derecha"
+        assert gp.siguiente_jugador(3) == 0
+
+    def test_empate_inicial_no_elimina_jugadores(self, mocker):
+        gp = GestorPartida(["A", "B", "C"])
+        tirar = mocker.patch.object(gp, "_tirar_dados", side_effect=[[6, 6, 2], [3, 5]])
+        assert gp.determinar_inicial() == 1
+        assert gp.activos == [0, 1, 2]
+        # Una tirada en bloque por vuelta, y en el desempate solo tiran los empatados
+        assert [llamada.args for llamada in tirar.call_args_list] == [(3,), (2,)]
+
+    def test_determinar_inicial_misma_secuencia_que_dado_a_dado(self):
+        # generar_muchos entrega la misma secuencia que generar(), así las partidas con semilla no cambian
+        inicial = GestorPartida(["A", "B", "C", "D"], Generador_Aleatorio(semilla=21)).determinar_inicial()
+        generador = Generador_Aleatorio(semilla=21)
+        candidatos = [0, 1, 2, 3]
+        while len(candidatos) > 1:
+            tiradas = [generador.generar() for _ in candidatos]
+            candidatos = [c for c, v in zip(candidatos, tiradas) if v == max(tiradas)]
+        assert inicial == candidatos[0]
+
     def test_hay_ganador_y_ganador(self):
         gp = GestorPartida(["A", "B"])
         # quitar todos los dados de B
@@ -136,22 +190,82 @@ class TestGestorPartida:
         assert gp.hay_ganador() is True
         assert gp.ganador() == "A"
 
+    def _partida_avanzada(self):
+        gp = GestorPartida(["A", "B", "C"], Generador_Aleatorio(semilla=4))
+        gp.definir_sentido("izquierda")
+        gp.iniciar_ronda()
+        gp.apostar(0, (2, 3))
+        gp.dudar(1)
+        gp.cachos[2].añadir_dado()  # queda en reserva
+        gp.iniciar_ronda()
+        gp.apostar(1, (3, 4))
+        return gp
+
+    def test_instantanea_y_restaurar_sin_perdidas(self):
+        gp = self._partida_avanzada()
+        instantanea = gp.instantanea()
+        hash(instantanea)  # inmutable
+        histograma = list(gp.mesa.histograma)
+
+        gp.dudar(2)
+        gp.iniciar_ronda()
+        gp.configurar_obligado("abierta", 5)
+        gp.definir_sentido("derecha")
+        assert gp.instantanea() != instantanea
+
+        gp.restaurar(instantanea)
+        assert gp.instantanea() == instantanea
+        assert gp.mesa.histograma == histograma
+        assert gp.cachos[2].reserva == 1
+
+    def test_restaurar_otra_cantidad_de_jugadores(self):
+        with pytest.raises(ValueError):
+            GestorPartida(["A", "B"]).restaurar(self._partida_avanzada().instantanea())
+
+    def test_restaurar_rechazada_no_cambia_la_partida(self):
+        gp = GestorPartida(["A", "B"], Generador_Aleatorio(3))
+        gp.iniciar_ronda()
+        antes = gp.instantanea()
+        ajena = self._partida_avanzada().instantanea()
+        invalidas = [
+            ajena,
+            (antes[0], "arriba") + antes[2:],
+            ((antes[0][0], (bytes([7]), 0)),) + antes[1:],
+            antes[:7],
+        ]
+        for instantanea in invalidas:
+            with pytest.raises(ValueError):
+                gp.restaurar(instantanea)
+            assert gp.instantanea() == antes
+
+    def test_clonar_es_independiente(self):
+        gp = self._partida_avanzada()
+        clon = gp.clonar()
+        assert clon.instantanea() == gp.instantanea()
+        assert clon.instantanea() == copy.deepcopy(gp).instantanea()
+        assert clon.arbitro is gp.arbitro and clon.validador is gp.validador
+        assert clon.mesa.histograma == gp.mesa.histograma
+
+        antes = gp.instantanea()
+        clon.dudar(2)
+        clon.iniciar_ronda()
+        assert gp.instantanea() == antes
+        assert clon.mesa.cachos is clon.cachos
+
+    def test_clonar_no_altera_los_dados_de_la_original(self):
+        testigo = GestorPartida(["A", "B", "C"], Generador_Aleatorio(11))
+        gp = GestorPartida(["A", "B", "C"], Generador_Aleatorio(11))
+        clon = gp.clonar()
+        assert clon.generador is not gp.generador
+        for _ in range(3):
+            clon.iniciar_ronda()
+        for _ in range(3):
+            testigo.iniciar_ronda()
+            gp.iniciar_ronda()
+            assert gp.instantanea() == testigo.instantanea()
+        # Dos clones de la misma partida tiran lo mismo: buscar sobre clones es reproducible
+        otro, otro_mas = gp.clonar(), gp.clonar()
+        otro.iniciar_ronda()
+        otro_mas.iniciar_ronda()
+        assert otro.instantanea() == otro_mas.instantanea()
 
-class TestMainIntegration:
-    def test_main_flujo_minimo(self, mocker):
-        mocker.patch("builtins.input", side_effect=[
-            "2", "Ana", "Beto",  # jugadores
-            "derecha",  # sentido
-            "A", "2", "3",  # apuesta válida
-            "D"  # dudar → termina la ronda
-        ])
-        mocker.patch("time.sleep")
-        mocker.patch("os.system")
-        mocker.patch("src.juego.gestor_partida.animar_dados")
-        mocker.patch("src.juego.gestor_partida.animar_texto")
-
-        # 🔑 forzar que después de la primera ronda el juego termine
-        mocker.patch("src.juego.gestor_partida.GestorPartida.hay_ganador", side_effect=[False, True, True])
-        mocker.patch("src.juego.gestor_partida.GestorPartida.ganador", return_value="Ana")
-
-        main()
@@ -0,0 +1,93 @@
+import pytest
+from src.juego.gestor_partida import GestorPartida
+from src.juego.jugadores import Jugador, JugadorAleatorio, JugadorFarol, JugadorUmbral, subir_sin_ciclos
+from src.juego.partida_headless import jugar_partida
+from src.juego.vista_partida import VistaPartida
+from src.servicios.generador_aleatorio import Generador_Aleatorio
+
+
+def _vista_con(mocker, valores, apuesta=None, jugadores=2):
+    mocker.patch("src.servicios.generador_aleatorio.random.randint", side_effect=list(valores))
+    partida = GestorPartida([f"J{i}" for i in range(jugadores)])
+    partida.iniciar_ronda()
+    if apuesta is not None:
+        assert partida.apostar(1, apuesta)
+    return VistaPartida(partida, 0)
+
+
+@pytest.mark.parametrize("clase", [JugadorAleatorio, JugadorUmbral, JugadorFarol])
+def test_juegan_partidas_legales(clase):
+    # jugar_partida lanza ValueError ante cualquier acción ilegal
+    for semilla in range(15):
+        jugadores = [clase(semilla=asiento) for asiento in range(2)] + [JugadorAleatorio(semilla=9), JugadorUmbral(semilla=8)]
+        resultado = jugar_partida(jugadores, Generador_Aleatorio(semilla))
+        assert resultado["ganador"] in range(4)
+
+
+def test_entre_estrategias_deterministas_la_ronda_termina():
+    resultado = jugar_partida([JugadorUmbral(semilla=0), JugadorUmbral(semilla=1)], Generador_Aleatorio(semilla=1))
+    assert resultado["apuestas"] < 500
+
+
+def test_subir_sin_ciclos():
+    assert subir_sin_ciclos(None, [(1, 2), (1, 3)], 10) == [(1, 2), (1, 3)]
+    # Desde (2, 3) subir de pinta exige las mismas apariciones; a As se respeta la regla
+    assert subir_sin_ciclos((2, 3), [(2, 1), (3, 2), (3, 3), (1, 4), (1, 5)], 10) == [(2, 1), (3, 2), (3, 3), (2, 4), (2, 5)]
+    assert subir_sin_ciclos((4, 6), [(5, 6)], 4) == []
+
+
+def test_umbral_duda_apuesta_imposible(mocker):
+    vista = _vista_con(mocker, [2, 2, 3, 3, 4] * 2, apuesta=(9, 6))
+    assert JugadorUmbral().decidir(vista, 0) == ("dudar",)
+
+
+def test_umbral_apuesta_la_pinta_que_tiene(mocker):
+    vista = _vista_con(mocker, [5, 5, 5, 1, 2] + [3] * 5)
+    accion = JugadorUmbral().decidir(vista, 0)
+    assert accion == ("apostar", (1, 5))
+
+
+def test_modelo_ajusta_el_umbral(mocker):
+    vista = _vista_con(mocker, [2, 2, 3, 3, 4] + [6] * 5, apuesta=(2, 6))
+    credulo, desconfiado = JugadorUmbral(umbral_duda=0.6), JugadorUmbral(umbral_duda=0.6)
+    # P((2, 6) cierta | mis dados) es 0.54: se duda sin información del rival
+    assert credulo.decidir(vista, 0) == ("dudar",)
+    for _ in range(10):
+        credulo.observar(vista, "duda", 0, (1, (4, 6), False))
+        desconfiado.observar(vista, "duda", 0, (1, (4, 6), True))
+    assert credulo.decidir(vista, 0)[0] == "apostar"
+    assert desconfiado.decidir(vista, 0) == ("dudar",)
+
+
+def test_farol_sube_por_sobre_lo_probable(mocker):
+    vista = _vista_con(mocker, [5, 5, 5, 1, 2] + [3] * 5)
+    farol = JugadorFarol(semilla=0, frecuencia_farol=1.0)
+    apariciones, pinta = farol.decidir(vista, 0)[1]
+    assert pinta == 5 and apariciones in (2, 3)
+
+
+def test_jugador_base():
+    with pytest.raises(NotImplementedError):
+        Jugador().decidir(None, 0)
+    assert Jugador().elegir_sentido(None, 0) == "derecha"
+
+
+def test_jugar_partida_entrega_vista_y_eventos():
+    class Espia(JugadorAleatorio):
+        def __init__(self, semilla):
+            super().__init__(semilla)
+            self.vistas, self.eventos = set(), []
+
+        def decidir(self, vista, idx_jugador):
+            self.vistas.add(type(vista))
+            return super().decidir(vista, idx_jugador)
+
+        def observar(self, vista, evento, jugador, datos):
+            self.eventos.append(evento)
+
+    espias = [Espia(i) for i in range(3)]
+    resultado = jugar_partida(espias, Generador_Aleatorio(semilla=3))
+    assert all(espia.vistas == {VistaPartida} for espia in espias)
+    assert espias[0].eventos == espias[1].eventos
+    assert espias[0].eventos.count("apuesta") == resultado["apuestas"]
+    assert espias[0].eventos.count("duda") + espias[0].eventos.count("calce") == resultado["rondas"]
@@ -0,0 +1,78 @@
+import json
+import os
+from functools import partial
+
+import pytest
+from src.juego.jugadores import JugadorAleatorio, JugadorUmbral
+from src.servicios import liga
+from src.servicios.liga import RONDAS_MAX, jugar_liga
+
+
+def test_totales_de_la_liga():
+    resultado = jugar_liga([JugadorAleatorio] * 3, partidas=30, procesos=1, fragmentos=4)
+    assert resultado["partidas"] == sum(resultado["victorias"]) == sum(resultado["duracion"]) == 30
+    assert len(resultado["duracion"]) == RONDAS_MAX + 1
+    # Cada partida de 3 jugadores termina cuando dos perdieron sus 5 dados (más los que recuperaron)
+    assert resultado["rondas"] == resultado["dudas"] + resultado["calces"]
+    assert sum(resultado["dados_perdidos"]) >= 30 * 10
+    assert resultado["dudas_acertadas"] <= resultado["dudas"]
+    assert resultado["retomadas"] == 0
+
+
+def test_resultado_no_depende_de_fragmentos_ni_procesos():
+    fabricas = [JugadorAleatorio, JugadorUmbral]
+    base = jugar_liga(fabricas, partidas=24, procesos=1, fragmentos=1, semilla=5)
+    for procesos, fragmentos in ((1, 5), (2, 3)):
+        otro = jugar_liga(fabricas, partidas=24, procesos=procesos, fragmentos=fragmentos, semilla=5)
+        for clave in ("victorias", "rondas", "duracion", "dados_perdidos", "dudas", "calces"):
+            assert otro[clave] == base[clave]
+
+
+def test_retoma_desde_el_punto_de_control(tmp_path, monkeypatch):
+    fabricas = [JugadorAleatorio] * 2
+    completa = jugar_liga(fabricas, partidas=40, procesos=1, fragmentos=2, semilla=1)
+
+    # Se simula una caída en la partida 27 (segundo fragmento, ya con 5 partidas guardadas)
+    jugar = liga.jugar_partida
+    jugadas = []
+
+    def caer(*args, **kwargs):
+        if len(jugadas) == 27:
+            raise RuntimeError("caída")
+        jugadas.append(1)
+        return jugar(*args, **kwargs)
+
+    monkeypatch.setattr(liga, "jugar_partida", caer)
+    with pytest.raises(RuntimeError):
+        jugar_liga(fabricas, partidas=40, procesos=1, fragmentos=2, semilla=1, punto_control=str(tmp_path), cada_partidas=5)
+    monkeypatch.setattr(liga, "jugar_partida", jugar)
+
+    retomada = jugar_liga(fabricas, partidas=40, procesos=1, fragmentos=2, semilla=1, punto_control=str(tmp_path), cada_partidas=5)
+    assert retomada["retomadas"] == 25
+    for clave in ("partidas", "victorias", "rondas", "duracion", "dados_perdidos", "dudas", "calces", "rondas_obligadas"):
+        assert retomada[clave] == completa[clave]
+    assert sorted(os.listdir(tmp_path)) == ["fragmento_0000.bin", "fragmento_0001.bin", "liga.json"]
+
+
+def test_punto_control_de_otra_liga(tmp_path):
+    jugar_liga([JugadorAleatorio] * 2, partidas=4, procesos=1, punto_control=str(tmp_path))
+    with pytest.raises(ValueError):
+        jugar_liga([JugadorAleatorio] * 2, partidas=8, procesos=1, punto_control=str(tmp_path))
+
+
+def test_punto_control_con_fabricas_partial(tmp_path):
+    fabricas = [partial(JugadorUmbral, umbral_duda=0.2), JugadorAleatorio]
+    completa = jugar_liga(fabricas, partidas=6, procesos=1, semilla=3)
+    guardada = jugar_liga(fabricas, partidas=6, procesos=1, semilla=3, punto_control=str(tmp_path))
+    retomada = jugar_liga(fabricas, partidas=6, procesos=1, semilla=3, punto_control=str(tmp_path))
+    assert guardada["victorias"] == retomada["victorias"] == completa["victorias"]
+    assert retomada["retomadas"] == 6
+    with open(tmp_path / "liga.json", encoding="utf-8") as archivo:
+        estrategias = json.load(archivo)["estrategias"]
+    assert estrategias == [
+        "src.juego.jugadores.JugadorUmbral(umbral_duda=0.2)",
+        "src.juego.jugadores.JugadorAleatorio",
+    ]
+    # Otros argumentos del partial son otra liga
+    with pytest.raises(ValueError):
+        jugar_liga([partial(JugadorUmbral, umbral_duda=0.3), JugadorAleatorio], partidas=6, procesos=1, semilla=3, punto_control=str(tmp_path))
@@ -0,0 +1,96 @@
+from src.juego.cacho import Cacho
+from src.juego.mesa import Mesa
+from src.servicios.generador_aleatorio import Generador_Aleatorio
+
+
+def _histograma_recorriendo(cachos):
+    histograma = [0] * 7
+    for cacho in cachos:
+        for valor in cacho.get_valores():
+            histograma[valor] += 1
+    return histograma
+
+
+def test_mesa_inicial_cuenta_dados_sin_lanzar():
+    mesa = Mesa([Cacho() for _ in range(3)])
+    assert mesa.histograma == [15, 0, 0, 0, 0, 0, 0]
+
+
+def test_histograma_de_mesa_sigue_a_los_cachos():
+    generador = Generador_Aleatorio(semilla=9)
+    cachos = [Cacho(generador) for _ in range(4)]
+    mesa = Mesa(cachos)
+    for ronda in range(20):
+        for cacho in cachos:
+            cacho.agitar()
+        assert mesa.histograma == _histograma_recorriendo(cachos)
+        cachos[ronda % 4].quitar_dado()
+        assert mesa.histograma == _histograma_recorriendo(cachos)
+        cachos[(ronda + 1) % 4].añadir_dado()
+        assert mesa.histograma == _histograma_recorriendo(cachos)
+        cachos[0].get_dados()[0].lanzar()
+        assert mesa.histograma == _histograma_recorriendo(cachos)
+
+
+def _totales_recorriendo(cachos):
+    return (
+        sum(c.cantidad_dados() for c in cachos),
+        sum(c.cantidad_dados() == 1 for c in cachos),
+        sum(c.reserva for c in cachos),
+    )
+
+
+def test_totales_de_mesa_siguen_a_los_cachos():
+    generador = Generador_Aleatorio(semilla=3)
+    cachos = [Cacho(generador) for _ in range(4)]
+    mesa = Mesa(cachos)
+    for paso in range(60):
+        cacho = cachos[generador.generar() % 4]
+        if generador.generar() <= 3:
+            cacho.quitar_dado()
+        else:
+            cacho.añadir_dado()
+        assert (mesa.total_dados, mesa.jugadores_con_un_dado, mesa.total_reservas) == _totales_recorriendo(cachos)
+        assert mesa.obligado == any(c.cantidad_dados() == 1 for c in cachos)
+    cachos[0].restaurar(bytes([4]), reserva=2)
+    assert (mesa.total_dados, mesa.jugadores_con_un_dado, mesa.total_reservas) == _totales_recorriendo(cachos)
+
+
+def test_mesa_con_cachos_ya_usados():
+    cachos = [Cacho() for _ in range(2)]
+    for _ in range(4):
+        cachos[0].quitar_dado()
+    cachos[1].añadir_dado()
+    mesa = Mesa(cachos)
+    assert (mesa.total_dados, mesa.jugadores_con_un_dado, mesa.total_reservas) == (6, 1, 1)
+    assert mesa.obligado
+
+
+def test_anillo_con_eliminaciones_pendientes():
+    cachos = [Cacho() for _ in range(3)]
+    mesa = Mesa(cachos)
+    siguientes = mesa.asientos.enlaces()
+    for _ in range(5):
+        cachos[1].quitar_dado()
+    # Quien pierde su último dado y lo recupera antes de consultar el anillo no sale de él
+    for _ in range(5):
+        cachos[2].quitar_dado()
+    cachos[2].añadir_dado()
+    assert list(mesa.asientos) == [0, 2]
+    assert siguientes[0] == 2
+    cachos[0].restaurar(b"")
+    cachos[1].restaurar(bytes([3]))
+    assert list(mesa.asientos) == [1, 2]
+
+
+def test_aplicar_eliminaciones_actualiza_los_enlaces():
+    cachos = [Cacho() for _ in range(3)]
+    mesa = Mesa(cachos)
+    siguientes = mesa.asientos.enlaces()
+    for _ in range(5):
+        cachos[1].quitar_dado()
+    assert siguientes[0] == 1
+    mesa.aplicar_eliminaciones()
+    assert siguientes[0] == 2
+    mesa.aplicar_eliminaciones()
+    assert list(mesa.asientos) == [0, 2]
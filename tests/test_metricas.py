@@ -0,0 +1,73 @@
+from src.juego.gestor_partida import GestorPartida
+from src.juego.jugadores import JugadorAleatorio
+from src.juego.partida_headless import jugar_partida
+from src.servicios.generador_aleatorio import Generador_Aleatorio
+from src.servicios.metricas import OPERACIONES, Metricas, desinstrumentar, instrumentar
+
+
+def test_cuenta_rechazos_y_calces_no_permitidos(mocker):
+    gp = GestorPartida(["A", "B"], Generador_Aleatorio(semilla=1))
+    metricas = Metricas()
+    instrumentar(gp, metricas)
+    gp.determinar_inicial()
+    gp.iniciar_ronda()
+    assert gp.apostar(0, (2, 3)) is True
+    assert gp.apostar(1, (1, 3)) is False
+    mocker.patch.object(gp.arbitro, "validar_calzar", return_value=False)
+    assert gp.calzar(1) is None
+
+    assert metricas.llamadas["apostar"] == 2
+    assert metricas.apuestas_rechazadas == 1
+    assert metricas.calces_no_permitidos == 1
+    assert metricas.llamadas["iniciar_ronda"] == 1
+    assert sum(metricas.buckets["apostar"]) == 2
+
+
+def test_desactivada_no_envuelve_nada():
+    gp = GestorPartida(["A", "B"])
+    assert all(op not in vars(gp) for op in OPERACIONES)
+    instrumentar(gp, Metricas())
+    assert all(op in vars(gp) for op in OPERACIONES)
+    desinstrumentar(gp)
+    assert all(op not in vars(gp) for op in OPERACIONES)
+    # Las demás instancias nunca se ven afectadas
+    assert "apostar" not in vars(GestorPartida(["C", "D"]))
+
+
+def test_misma_partida_con_y_sin_metricas(monkeypatch):
+    def jugar():
+        return jugar_partida([JugadorAleatorio(semilla=i) for i in range(3)], Generador_Aleatorio(semilla=8))
+
+    sin_metricas = jugar()
+    metricas = Metricas()
+    original = GestorPartida.__init__
+
+    def init_instrumentado(self, *args, **kwargs):
+        original(self, *args, **kwargs)
+        instrumentar(self, metricas)
+
+    monkeypatch.setattr(GestorPartida, "__init__", init_instrumentado)
+    con_metricas = jugar()
+    assert sin_metricas == con_metricas
+    assert metricas.llamadas["iniciar_ronda"] == con_metricas["rondas"]
+    assert metricas.llamadas["apostar"] - metricas.apuestas_rechazadas == con_metricas["apuestas"]
+
+
+def test_formato_prometheus_y_archivo(tmp_path):
+    metricas = Metricas(limites=(0.001, 0.01))
+    metricas.observar("dudar", 0.0005)
+    metricas.observar("dudar", 0.005)
+    metricas.observar("dudar", 1.0)
+    metricas.apuestas_rechazadas = 4
+    texto = metricas.a_prometheus()
+    assert "# TYPE dudo_operacion_segundos histogram" in texto
+    assert 'dudo_operacion_segundos_bucket{operacion="dudar",le="0.001"} 1' in texto
+    assert 'dudo_operacion_segundos_bucket{operacion="dudar",le="0.01"} 2' in texto
+    assert 'dudo_operacion_segundos_bucket{operacion="dudar",le="+Inf"} 3' in texto
+    assert 'dudo_operacion_segundos_count{operacion="dudar"} 3' in texto
+    assert "dudo_apuestas_rechazadas_total 4" in texto
+
+    ruta = tmp_path / "dudo.prom"
+    metricas.exportar(str(ruta))
+    assert ruta.read_text(encoding="utf-8") == texto
+    assert list(tmp_path.iterdir()) == [ruta]
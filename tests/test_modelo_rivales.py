@@ -0,0 +1,30 @@
+import pytest
+from src.juego.modelo_rivales import ModeloRivales
+
+
+class _Vista:
+    def total_dados_en_mesa(self):
+        return 10
+
+
+def test_sin_observaciones_usa_la_previa():
+    modelo = ModeloRivales(3)
+    assert modelo.tasa_farol(1) == modelo.previa == pytest.approx(1 / 3)
+    assert modelo.agresividad(1) == 0.0
+
+
+def test_actualiza_por_evento():
+    modelo, vista = ModeloRivales(3), _Vista()
+    modelo.observar(vista, "apuesta", 0, ((3, 4),))
+    modelo.observar(vista, "apuesta", 0, ((5, 4),))
+    assert modelo.agresividad(0) == pytest.approx(0.4)
+
+    # Al jugador 0 le dudan dos apuestas y una era falsa
+    modelo.observar(vista, "duda", 1, (0, (5, 4), True))
+    modelo.observar(vista, "duda", 2, (0, (3, 2), False))
+    assert (modelo.dudadas[0], modelo.faroles[0]) == (2, 1)
+    assert modelo.tasa_farol(0) == pytest.approx((1 + 1) / (2 + 3))
+    assert modelo.tasa_acierto_duda(1) > modelo.tasa_acierto_duda(2)
+
+    modelo.observar(vista, "calce", 2, ((3, 2), False))
+    assert modelo.dudas[2] == 1
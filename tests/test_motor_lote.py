@@ -0,0 +1,111 @@
+import numpy as np
+import pytest
+from src.juego.motor_lote import MotorLote
+from src.juego.gestor_partida import GestorPartida
+
+
+def _valores_de_mesa(motor, mesa):
+    # Valores en el orden en que GestorPartida agita: jugador por jugador, dado por dado
+    return [
+        int(motor.dados[mesa, j, k])
+        for j in range(motor.jugadores)
+        for k in range(motor.cantidades[mesa, j])
+    ]
+
+
+def _cargar_ronda(mocker, motor, partidas):
+    # El lote usa NumPy y GestorPartida `random`: la misma semilla no da los mismos dados,
+    # así que cada partida recibe los valores que sacó el lote
+    for mesa, gp in enumerate(partidas):
+        mocker.patch("src.servicios.generador_aleatorio.random.randint", side_effect=_valores_de_mesa(motor, mesa))
+        gp.iniciar_ronda()
+
+
+class TestMotorLote:
+    def test_requiere_dos_jugadores(self):
+        with pytest.raises(ValueError):
+            MotorLote(10, 1)
+
+    def test_agitar_respeta_cantidades(self):
+        motor = MotorLote(100, 3, semilla=1)
+        motor.cantidades[:, 0] = 2
+        motor.agitar()
+        assert ((motor.dados[:, 0, 2:]) == 0).all()
+        assert ((motor.dados[:, 1:] >= 1) & (motor.dados[:, 1:] <= 6)).all()
+
+    def test_misma_semilla_repite_las_tiradas(self):
+        motores = [MotorLote(50, 3, semilla=7) for _ in range(2)]
+        for motor in motores:
+            motor.agitar()
+            motor.determinar_iniciales()
+            motor.agitar()
+        assert (motores[0].dados == motores[1].dados).all()
+
+    def test_determinar_iniciales(self):
+        motor = MotorLote(5000, 4, semilla=3)
+        motor.cantidades[:10, 2] = 0   # el jugador 2 ya no juega en esas mesas
+        motor.cantidades[10, 1:] = 0   # solo queda el jugador 0
+        motor.cantidades[11] = 0       # mesa vacía
+        iniciales = motor.determinar_iniciales()
+        assert iniciales.shape == (5000,)
+        assert 2 not in iniciales[:10]
+        assert iniciales[10] == 0 and iniciales[11] == -1
+        # Sin eliminados todos los asientos inician con la misma frecuencia
+        frecuencias = np.bincount(iniciales[12:], minlength=4) / (5000 - 12)
+        assert np.allclose(frecuencias, 0.25, atol=0.03)
+
+    def test_histogramas(self):
+        motor = MotorLote(2, 2)
+        motor.dados[0] = [[1, 1, 2, 3, 4], [5, 6, 6, 6, 0]]
+        motor.dados[1] = 2
+        hist = motor.histogramas()
+        assert hist[0].tolist() == [1, 2, 1, 1, 1, 1, 3]
+        assert hist[1].tolist() == [0, 0, 10, 0, 0, 0, 0]
+
+    def test_quitar_y_añadir_usan_reserva(self):
+        motor = MotorLote(1, 2)
+        # Hay 10 Tontos en total
+        motor.dados[:] = 2
+        assert motor.calzar(np.array([[10, 2]]), False, 1).tolist() == [True]
+        assert motor.reservas[0, 1] == 1
+        motor.dados[0, 1] = 3
+        assert motor.dudar(np.array([[6, 3]]), True, 0, 1).tolist() == [True]
+        assert motor.reservas[0, 1] == 0
+        assert motor.cantidades[0, 1] == 5
+
+    @pytest.mark.parametrize("semilla", [0, 1, 2])
+    def test_coincide_con_gestor_partida(self, mocker, semilla):
+        mesas, jugadores = 40, 3
+        motor = MotorLote(mesas, jugadores, semilla=semilla)
+        partidas = [GestorPartida([f"j{i}" for i in range(jugadores)]) for _ in range(mesas)]
+        rng = np.random.default_rng(semilla + 100)
+
+        for _ in range(4):
+            motor.agitar()
+            _cargar_ronda(mocker, motor, partidas)
+            for mesa, gp in enumerate(partidas):
+                assert [d.get_valor() for c in gp.cachos for d in c.get_dados()] == _valores_de_mesa(motor, mesa)
+
+            apuestas = np.stack([rng.integers(1, 10, mesas), rng.integers(1, 7, mesas)], axis=1)
+            obligado = motor.obligados()
+            assert obligado.tolist() == [gp.obligado for gp in partidas]
+
+            # Duda el jugador 0 sobre la apuesta del jugador 2
+            esperado = []
+            for mesa, gp in enumerate(partidas):
+                gp.apuesta_actual = tuple(int(v) for v in apuestas[mesa])
+                gp.indice_ultimo_apostador = 2
+                esperado.append(gp.dudar(0))
+            assert motor.dudar(apuestas, obligado, 0, 2).tolist() == esperado
+
+            # Calza el jugador 1 con la misma apuesta en una segunda resolución
+            validos = motor.validar_calzar(1)
+            esperado_calzar = [gp.arbitro.validar_calzar(gp.cachos, 1) for gp in partidas]
+            assert validos.tolist() == esperado_calzar
+            esperado = [gp.arbitro.calzar(gp.cachos, gp.apuesta_actual, gp.obligado, 1) for gp in partidas]
+            assert motor.calzar(apuestas, obligado, 1).tolist() == esperado
+
+            for mesa, gp in enumerate(partidas):
+                assert motor.cantidades[mesa].tolist() == [len(c.get_dados()) for c in gp.cachos]
+                assert motor.reservas[mesa].tolist() == [c.reserva for c in gp.cachos]
+            assert motor.hay_ganador().tolist() == [gp.hay_ganador() for gp in partidas]
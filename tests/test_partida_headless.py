@@ -0,0 +1,44 @@
+import pytest
+from src.juego.jugadores import JugadorAleatorio
+from src.juego.partida_headless import jugar_partida
+from src.servicios.generador_aleatorio import Generador_Aleatorio
+
+
+class JugadorQueDuda:
+    def decidir(self, partida, idx_jugador):
+        if partida.apuesta_actual is None:
+            return ("apostar", (partida.total_dados_en_mesa(), 6))
+        return ("dudar",)
+
+
+class JugadorTramposo:
+    def decidir(self, partida, idx_jugador):
+        return ("apostar", (0, 9))
+
+
+def test_partida_completa_tiene_un_ganador():
+    jugadores = [JugadorAleatorio(semilla=i) for i in range(4)]
+    resultado = jugar_partida(jugadores, Generador_Aleatorio(semilla=1))
+    assert resultado["ganador"] in range(4)
+    assert resultado["rondas"] >= 15
+    assert resultado["apuestas"] >= resultado["rondas"]
+
+
+def test_misma_semilla_misma_partida():
+    resultados = [
+        jugar_partida([JugadorAleatorio(semilla=i) for i in range(3)], Generador_Aleatorio(semilla=8))
+        for _ in range(2)
+    ]
+    assert resultados[0] == resultados[1]
+
+
+def test_apostar_todos_los_dados_y_dudar():
+    # Apostar todos los dados a Sexto casi nunca es cierto: pierde quien apuesta cada ronda
+    resultado = jugar_partida([JugadorQueDuda(), JugadorQueDuda()], Generador_Aleatorio(semilla=2))
+    assert resultado["ganador"] in (0, 1)
+    assert resultado["apuestas"] == resultado["rondas"]
+
+
+def test_accion_invalida_lanza_error():
+    with pytest.raises(ValueError):
+        jugar_partida([JugadorTramposo(), JugadorTramposo()], Generador_Aleatorio(semilla=0))
@@ -0,0 +1,68 @@
+from fractions import Fraction
+from itertools import product
+
+import pytest
+from src.juego.cacho import Cacho
+from src.juego.contador_pintas import ContadorPintas
+from src.juego.probabilidad_ronda import ProbabilidadRonda
+
+
+def _cacho_con(mocker, valores):
+    mocker.patch("src.servicios.generador_aleatorio.random.randint", side_effect=list(valores))
+    cacho = Cacho()
+    for _ in range(5 - len(valores)):
+        cacho.quitar_dado()
+    cacho.agitar()
+    return cacho
+
+
+def _por_enumeracion(cacho, desconocidos, apuesta, obligado):
+    # Recorre todas las tiradas posibles de los dados desconocidos
+    apariciones, pinta = apuesta
+    contador = ContadorPintas()
+    propios = contador.contar_en_histograma(cacho.get_histograma(), pinta, obligado)
+    verdadera = exacta = 0
+    for tirada in product(range(1, 7), repeat=desconocidos):
+        histograma = [0] * 7
+        for valor in tirada:
+            histograma[valor] += 1
+        total = propios + contador.contar_en_histograma(histograma, pinta, obligado)
+        verdadera += total >= apariciones
+        exacta += total == apariciones
+    casos = 6 ** desconocidos
+    return Fraction(verdadera, casos), Fraction(exacta, casos)
+
+
+def test_ases_comodines_y_obligado(mocker):
+    cacho = _cacho_con(mocker, [1, 3])
+    probabilidad = ProbabilidadRonda(max_dados=10)
+    # Un dado desconocido: con comodín 1/3, obligado 1/6
+    assert probabilidad.probabilidad_apuesta(cacho, 1, (3, 3), False) == pytest.approx(1 / 3)
+    assert probabilidad.probabilidad_apuesta(cacho, 1, (2, 3), True) == pytest.approx(1 / 6)
+    assert probabilidad.probabilidad_apuesta(cacho, 1, (2, 3), False) == 1.0
+    assert probabilidad.probabilidad_apuesta(cacho, 1, (4, 3), False) == 0.0
+    assert probabilidad.probabilidad_calzar(cacho, 1, (1, 3), False) == pytest.approx(0.0)
+    assert probabilidad.probabilidad_calzar(cacho, 1, (2, 3), False) == pytest.approx(2 / 3)
+
+
+@pytest.mark.parametrize("desconocidos", [0, 1, 2, 3, 4])
+def test_coincide_con_enumeracion(mocker, desconocidos):
+    cacho = _cacho_con(mocker, [1, 2, 2, 5])
+    probabilidad = ProbabilidadRonda()
+    for pinta in range(1, 7):
+        for apariciones in range(1, 9):
+            for obligado in (False, True):
+                verdadera, exacta = _por_enumeracion(cacho, desconocidos, (apariciones, pinta), obligado)
+                apuesta = (apariciones, pinta)
+                assert probabilidad.probabilidad_apuesta(cacho, desconocidos, apuesta, obligado) == pytest.approx(float(verdadera))
+                assert probabilidad.probabilidad_calzar(cacho, desconocidos, apuesta, obligado) == pytest.approx(float(exacta))
+
+
+@pytest.mark.parametrize("obligado", [False, True])
+def test_maximo_creible(mocker, obligado):
+    cacho = _cacho_con(mocker, [5, 5, 1, 2, 3])
+    probabilidad = ProbabilidadRonda()
+    for pinta in range(1, 7):
+        maximo = probabilidad.maximo_creible(cacho, 6, pinta, obligado, 0.5)
+        assert probabilidad.probabilidad_apuesta(cacho, 6, (maximo, pinta), obligado) >= 0.5
+        assert probabilidad.probabilidad_apuesta(cacho, 6, (maximo + 1, pinta), obligado) < 0.5
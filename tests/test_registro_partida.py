@@ -0,0 +1,117 @@
+import pytest
+from src.juego.gestor_partida import GestorPartida
+from src.juego.jugadores import JugadorAleatorio
+from src.juego.partida_headless import jugar_partida
+from src.servicios.generador_aleatorio import Generador_Aleatorio
+from src.servicios.registro_partida import REGISTRO, RegistroBinario, leer_eventos, reconstruir
+
+
+def _grabar_partida(ruta, semilla=3):
+    with RegistroBinario(str(ruta)) as registro:
+        jugar_partida([JugadorAleatorio(semilla=i) for i in range(3)], Generador_Aleatorio(semilla=semilla), registro)
+    return list(leer_eventos(str(ruta)))
+
+
+def test_registros_de_ancho_fijo(tmp_path):
+    ruta = tmp_path / "partida.dudo"
+    eventos = _grabar_partida(ruta)
+    assert ruta.stat().st_size == len(eventos) * REGISTRO.size == len(eventos) * 8
+    assert eventos[0] == ("inicio", 3, ())
+    # Las tiradas para decidir quién inicia (3 dados, más los desempates) van antes de INICIAL
+    inicial = [tipo for tipo, _, _ in eventos].index("inicial")
+    tiradas = b"".join(datos[0] for _, _, datos in eventos[1:inicial])
+    assert {tipo for tipo, _, _ in eventos[1:inicial]} == {"tiradas"}
+    assert len(tiradas) >= 3 and set(tiradas) <= set(range(1, 7))
+    assert eventos[inicial + 1][0] == "sentido"
+    ronda = eventos[inicial + 2:inicial + 6]
+    assert [tipo for tipo, _, _ in ronda] == ["dados", "dados", "dados", "ronda"]
+    assert all(len(datos[0]) == 5 for tipo, _, datos in ronda[:3])
+
+
+def test_eventos_de_acciones(tmp_path):
+    ruta = tmp_path / "acciones.dudo"
+    with RegistroBinario(str(ruta)) as registro:
+        gp = GestorPartida(["A", "B"], Generador_Aleatorio(semilla=1), registro)
+        gp.iniciar_ronda()
+        gp.apostar(0, (1, 1))
+        gp.apostar(0, (3, 4))
+        resultado = gp.dudar(1)
+    eventos = list(leer_eventos(str(ruta)))
+    assert eventos[-3] == ("apuesta", 0, ((1, 1), False))
+    assert eventos[-2] == ("apuesta", 0, ((3, 4), True))
+    tipo, jugador, (grabado, perdedor, dados, reserva) = eventos[-1]
+    assert (tipo, jugador, grabado) == ("duda", 1, resultado)
+    assert perdedor == (0 if resultado else 1)
+    assert dados == 4
+
+
+def test_apuestas_que_no_caben_en_el_registro(tmp_path):
+    apuestas = [(-1, 3), (3, -2), (2.5, 3), (3, 300), (2.0, 3), (70000, 3)]
+    sin_registro = GestorPartida(["A", "B"], Generador_Aleatorio(semilla=1))
+    sin_registro.iniciar_ronda()
+    esperadas = [sin_registro.apostar(0, apuesta) for apuesta in apuestas]
+    assert esperadas == [False, False, False, False, True, True]
+
+    ruta = tmp_path / "fuera_de_rango.dudo"
+    with RegistroBinario(str(ruta)) as registro:
+        gp = GestorPartida(["A", "B"], Generador_Aleatorio(semilla=1), registro)
+        gp.iniciar_ronda()
+        assert [gp.apostar(0, apuesta) for apuesta in apuestas] == esperadas
+        assert gp.apuesta_actual == (70000, 3)
+        gp.dudar(1)
+    eventos = list(leer_eventos(str(ruta)))
+    grabadas = [datos for tipo, _, datos in eventos if tipo == "apuesta"]
+    assert grabadas == [
+        ((0, 3), False), ((0, 0), False), ((0, 3), False), ((0, 255), False), ((2, 3), True), ((65535, 3), True),
+    ]
+    # Al rehacerla, cada apuesta grabada se resuelve igual que la original
+    assert reconstruir(eventos).cachos[0].cantidad_dados() == 4
+
+
+def test_jugadores_y_reservas_que_no_caben_en_un_byte(tmp_path):
+    with RegistroBinario(str(tmp_path / "grande.dudo")) as registro:
+        with pytest.raises(ValueError):
+            registro.inicio(256)
+        gp = GestorPartida(["A", "B"], Generador_Aleatorio(semilla=1), registro)
+        gp.cachos[1].reserva = 256
+        with pytest.raises(ValueError):
+            gp.iniciar_ronda()
+        with pytest.raises(ValueError):
+            registro.calce(1, True, gp.cachos[1])
+        gp.cachos[1].reserva = 255
+        gp.iniciar_ronda()
+    eventos = list(leer_eventos(str(tmp_path / "grande.dudo")))
+    # Lo que no cabía no dejó registros a medias
+    assert [tipo for tipo, _, _ in eventos] == ["inicio", "dados", "dados", "ronda"]
+    assert eventos[2][2][1] == 255
+
+
+def test_reconstruir_en_cualquier_evento(tmp_path):
+    ruta = tmp_path / "partida.dudo"
+    eventos = _grabar_partida(ruta, semilla=5)
+    final = reconstruir(str(ruta))
+    assert final.hay_ganador()
+
+    for indice in range(1, len(eventos) + 1, 7):
+        partida = reconstruir(eventos, indice)
+        assert partida is not None
+    # Después de la primera ronda los dados coinciden con los grabados
+    ronda = [tipo for tipo, _, _ in eventos].index("ronda")
+    partida = reconstruir(eventos, ronda + 1)
+    assert [c.get_valores() for c in partida.cachos] == [datos[0] for _, _, datos in eventos[ronda - 3:ronda]]
+
+
+def test_reconstruir_detecta_resultados_distintos(tmp_path):
+    ruta = tmp_path / "partida.dudo"
+    eventos = _grabar_partida(ruta)
+    indice = next(i for i, evento in enumerate(eventos) if evento[0] == "duda")
+    tipo, jugador, datos = eventos[indice]
+    eventos[indice] = (tipo, jugador, (not datos[0],) + datos[1:])
+    with pytest.raises(ValueError):
+        reconstruir(eventos)
+
+
+def test_registro_vacio(tmp_path):
+    ruta = tmp_path / "vacio.dudo"
+    ruta.write_bytes(b"")
+    assert list(leer_eventos(str(ruta))) == []
@@ -0,0 +1,148 @@
+import asyncio
+import json
+
+from src.juego.vista_partida import VistaPartida
+from src.servicios.servidor import ServidorDudo
+
+
+def _crear(servidor, **extra):
+    return servidor.procesar({"accion": "crear_mesa", "jugadores": ["Ana", "Beto", "Carla"], "semilla": 4, **extra})
+
+
+def test_crear_mesa_y_estado():
+    servidor = ServidorDudo()
+    creada = _crear(servidor)
+    assert creada["ok"] is True
+    estado = servidor.procesar({"accion": "estado", "mesa": creada["mesa"], "jugador": 0})
+    assert estado["turno"] == creada["turno"]
+    assert estado["dados"] == [5, 5, 5]
+    assert len(estado["dados_propios"]) == 5
+    assert estado["apuesta"] is None
+
+
+def test_respeta_turnos_y_reglas():
+    servidor = ServidorDudo()
+    creada = _crear(servidor)
+    mesa, turno = creada["mesa"], creada["turno"]
+    fuera_de_turno = (turno + 1) % 3
+    assert servidor.procesar({"accion": "apostar", "mesa": mesa, "jugador": fuera_de_turno, "apuesta": [2, 3]})["ok"] is False
+    assert servidor.procesar({"accion": "apostar", "mesa": mesa, "jugador": turno, "apuesta": [1, 1]})["ok"] is False
+    respuesta = servidor.procesar({"accion": "apostar", "mesa": mesa, "jugador": turno, "apuesta": [2, 3]})
+    assert respuesta == {"ok": True, "turno": (turno + 1) % 3}
+    resuelta = servidor.procesar({"accion": "dudar", "mesa": mesa, "jugador": respuesta["turno"]})
+    assert resuelta["ok"] is True
+    assert sum(resuelta["dados"]) == 14
+    assert servidor.procesar({"accion": "estado", "mesa": mesa})["apuesta"] is None
+    assert servidor.procesar({"accion": "dudar", "mesa": 99, "jugador": 0})["ok"] is False
+
+
+def test_protocolo_tcp_con_notificaciones():
+    async def escenario():
+        servidor = ServidorDudo()
+        red = await servidor.iniciar(puerto=0)
+        puerto = red.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", puerto)
+
+        async def pedir(mensaje):
+            writer.write(json.dumps(mensaje).encode() + b"\n")
+            await writer.drain()
+            return json.loads(await reader.readline())
+
+        creada = await pedir({"accion": "crear_mesa", "jugadores": ["Ana", "Beto"], "id": 7})
+        assert creada["id"] == 7
+        await pedir({"accion": "unirse", "mesa": creada["mesa"], "jugador": 0})
+        writer.write(json.dumps({"accion": "apostar", "mesa": creada["mesa"], "jugador": creada["turno"], "apuesta": [2, 5]}).encode() + b"\n")
+        await writer.drain()
+        notificacion = json.loads(await reader.readline())
+        respuesta = json.loads(await reader.readline())
+        writer.write(b"no es json\n")
+        await writer.drain()
+        error = json.loads(await reader.readline())
+        # JSON válido que no es un objeto: se responde con error y la conexión sigue viva
+        no_objetos = []
+        for linea in (b"[1, 2]\n", b"3\n"):
+            writer.write(linea)
+            await writer.drain()
+            no_objetos.append(json.loads(await reader.readline()))
+        info = await pedir({"accion": "info"})
+
+        writer.close()
+        red.close()
+        await red.wait_closed()
+        return notificacion, respuesta, error, no_objetos, info
+
+    notificacion, respuesta, error, no_objetos, info = asyncio.run(escenario())
+    assert [r["ok"] for r in no_objetos] == [False, False]
+    assert info["ok"] is True
+    assert notificacion["evento"] == "turno"
+    assert notificacion["apuesta"] == [2, 5]
+    assert respuesta["ok"] is True
+    assert error["ok"] is False
+
+
+def test_rechaza_jugadores_fuera_de_la_mesa():
+    servidor = ServidorDudo()
+    creada = _crear(servidor)
+    mesa, turno = creada["mesa"], creada["turno"]
+    for jugador in (-1, 3, True, 1.0, "0"):
+        assert servidor.procesar({"accion": "estado", "mesa": mesa, "jugador": jugador})["ok"] is False
+        assert servidor.procesar({"accion": "apostar", "mesa": mesa, "jugador": jugador, "apuesta": [2, 3]})["ok"] is False
+        assert servidor.procesar({"accion": "dudar", "mesa": mesa, "jugador": jugador})["ok"] is False
+    # Apuestas que no son dos enteros: 1e400 llega como float('inf') y no debe llegar al validador
+    for apuesta in ([float("inf"), 3], [1e400, 3], [2.0, 3], [True, 3], [2, "3"], [2], "23", None):
+        assert servidor.procesar({"accion": "apostar", "mesa": mesa, "jugador": turno, "apuesta": apuesta})["ok"] is False
+    assert servidor.procesar({"accion": "estado", "mesa": mesa, "jugador": turno})["ok"] is True
+
+
+def test_pedido_inesperado_no_corta_la_conexion():
+    async def escenario():
+        servidor = ServidorDudo()
+        red = await servidor.iniciar(puerto=0)
+        puerto = red.sockets[0].getsockname()[1]
+        reader, writer = await asyncio.open_connection("127.0.0.1", puerto)
+
+        async def enviar(linea):
+            writer.write(linea + b"\n")
+            await writer.drain()
+            return json.loads(await reader.readline())
+
+        creada = await enviar(json.dumps({"accion": "crear_mesa", "jugadores": ["Ana", "Beto"]}).encode())
+        mesa, turno = creada["mesa"], creada["turno"]
+        infinita = await enviar(b'{"accion":"apostar","mesa":%d,"jugador":%d,"apuesta":[1e400,3]}' % (mesa, turno))
+        mesa_rara = await enviar(b'{"accion":"estado","mesa":[1]}')
+        estado = await enviar(json.dumps({"accion": "estado", "mesa": mesa}).encode())
+
+        writer.close()
+        red.close()
+        await red.wait_closed()
+        return infinita, mesa_rara, estado
+
+    infinita, mesa_rara, estado = asyncio.run(escenario())
+    assert infinita["ok"] is False
+    assert mesa_rara["ok"] is False
+    assert estado["ok"] is True
+
+
+def _jugar_hasta_el_final(servidor, id_mesa):
+    partida = servidor.mesas[id_mesa].partida
+    while True:
+        turno = servidor.mesas[id_mesa].turno
+        apuesta = VistaPartida(partida, turno).apuestas_validas()[0]
+        respuesta = servidor.procesar({"accion": "apostar", "mesa": id_mesa, "jugador": turno, "apuesta": list(apuesta)})
+        resuelta = servidor.procesar({"accion": "dudar", "mesa": id_mesa, "jugador": respuesta["turno"]})
+        if "ganador" in resuelta:
+            return resuelta["ganador"]
+
+
+def test_descarta_las_mesas_terminadas_mas_viejas():
+    servidor = ServidorDudo(max_terminadas=2)
+    ids = [_crear(servidor, semilla=semilla)["mesa"] for semilla in range(4)]
+    ganador = _jugar_hasta_el_final(servidor, ids[0])
+    assert servidor.procesar({"accion": "estado", "mesa": ids[0]})["terminada"] is True
+    for id_mesa in ids[1:3]:
+        _jugar_hasta_el_final(servidor, id_mesa)
+    # La primera mesa terminada se descartó; la que sigue en juego no se toca
+    assert ids[0] not in servidor.mesas
+    assert sorted(servidor.mesas) == ids[1:]
+    assert servidor.procesar({"accion": "info"})["mesas"] == 3
+    assert 0 <= ganador < 3
@@ -0,0 +1,85 @@
+import pytest
+from src.juego.solucionador_final import CALZAR, DUDAR, SolucionadorFinal, codificar_estado, manos_posibles
+
+
+def test_manos_posibles():
+    manos, probabilidades = manos_posibles(2)
+    assert len(manos) == 21
+    assert probabilidades.sum() == pytest.approx(1)
+    assert probabilidades[manos.index((3, 3))] == pytest.approx(1 / 36)
+    assert probabilidades[manos.index((2, 5))] == pytest.approx(2 / 36)
+
+
+def test_codificar_estado_distingue_nodos():
+    historias = [(), ((1, 2),), ((1, 3),), ((1, 2), (2, 2)), ((2, 2), (1, 2))]
+    claves = {codificar_estado((2, 2), False, h) for h in historias}
+    claves |= {codificar_estado((2, 1), True, h) for h in historias}
+    assert len(claves) == 2 * len(historias)
+
+
+def test_acciones_respetan_reglas():
+    solucionador = SolucionadorFinal((1, 1), max_apuestas=2)
+    assert solucionador.acciones(()) == [(1, p) for p in range(1, 7)]
+    # Obligado: la primera apuesta fija la pinta; con un dado se puede calzar
+    assert solucionador.acciones(((1, 4),)) == [(2, 4), DUDAR, CALZAR]
+    # Límite de apuestas: solo queda dudar o calzar
+    assert solucionador.acciones(((1, 4), (2, 4))) == [DUDAR, CALZAR]
+    # Con 4 dados en mesa y 2 asientos no se puede calzar sin tener un solo dado
+    assert CALZAR not in SolucionadorFinal((2, 2)).acciones(((1, 3),))
+
+
+def test_resolver_final_de_un_dado_por_jugador():
+    solucionador = SolucionadorFinal((1, 1), max_apuestas=3)
+    solucionador.resolver(300)
+    valores = solucionador.valor()
+    assert sum(valores) == pytest.approx(0)
+    estrategia = solucionador.estrategia((5,), [(1, 5)])
+    assert sum(estrategia.values()) == pytest.approx(1)
+    # Con un 5 en la mano la apuesta (1, 5) es segura: dudarla siempre pierde
+    assert estrategia[DUDAR] < 0.01
+
+
+def test_tabla_con_limite_lru_y_guardado(tmp_path):
+    solucionador = SolucionadorFinal((2, 1), max_apuestas=3, max_nodos=6)
+    solucionador.resolver(5)
+    assert len(solucionador.tabla) == 6
+
+    completo = SolucionadorFinal((2, 1), max_apuestas=3)
+    completo.resolver(20)
+    ruta = tmp_path / "final.pkl"
+    completo.guardar(str(ruta))
+    cargado = SolucionadorFinal.cargar(str(ruta))
+    assert cargado.iteraciones == 20
+    historia = [(1, 6), (2, 6)]
+    assert cargado.estrategia((2, 6), historia) == completo.estrategia((6, 2), historia)
+    with pytest.raises(ValueError):
+        cargado.estrategia((2,), historia)
+
+
+def test_nodos_descartados_reinician_sus_arrepentimientos():
+    raiz = codificar_estado((2, 1), True, ())
+    completo = SolucionadorFinal((2, 1), max_apuestas=3)
+    completo.resolver(3)
+    assert completo.descartados == 0
+    assert completo.tabla[raiz][0].any()
+
+    # La raíz es el nodo menos usado: con el límite se descarta y vuelve a empezar de cero
+    limitado = SolucionadorFinal((2, 1), max_apuestas=3, max_nodos=6)
+    limitado.resolver(3)
+    assert limitado.descartados > 0
+    assert raiz not in limitado.tabla
+    acciones = limitado.acciones(())
+    assert limitado.estrategia((1, 2)) == {accion: 1 / len(acciones) for accion in acciones}
+
+
+def test_tres_jugadores_suma_cero():
+    solucionador = SolucionadorFinal((1, 1, 1), max_apuestas=3)
+    solucionador.resolver(30)
+    assert sum(solucionador.valor()) == pytest.approx(0)
+
+
+def test_configuracion_invalida():
+    with pytest.raises(ValueError):
+        SolucionadorFinal((2,))
+    with pytest.raises(ValueError):
+        SolucionadorFinal((1, 6))
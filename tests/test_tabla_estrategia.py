@@ -0,0 +1,97 @@
+from functools import partial
+
+import pytest
+from src.juego.conjunto_informacion import codificar_vista
+from src.juego.gestor_partida import GestorPartida
+from src.juego.jugadores import JugadorAleatorio, JugadorUmbral
+from src.juego.partida_headless import jugar_partida
+from src.juego.vista_partida import VistaPartida
+from src.servicios.generador_aleatorio import Generador_Aleatorio
+from src.servicios.liga import jugar_liga
+from src.servicios.tabla_estrategia import JugadorTabla, TablaEstrategia, abrir_tabla, construir_tabla
+
+
+def test_construir_y_buscar(tmp_path):
+    ruta = str(tmp_path / "tabla.bin")
+    entradas = {7: (0.5, 0.25), 2**64 - 1: (1.0, 0.0), 0: (0.0, 0.125), 1 << 40: (0.75, 0.5)}
+    assert construir_tabla(ruta, entradas, columnas=2) == 4
+    with TablaEstrategia(ruta) as tabla:
+        assert len(tabla) == 4
+        assert tabla.columnas == 2
+        for clave, valores in entradas.items():
+            assert tabla[clave] == list(valores)
+        assert 8 not in tabla
+        assert tabla.buscar(8) is None
+        assert tabla.buscar(8, defecto=[0.0, 0.0]) == [0.0, 0.0]
+        with pytest.raises(KeyError):
+            tabla[3]
+        assert list(tabla._claves) == sorted(entradas)
+
+
+def test_tabla_vacia(tmp_path):
+    ruta = str(tmp_path / "vacia.bin")
+    construir_tabla(ruta, [], columnas=3)
+    with TablaEstrategia(ruta) as tabla:
+        assert len(tabla) == 0
+        assert 1 not in tabla
+
+
+@pytest.mark.parametrize("entradas", [
+    [(1, (0.5,)), (1, (0.25,))],
+    [(2**64, (0.5,))],
+    [(-1, (0.5,))],
+    [(1, (0.5, 0.5))],
+])
+def test_entradas_invalidas(tmp_path, entradas):
+    with pytest.raises(ValueError):
+        construir_tabla(str(tmp_path / "tabla.bin"), entradas, columnas=1)
+
+
+def test_rechaza_archivos_ajenos_o_truncados(tmp_path):
+    ajeno = tmp_path / "ajeno.bin"
+    ajeno.write_bytes(b"no es una tabla de estrategia")
+    with pytest.raises(ValueError):
+        TablaEstrategia(str(ajeno))
+
+    ruta = tmp_path / "tabla.bin"
+    construir_tabla(str(ruta), {1: (0.5,), 2: (0.5,)}, columnas=1)
+    ruta.write_bytes(ruta.read_bytes()[:-4])
+    with pytest.raises(ValueError):
+        TablaEstrategia(str(ruta))
+
+
+def test_abrir_tabla_reutiliza_la_abierta(tmp_path):
+    ruta = str(tmp_path / "tabla.bin")
+    construir_tabla(ruta, {1: (0.5,)}, columnas=1)
+    assert abrir_tabla(ruta) is abrir_tabla(ruta)
+
+
+def test_jugador_tabla_sigue_la_tabla(tmp_path):
+    partida = GestorPartida(["A", "B", "C"], Generador_Aleatorio(semilla=4))
+    partida.iniciar_ronda()
+    partida.apostar(0, (2, 3))
+    vista = VistaPartida(partida, 1)
+    clave = codificar_vista(vista)
+
+    for valores, accion in (((1.0, 0.0), "dudar"), ((0.0, 0.0), "apostar")):
+        ruta = str(tmp_path / f"{accion}.bin")
+        construir_tabla(ruta, {clave: valores}, columnas=2)
+        jugador = JugadorTabla(TablaEstrategia(ruta), semilla=1)
+        for _ in range(20):
+            assert jugador.decidir(vista, 1)[0] == accion
+
+
+def test_jugador_tabla_sin_el_estado_juega_como_umbral(tmp_path):
+    ruta = str(tmp_path / "vacia.bin")
+    construir_tabla(ruta, {}, columnas=2)
+    jugadores = [JugadorTabla(ruta, semilla=1), JugadorUmbral(semilla=1)]
+    a = jugar_partida(jugadores, Generador_Aleatorio(3))
+    b = jugar_partida([JugadorUmbral(semilla=1), JugadorUmbral(semilla=1)], Generador_Aleatorio(3))
+    assert a == b
+
+
+def test_jugador_tabla_como_fabrica_de_liga(tmp_path):
+    ruta = str(tmp_path / "tabla.bin")
+    construir_tabla(ruta, {}, columnas=2)
+    resultado = jugar_liga([partial(JugadorTabla, ruta), JugadorAleatorio], partidas=6, procesos=2, semilla=1)
+    assert resultado["partidas"] == 6
@@ -0,0 +1,16 @@
+from src.juego.jugadores import JugadorAleatorio
+from src.servicios.torneo import jugar_torneo
+
+
+def test_torneo_en_un_proceso():
+    resultado = jugar_torneo([JugadorAleatorio] * 3, partidas=25, procesos=1, tamano_lote=10)
+    assert sum(resultado["victorias"]) == 25
+    assert resultado["partidas"] == 25
+    assert resultado["partidas_por_segundo"] > 0
+
+
+def test_resultado_no_depende_de_los_procesos():
+    en_serie = jugar_torneo([JugadorAleatorio] * 2, partidas=20, procesos=1, semilla=3, tamano_lote=5)
+    en_pool = jugar_torneo([JugadorAleatorio] * 2, partidas=20, procesos=2, semilla=3, tamano_lote=5)
+    assert en_serie["victorias"] == en_pool["victorias"]
+    assert en_serie["rondas"] == en_pool["rondas"]
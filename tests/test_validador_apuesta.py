@@ -1,4 +1,5 @@
-from src.juego.validador_apuesta import ValidadorApuesta
+import pytest
+from src.juego.validador_apuesta import ValidadorApuesta, _tabla_minimos
 #Se asume que las apuestas tienen un formato tal que: (apariciones, pinta)
 #validar_apuesta(apuesta_actual, apuesta_nueva, cantidad_dados, obligado)
 
@@ -69,3 +70,34 @@ def test_rango_de_apariciones():
     assert validador.validar_apuesta((4, 4), (0, 6), 5, False) == False
     assert validador.validar_apuesta((4, 4), (-6, 6), 5, False) == False
     assert validador.validar_apuesta((4, 4), (4.6, 6), 5, False) == False
+
+def test_generar_apuestas_validas_ejemplos():
+    validador = ValidadorApuesta()
+    assert validador.generar_apuestas_validas(None, 5, False, 10) == [(1, 2), (1, 3), (1, 4), (1, 5), (1, 6)]
+    assert validador.generar_apuestas_validas(None, 1, False, 10)[0] == (1, 1)
+    assert validador.generar_apuestas_validas((4, 3), 5, False, 10) == [(3, 1), (5, 2), (5, 3), (1, 4), (1, 5), (1, 6)]
+    assert validador.generar_apuestas_validas((4, 1), 5, False, 10) == [(5, 1), (9, 2), (9, 3), (9, 4), (9, 5), (9, 6)]
+    assert validador.generar_apuestas_validas((3, 2), 4, True, 4) == [(2, 1), (4, 2)]
+    assert validador.generar_apuestas_validas((6, 6), 5, False, 6) == [(4, 1)]
+
+def test_tabla_coincide_con_validar_apuesta_en_todo_el_dominio():
+    validador = ValidadorApuesta()
+    total_dados = 40
+    apuestas = [None] + [(a, p) for a in range(1, 31) for p in range(1, 7)]
+    for apuesta_actual in apuestas:
+        for obligado in (False, True):
+            for cantidad_dados in (1, 2, 5):
+                minimos = dict((p, a) for a, p in validador.generar_apuestas_validas(apuesta_actual, cantidad_dados, obligado, total_dados))
+                for pinta in range(1, 7):
+                    for apariciones in range(1, total_dados + 1):
+                        esperado = validador.validar_apuesta(apuesta_actual, (apariciones, pinta), cantidad_dados, obligado)
+                        assert esperado == (pinta in minimos and apariciones >= minimos[pinta]), \
+                            (apuesta_actual, (apariciones, pinta), cantidad_dados, obligado)
+
+def test_generar_apuestas_validas_rechaza_apuestas_que_no_son_enteras():
+    validador = ValidadorApuesta()
+    for apuesta_actual in ((1e400, 3), (2.0, 3), (2, 7), (0, 3), ("2", 3), (2, 3, 4), 5):
+        with pytest.raises(ValueError):
+            validador.generar_apuestas_validas(apuesta_actual, 5, False, 10)
+    assert validador.generar_apuestas_validas([4, 3], 5, False, 10) == validador.generar_apuestas_validas((4, 3), 5, False, 10)
+    assert _tabla_minimos.cache_info().maxsize is not None
@@ -0,0 +1,104 @@
+import gzip
+
+import pytest
+from src.juego.gestor_partida import GestorPartida
+from src.juego.jugadores import JugadorAleatorio
+from src.juego.partida_headless import jugar_partida
+from src.servicios.generador_aleatorio import Generador_Aleatorio
+from src.servicios.registro_partida import APUESTA, DADOS, DUDA, INICIAL, REGISTRO, RegistroBinario, leer_eventos
+from src.servicios.verificador_corpus import partidas_del_corpus, verificar_corpus, verificar_partida
+
+
+def _grabar_corpus(ruta, partidas=12):
+    with RegistroBinario(str(ruta)) as registro:
+        for semilla in range(partidas):
+            jugadores = [JugadorAleatorio(semilla=f"{semilla}/{asiento}") for asiento in range(3)]
+            jugar_partida(jugadores, Generador_Aleatorio(semilla), registro)
+
+
+def test_corpus_comprimido_se_lee_igual(tmp_path):
+    plano, comprimido = tmp_path / "corpus.dudo", tmp_path / "corpus.dudo.gz"
+    _grabar_corpus(plano, 3)
+    _grabar_corpus(comprimido, 3)
+    assert gzip.decompress(comprimido.read_bytes()) == plano.read_bytes()
+    assert list(leer_eventos(str(comprimido))) == list(leer_eventos(str(plano)))
+
+
+def test_lotes_de_partidas_completas(tmp_path):
+    ruta = tmp_path / "corpus.dudo.gz"
+    _grabar_corpus(ruta)
+    lotes = list(partidas_del_corpus(str(ruta), tamano_lote=5))
+    assert [primera for primera, _ in lotes] == [0, 5, 10]
+    assert all(datos[0] == 0 for _, datos in lotes)
+    assert sum(len(datos) for _, datos in lotes) == len(gzip.decompress(ruta.read_bytes()))
+
+
+@pytest.mark.parametrize("procesos", [1, 2])
+def test_corpus_sin_diferencias(tmp_path, procesos):
+    ruta = tmp_path / "corpus.dudo.gz"
+    _grabar_corpus(ruta)
+    resultado = verificar_corpus(str(ruta), procesos=procesos, tamano_lote=4)
+    assert resultado["partidas"] == 12
+    assert resultado["fallas"] == []
+    assert resultado["eventos"] == sum(1 for _ in leer_eventos(str(ruta)))
+
+
+@pytest.mark.parametrize("byte, esperado", [(2, "duda"), (4, "dados")])
+def test_informa_primer_evento_distinto(tmp_path, byte, esperado):
+    ruta = tmp_path / "corpus.dudo"
+    _grabar_corpus(ruta)
+    datos = bytearray(ruta.read_bytes())
+    lotes = list(partidas_del_corpus(str(ruta), tamano_lote=1))
+    # En la partida 7 se altera la segunda duda: su resultado o los dados del perdedor
+    inicio = sum(len(lote) for _, lote in lotes[:7])
+    dudas = [i for i in range(0, len(lotes[7][1]), REGISTRO.size) if datos[inicio + i] == DUDA]
+    datos[inicio + dudas[1] + byte] ^= 1
+    ruta.write_bytes(bytes(datos))
+
+    resultado = verificar_corpus(str(ruta), procesos=1, tamano_lote=3)
+    assert len(resultado["fallas"]) == 1
+    partida, evento, mensaje = resultado["fallas"][0]
+    assert (partida, evento) == (7, dudas[1] // REGISTRO.size)
+    assert esperado in mensaje
+
+
+def _alterar_partida(ruta, partida, tipo, byte, orden=0):
+    """Invierte el bit bajo de `byte` en el evento número `orden` de tipo `tipo` de una partida; devuelve su índice."""
+    datos = bytearray(ruta.read_bytes())
+    lotes = list(partidas_del_corpus(str(ruta), tamano_lote=1))
+    inicio = sum(len(lote) for _, lote in lotes[:partida])
+    posiciones = [i for i in range(0, len(lotes[partida][1]), REGISTRO.size) if datos[inicio + i] == tipo]
+    datos[inicio + posiciones[orden] + byte] ^= 1
+    ruta.write_bytes(bytes(datos))
+    return posiciones[orden] // REGISTRO.size
+
+
+@pytest.mark.parametrize("tipo, orden, esperado", [(INICIAL, 0, "inicia"), (APUESTA, 3, "turno")])
+def test_detecta_turnos_alterados(tmp_path, tipo, orden, esperado):
+    ruta = tmp_path / "corpus.dudo"
+    _grabar_corpus(ruta)
+    evento = _alterar_partida(ruta, 4, tipo, 1, orden)
+    resultado = verificar_corpus(str(ruta), procesos=1)
+    assert [(partida, indice) for partida, indice, _ in resultado["fallas"]] == [(4, evento)]
+    assert esperado in resultado["fallas"][0][2]
+
+
+def test_detecta_cambios_en_el_orden_de_turnos(tmp_path, monkeypatch):
+    ruta = tmp_path / "corpus.dudo"
+    _grabar_corpus(ruta)
+    # Una regresión en siguiente_jugador que juega siempre hacia el otro lado
+    original = GestorPartida.siguiente_jugador
+
+    def al_reves(self, idx_actual):
+        self._turnos = self.mesa.asientos.enlaces(self.sentido != "derecha")
+        return original(self, idx_actual)
+
+    monkeypatch.setattr(GestorPartida, "siguiente_jugador", al_reves)
+    resultado = verificar_corpus(str(ruta), procesos=1)
+    assert len(resultado["fallas"]) == 12
+    assert all("turno" in mensaje for _, _, mensaje in resultado["fallas"])
+
+
+def test_verificar_partida_sin_inicio():
+    divergencia = verificar_partida(REGISTRO.pack(DADOS, 0, b"\x01\x02\x03\x04\x05\x00"))
+    assert divergencia is not None and divergencia.evento == 0
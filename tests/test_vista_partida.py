@@ -0,0 +1,50 @@
+import pytest
+from src.juego.gestor_partida import GestorPartida
+from src.juego.vista_partida import VistaPartida
+from src.servicios.generador_aleatorio import Generador_Aleatorio
+
+
+@pytest.fixture
+def partida():
+    gp = GestorPartida(["A", "B", "C"], Generador_Aleatorio(semilla=4))
+    gp.iniciar_ronda()
+    return gp
+
+
+def test_lee_el_estado_actual(partida):
+    vista = VistaPartida(partida, 1)
+    assert vista.apuesta_actual is None
+    partida.apostar(0, (3, 4))
+    assert vista.apuesta_actual == (3, 4)
+    assert vista.indice_ultimo_apostador == 0
+    assert vista.total_dados_en_mesa() == 15
+    assert vista.cantidad_dados(2) == 5
+    assert vista.jugadores == 3
+
+
+def test_solo_muestra_los_dados_propios(partida):
+    vista = VistaPartida(partida, 2)
+    assert vista.get_valores() == partida.cachos[2].get_valores()
+    assert vista.get_histograma() == tuple(partida.cachos[2].get_histograma())
+    assert not hasattr(vista, "cachos")
+    assert not hasattr(vista, "mesa")
+
+
+def test_es_de_solo_lectura(partida):
+    vista = VistaPartida(partida, 0)
+    with pytest.raises(AttributeError):
+        vista.apuesta_actual = (5, 6)
+    with pytest.raises(AttributeError):
+        vista.asiento = 1
+    with pytest.raises(AttributeError):
+        vista.otro = 1
+
+
+def test_apuestas_validas_y_calce(partida):
+    vista = VistaPartida(partida, 1)
+    # Primera apuesta: no se abre con Ases teniendo más de un dado
+    assert [pinta for _, pinta in vista.apuestas_validas()] == [2, 3, 4, 5, 6]
+    assert not vista.puede_calzar()
+    partida.apostar(0, (3, 4))
+    assert (4, 4) in vista.apuestas_validas()
+    assert vista.puede_calzar() == partida.arbitro.validar_calzar(partida.cachos, 1, partida.mesa)